@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Memory-per-node benchmark for the flattened menu representations.
+
+Flattens a synthetic parameter-table menu (see :mod:`synthetic_menu`) and
+reports the memory retained per node, measured with ``tracemalloc``:
+
+- ``flatten()``          — ``FlatNode`` objects with their managers;
+- ``flatten_compact()``  — the array-backed ``FlatMenu``.
+
+Run from the project root::
+
+    python benchmarks/bench_memory.py [LEAF_COUNT]
+"""
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic_menu import build_menu  # noqa: E402
+from generate_menu.menu_config import MenuConfig  # noqa: E402
+from generate_menu.menu_flattener import MenuFlattener  # noqa: E402
+
+
+def measure(build) -> tuple:
+    """Returns (result, bytes retained by the result)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main(argv: list[str]) -> int:
+    leaf_count = int(argv[1]) if len(argv) > 1 else 20000
+    config = MenuConfig(str(PROJECT_ROOT / "config" / "config.yaml"))
+    menu = build_menu(leaf_count)
+
+    flat_nodes, nodes_bytes = measure(lambda: MenuFlattener(config).flatten(menu))
+    count = len(flat_nodes)
+    del flat_nodes
+
+    flat_menu, compact_bytes = measure(lambda: MenuFlattener(config).flatten_compact(menu))
+    del flat_menu
+
+    print(f"nodes:            {count}")
+    print(f"flatten():        {nodes_bytes / count:8.1f} bytes/node")
+    print(f"flatten_compact():{compact_bytes / count:8.1f} bytes/node")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Payload interning benchmark.
+
+Flattens a synthetic parameter-table menu (see :mod:`synthetic_menu`) with
+and without payload interning, then touches the managers of every node the
+way the generator does (function and callback infos). Reports the memory
+retained per node, the time taken and the interning statistics.
+
+Run from the project root::
+
+    python benchmarks/bench_payloads.py [LEAF_COUNT]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.bench_memory import measure  # noqa: E402
+from benchmarks.synthetic_menu import build_menu  # noqa: E402
+from generate_menu.menu_config import MenuConfig  # noqa: E402
+from generate_menu.menu_flattener import MenuFlattener  # noqa: E402
+
+
+def flatten_and_touch(flattener: MenuFlattener, menu) -> list:
+    flat_nodes = flattener.flatten(menu)
+    for node in flat_nodes:
+        node.all_function_infos
+        node.defined_callback_infos
+    return flat_nodes
+
+
+def main(argv: list[str]) -> int:
+    leaf_count = int(argv[1]) if len(argv) > 1 else 20000
+    config = MenuConfig(str(PROJECT_ROOT / "config" / "config.yaml"))
+    menu = build_menu(leaf_count)
+
+    for intern_payloads in (False, True):
+        flattener = MenuFlattener(config, intern_payloads=intern_payloads)
+        started = time.perf_counter()
+        flat_nodes, retained = measure(lambda: flatten_and_touch(flattener, menu))
+        elapsed = time.perf_counter() - started
+        count = len(flat_nodes)
+        del flat_nodes
+
+        label = "interned" if intern_payloads else "per node"
+        print(f"{label:9} {retained / count:8.1f} bytes/node  {elapsed:6.2f} s  ({count} nodes)")
+
+    print(f"stats:    {flattener.payload_stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,36 @@
+"""Synthetic menu trees for the benchmarks.
+
+The shape mimics a parameter-table menu: groups of identical numeric leaves
+(``simple``/``factor``/``fixed``) under a two-level branch structure, which
+is the case where per-node overhead dominates.
+"""
+
+from typing import Any, Dict, List
+
+#: Leaf templates cycled through when building the tree.
+LEAF_SHAPES = (
+    {"title": "Duty", "type": "ubyte", "role": "simple", "controls": ["position"],
+     "default": 30, "min": 0, "max": 95, "step": 1},
+    {"title": "Delay", "type": "udword", "role": "factor",
+     "default": 10, "min": 10, "max": 10000, "factors": [1, 10, 100, 1000]},
+    {"title": "On/Off", "type": "string", "role": "fixed", "navigate": "cyclic",
+     "values": ["Off", "On"], "default_idx": 0},
+)
+
+
+def build_menu(leaf_count: int, group_size: int = 50, groups_per_section: int = 20) -> List[Dict[str, Any]]:
+    """Returns a menu tree with ``leaf_count`` leaves grouped into branches."""
+    leaves = [
+        {"id": f"item_{index}", **LEAF_SHAPES[index % len(LEAF_SHAPES)]}
+        for index in range(leaf_count)
+    ]
+    groups = [
+        {"id": f"group_{start // group_size}", "title": "Group",
+         "items": leaves[start:start + group_size]}
+        for start in range(0, leaf_count, group_size)
+    ]
+    return [
+        {"id": f"section_{start // groups_per_section}", "title": "Section",
+         "items": groups[start:start + groups_per_section]}
+        for start in range(0, len(groups), groups_per_section)
+    ]
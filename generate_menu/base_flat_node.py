@@ -1,65 +1,118 @@
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from .menu_config import MenuConfig
 from .menu_data import MenuData
 from .managers.node_data_manager import NodeDataManager
 from .managers.node_control_manager import NodeControlManager
 from .managers.node_navigation_manager import NodeNavigationManager
 from .managers.callback_manager import CallbackManager
+from .frozen import FrozenDict
+from .i18n import _
+from .node_payload import NodePayload, build_callback_managers, has_payload
+
+# A node without payload (a plain branch or the root, see
+# node_payload.PAYLOAD_KEYS) has nothing for its data and callback managers to
+# hold, so it shares these read-only null managers instead of building its own.
+_NULL_DATA_MANAGER = NodeDataManager({}, None)
+_NULL_CALLBACK_MANAGER = CallbackManager({}, None, None, None, None)
+
+
+class FrozenNodeError(AttributeError):
+    """Raised when the links of a frozen (already flattened) node are modified."""
+
 
 class BaseFlatNode:
-    """Base node class - composition of managers for various aspects."""
-    
-    def __init__(self, original_node: Dict[str, Any], config: MenuConfig, menu_data: MenuData):
+    """Base node class - composition of managers for various aspects.
+
+    Managers are created on first access. Nodes without payload share
+    ``_NULL_DATA_MANAGER`` and ``_NULL_CALLBACK_MANAGER``; nodes created with
+    an interned :class:`NodePayload` share the managers of their shape and
+    fill in their own id wherever a manager reports ``node_id``. Shared
+    managers must be treated as read-only.
+    """
+
+    # Slotted: a menu can hold many thousands of nodes.
+    __slots__ = (
+        "_original_node", "_menu_config", "_menu_data", "_payload",
+        "_data_manager", "_callback_manager", "_navigation_manager", "_control_manager",
+        "_navigate", "_controls_config", "_prev_sibling", "_next_sibling", "_sibling_index",
+        "_frozen", "_function_table",
+        "parent", "children", "first_child", "last_child",
+    )
+
+    def __init__(self, original_node: Dict[str, Any], config: MenuConfig, menu_data: MenuData,
+                 payload: Optional[NodePayload] = None):
         self._original_node = original_node
         self._menu_config = config
         self._menu_data = menu_data
-        
-        # Create the data manager
-        self._data_manager = NodeDataManager(original_node, menu_data)
-        
-        # Create the CallbackManager
-        self._callback_manager = CallbackManager(
-            original_node, 
-            self._data_manager.type, 
-            self._data_manager.role, 
-            self._data_manager.category,
-            menu_data
-        )
-        
+        self._payload = payload
+
+        # Managers are created lazily (see the *_manager properties)
+        self._data_manager: Optional[NodeDataManager] = None
+        self._callback_manager: Optional[CallbackManager] = None
+        self._navigation_manager: Optional[NodeNavigationManager] = None
+        self._control_manager: Optional[NodeControlManager] = None
+        self._function_table: Optional[Tuple[Dict[str, Any], ...]] = None
+
         # Basic navigation properties
         self._navigate = original_node.get("navigate", None)
-        
+
         # Control configuration from JSON
         self._controls_config = original_node.get("controls")
 
-        # Create the navigation manager
-        self._navigation_manager = NodeNavigationManager(self)
-
-        # Create the control manager (empty for now, initialized in subclasses)
-        self._control_manager: Optional[NodeControlManager] = None
-
         # Navigation links (initialized later by the MenuFlattener)
         self.parent: Optional["BaseFlatNode"] = None
         self.children: List["BaseFlatNode"] = []
         self.first_child: Optional["BaseFlatNode"] = None
         self.last_child: Optional["BaseFlatNode"] = None
+        self._prev_sibling: Optional["BaseFlatNode"] = None
+        self._next_sibling: Optional["BaseFlatNode"] = None
+        self._sibling_index = 0
+        self._frozen = False
+
+    def _init_callback_managers(self):
+        """Creates (or borrows from the payload) the callback and control managers."""
+        if self._payload is not None:
+            self._callback_manager = self._payload.callback_manager
+            self._control_manager = self._payload.control_manager
+            return
 
-    # Initialize the control manager (called by subclasses)
-    def _init_control_manager(self):
-        """Initializes the control manager."""
-        if self._data_manager.type is None or self._data_manager.role is None:
+        data_manager = self.data_manager
+        if data_manager is _NULL_DATA_MANAGER:
+            self._callback_manager = _NULL_CALLBACK_MANAGER
             return
-            
-        self._control_manager = NodeControlManager(
-            node_id=self.id,
-            node_type=self._data_manager.type,
-            node_role=self._data_manager.role,
-            node_c_type=self._data_manager.c_type,
-            original_node=self._original_node,
-            menu_data=self._menu_data,
-            callback_manager=self._callback_manager,
-            node_navigate=self._navigate
-        )
+
+        self._callback_manager, self._control_manager = build_callback_managers(
+            self._original_node, data_manager, self._menu_data, self.id)
+
+    def _stamped(self, info: Optional[Dict[str, Any]], key: str = "node_id") -> Optional[Dict[str, Any]]:
+        """Fills in the node id of an info reported by a shared payload manager."""
+        if info is None or self._payload is None:
+            return info
+        return {**info, key: self.id}
+
+    def reload_data(self, payload: Optional[NodePayload] = None):
+        """Re-reads the node definition after it was edited in place.
+
+        Drops the lazily built data, callback and control managers so they
+        are rebuilt from the new fields (or taken from the new ``payload``).
+        Links and ``navigate`` are left to the MenuFlattener.
+        """
+        self._payload = payload
+        self._data_manager = None
+        self._callback_manager = None
+        self._control_manager = None
+        self._function_table = None
+        self._controls_config = self._original_node.get("controls")
+
+    @property
+    def payload(self) -> Optional[NodePayload]:
+        """Interned shape record of the node, if any."""
+        return self._payload
+
+    @property
+    def original_node(self) -> Dict[str, Any]:
+        """Source definition of the node (its dict in the menu tree)."""
+        return self._original_node
 
     # Delegate data properties to the NodeDataManager
     @property
@@ -72,193 +125,249 @@ class BaseFlatNode:
 
     @property
     def type(self) -> Optional[str]:
-        return self._data_manager.type
+        return self.data_manager.type
 
     @property
     def role(self) -> Optional[str]:
-        return self._data_manager.role
+        return self.data_manager.role
 
     @property
     def min(self):
-        return self._data_manager.min
+        return self.data_manager.min
 
     @property
     def max(self):
-        return self._data_manager.max
+        return self.data_manager.max
 
     @property
     def default(self):
-        return self._data_manager.default
+        return self.data_manager.default
 
     @property
     def default_idx(self):
-        return self._data_manager.default_idx
+        return self.data_manager.default_idx
 
     @property
     def factors(self):
-        return self._data_manager.factors
+        return self.data_manager.factors
 
     @property
     def values(self):
-        return self._data_manager.values
+        return self.data_manager.values
 
     @property
     def step(self) -> int:
-        return self._data_manager.step
+        return self.data_manager.step
 
     @step.setter
     def step(self, step: int):
+        data_manager = self.data_manager
+        if data_manager is _NULL_DATA_MANAGER or (
+                self._payload is not None and data_manager is self._payload.data_manager):
+            # Never write into a shared manager
+            self._data_manager = NodeDataManager(self._original_node, self._menu_data)
         self._data_manager.step = step
 
     @property
     def c_type(self) -> Optional[str]:
-        return self._data_manager.c_type
+        return self.data_manager.c_type
 
     @property
     def category_name(self) -> Optional[str]:
-        return self._data_manager.category_name
+        return self.data_manager.category_name
 
     @property
     def category(self) -> Optional[Dict[str, Any]]:
-        return self._data_manager.category
+        return self.data_manager.category
 
     @property
     def fixed_count(self) -> Optional[int]:
-        return self._data_manager.fixed_count
+        return self.data_manager.fixed_count
 
     @property
     def values_count(self) -> Optional[int]:
-        return self._data_manager.values_count
+        return self.data_manager.values_count
 
     @property
     def values_default_idx(self) -> Optional[int]:
-        return self._data_manager.values_default_idx
+        return self.data_manager.values_default_idx
 
     @property
     def factors_default_idx(self) -> Optional[int]:
-        return self._data_manager.factors_default_idx
+        return self.data_manager.factors_default_idx
 
     @property
     def c_str_factors(self) -> Optional[str]:
-        return self._data_manager.c_str_factors
+        return self.data_manager.c_str_factors
 
     @property
     def c_str_values(self) -> Optional[str]:
-        return self._data_manager.c_str_values
+        return self.data_manager.c_str_values
 
     # Delegate control properties to the NodeControlManager
     @property
     def controls(self) -> List[Dict]:
-        if self._control_manager is None:
+        control_manager = self.control_manager
+        if control_manager is None:
             return []
-        return self._control_manager.controls
+        return control_manager.controls
 
     @property
     def controls_config(self) -> Optional[List[str]]:
         return self._controls_config
 
+    @property
+    def function_table(self) -> Tuple[Dict[str, Any], ...]:
+        """Read-only handler function infos, built once per node.
+
+        Nodes sharing a payload keep their own table with the ``node_id``
+        filled in. Call :meth:`invalidate_functions` after changing the
+        controls or callbacks in place.
+        """
+        table = self._function_table
+        if table is None:
+            control_manager = self.control_manager
+            if control_manager is None:
+                table = ()
+            elif self._payload is not None:
+                table = tuple(FrozenDict(self._stamped(info)) for info in self._payload.function_infos)
+            else:
+                table = control_manager.function_table
+            self._function_table = table
+        return table
+
+    def invalidate_functions(self):
+        """Drops the memoized function table (the shared payload one is kept)."""
+        self._function_table = None
+        if self._payload is None and self._control_manager is not None:
+            self._control_manager.invalidate_functions()
+
     @property
     def all_function_infos(self) -> List[Dict[str, Any]]:
-        if self._control_manager is None:
-            return []
-        return self._control_manager.all_function_infos
+        return list(self.function_table)
 
     @property
     def detailed_function_infos(self) -> Dict[str, Dict[str, Any]]:
-        if self._control_manager is None:
-            return {}
-        return self._control_manager.detailed_function_infos
+        return {info["name"]: info for info in self.function_table}
 
     # Delegate navigation properties to the NodeNavigationManager
+    # Raw links already hold the cyclic wraparound once flattened, and a
+    # frozen node holds the resolved links, so the navigation manager is only
+    # consulted for an unfrozen node with a missing raw link.
     @property
     def prev_sibling(self) -> Optional['BaseFlatNode']:
-        return self._navigation_manager.effective_prev_sibling
+        prev_sibling = self._prev_sibling
+        if prev_sibling is not None or self._frozen:
+            return prev_sibling
+        return self.navigation_manager.effective_prev_sibling
 
     @property
     def next_sibling(self) -> Optional['BaseFlatNode']:
-        return self._navigation_manager.effective_next_sibling
+        next_sibling = self._next_sibling
+        if next_sibling is not None or self._frozen:
+            return next_sibling
+        return self.navigation_manager.effective_next_sibling
 
     @prev_sibling.setter
     def prev_sibling(self, value: Optional['BaseFlatNode']):
-        self._navigation_manager.prev_sibling = value
+        self._check_not_frozen()
+        self._prev_sibling = value
 
     @next_sibling.setter
     def next_sibling(self, value: Optional['BaseFlatNode']):
-        self._navigation_manager.next_sibling = value
+        self._check_not_frozen()
+        self._next_sibling = value
 
     @property
     def has_cyclic_siblings(self) -> bool:
-        return self._navigation_manager.has_cyclic_siblings
+        return self.navigation_manager.has_cyclic_siblings
 
+    # Sibling position is kept on the node by the children API below, so these
+    # two do not need the navigation manager.
     @property
     def sibling_count(self) -> int:
-        return self._navigation_manager.sibling_count
+        parent = self.parent
+        return len(parent.children) if parent is not None and parent.children else 1
 
     @property
     def sibling_index(self) -> int:
-        return self._navigation_manager.sibling_index
+        return self._sibling_index
 
     @property
     def is_first_child(self) -> bool:
-        return self._navigation_manager.is_first_child
+        return self.navigation_manager.is_first_child
 
     @property
     def is_last_child(self) -> bool:
-        return self._navigation_manager.is_last_child
+        return self.navigation_manager.is_last_child
 
     @property
     def is_only_child(self) -> bool:
-        return self._navigation_manager.is_only_child
+        return self.navigation_manager.is_only_child
 
     # Delegate properties to the CallbackManager
     @property
     def callback_manager(self) -> CallbackManager:
+        if self._callback_manager is None:
+            self._init_callback_managers()
         return self._callback_manager
 
     def get_callback_info(self, callback_type: str) -> Optional[Dict[str, Any]]:
-        return self._callback_manager.get_callback_info(callback_type)
+        return self._stamped(self.callback_manager.get_callback_info(callback_type))
 
     def get_draw_value_info(self) -> Optional[Dict[str, Any]]:
-        return self._callback_manager.get_draw_value_info()
+        return self._stamped(self.callback_manager.get_draw_value_info())
 
     def get_double_click_info(self) -> Optional[Dict[str, Any]]:
-        return self._callback_manager.get_double_click_info()
+        return self._stamped(self.callback_manager.get_double_click_info())
 
     def get_long_click_info(self) -> Optional[Dict[str, Any]]:
-        return self._callback_manager.get_long_click_info()
+        return self._stamped(self.callback_manager.get_long_click_info())
 
     def get_event_info(self) -> Optional[Dict[str, Any]]:
-        return self._callback_manager.get_event_info()
+        return self._stamped(self.callback_manager.get_event_info())
 
     def get_click_info(self) -> Optional[Dict[str, Any]]:
-        return self._callback_manager.get_click_info()
+        return self._stamped(self.callback_manager.get_click_info())
 
     def get_position_info(self) -> Optional[Dict[str, Any]]:
-        return self._callback_manager.get_position_info()
+        return self._stamped(self.callback_manager.get_position_info())
 
     @property
     def all_callback_infos(self) -> Dict[str, Optional[Dict[str, Any]]]:
-        return self._callback_manager.all_callback_infos
+        infos = self.callback_manager.all_callback_infos
+        if self._payload is None:
+            return infos
+        return {cb_type: self._stamped(info) for cb_type, info in infos.items()}
 
     @property
     def defined_callback_infos(self) -> Dict[str, Dict[str, Any]]:
-        return self._callback_manager.defined_callback_infos
+        infos = self.callback_manager.defined_callback_infos
+        if self._payload is None:
+            return infos
+        return {cb_type: self._stamped(info) for cb_type, info in infos.items()}
 
     @property
     def auto_generated_callbacks(self) -> Dict[str, Dict[str, Any]]:
-        return self._callback_manager.auto_generated_callbacks
+        infos = self.callback_manager.auto_generated_callbacks
+        if self._payload is None:
+            return infos
+        return {cb_type: self._stamped(info) for cb_type, info in infos.items()}
 
     @property
     def custom_callbacks(self) -> Dict[str, Dict[str, Any]]:
-        return self._callback_manager.custom_callbacks
+        infos = self.callback_manager.custom_callbacks
+        if self._payload is None:
+            return infos
+        return {cb_type: self._stamped(info) for cb_type, info in infos.items()}
 
     @property
     def custom_callbacks_summary(self) -> Dict[str, Optional[str]]:
-        return self._callback_manager.custom_callbacks_summary
+        return self.callback_manager.custom_callbacks_summary
 
     @property
     def has_custom_callbacks(self) -> bool:
-        return self._callback_manager.has_custom_callbacks
+        return self.callback_manager.has_custom_callbacks
 
     # Basic navigation properties
     @property
@@ -267,7 +376,103 @@ class BaseFlatNode:
 
     @navigate.setter
     def navigate(self, value: str):
+        self._check_not_frozen()
         self._navigate = value
+        if self.children:
+            self._update_cycle()
+
+    # Children API: keeps sibling links, positions and the cyclic closure in sync
+    def set_children(self, children: List["BaseFlatNode"]):
+        """Replaces the children of the node and links them as one sibling group."""
+        self._check_not_frozen()
+        self.children = list(children)
+        self._relink_children()
+
+    def insert_child(self, index: int, child: "BaseFlatNode"):
+        """Inserts a child at the given position (clamped like list.insert)."""
+        self._check_not_frozen()
+        children = self.children
+        index = max(0, min(index if index >= 0 else len(children) + index, len(children)))
+        children.insert(index, child)
+        self._relink_children(index)
+
+    def append_child(self, child: "BaseFlatNode"):
+        """Adds a child after the last one."""
+        self.insert_child(len(self.children), child)
+
+    def remove_child(self, child: "BaseFlatNode") -> int:
+        """Detaches a child and returns the position it had."""
+        self._check_not_frozen()
+        index = child._sibling_index
+        if index >= len(self.children) or self.children[index] is not child:
+            raise ValueError(_("{child} is not a child of {parent}").format(child=child.id, parent=self.id))
+        del self.children[index]
+        child.parent = None
+        child._prev_sibling = None
+        child._next_sibling = None
+        child._sibling_index = 0
+        self._relink_children(index)
+        return index
+
+    def _relink_children(self, start: int = 0):
+        """Relinks the children from position ``start`` on (its left neighbour included)."""
+        children = self.children
+        count = len(children)
+        for index in range(max(start - 1, 0), count):
+            child = children[index]
+            child.parent = self
+            child._sibling_index = index
+            child._prev_sibling = children[index - 1] if index > 0 else None
+            child._next_sibling = children[index + 1] if index + 1 < count else None
+        self.first_child = children[0] if children else None
+        self.last_child = children[-1] if children else None
+        self._update_cycle()
+
+    # Freezing: done by MenuFlattener once the graph is complete
+    @property
+    def frozen(self) -> bool:
+        """Whether the links of the node are frozen."""
+        return self._frozen
+
+    def freeze(self):
+        """Resolves the effective sibling links into plain fields and locks them.
+
+        Children and siblings must be complete: the links are read as they
+        are now and never recomputed afterwards.
+        """
+        if self._frozen:
+            return
+        # A throwaway manager, so freezing does not leave one on every node
+        navigation = self._navigation_manager or NodeNavigationManager(self)
+        self._prev_sibling = navigation.effective_prev_sibling
+        self._next_sibling = navigation.effective_next_sibling
+        self._frozen = True
+
+    def thaw(self):
+        """Unlocks the links for editing; call freeze() again when done."""
+        self._frozen = False
+
+    def drop_links(self):
+        """Forgets the parent, children and siblings (a streamed node that was consumed)."""
+        self.parent = None
+        self.children = []
+        self.first_child = None
+        self.last_child = None
+        self._prev_sibling = None
+        self._next_sibling = None
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise FrozenNodeError(_("Node {id} is frozen, its links cannot be changed").format(id=self.id))
+
+    def _update_cycle(self):
+        """Closes (or opens) the first<->last links according to ``navigate``."""
+        children = self.children
+        if len(children) < 2:
+            return
+        cyclic = self._navigate == "cyclic"
+        children[0]._prev_sibling = children[-1] if cyclic else None
+        children[-1]._next_sibling = children[0] if cyclic else None
 
     # Basic tree structure properties
     @property
@@ -283,59 +488,78 @@ class BaseFlatNode:
     # Methods for accessing the managers
     @property
     def data_manager(self) -> NodeDataManager:
-        """Access to the data manager."""
-        return self._data_manager
+        """Access to the data manager (created on first access)."""
+        manager = self._data_manager
+        if manager is None:
+            if self._payload is not None:
+                manager = self._payload.data_manager
+            elif not has_payload(self._original_node):
+                manager = _NULL_DATA_MANAGER
+            else:
+                manager = NodeDataManager(self._original_node, self._menu_data)
+            self._data_manager = manager
+        return manager
 
     @property
     def control_manager(self) -> Optional[NodeControlManager]:
-        """Access to the control manager."""
+        """Access to the control manager (``None`` for untyped nodes)."""
+        if self._callback_manager is None:
+            self._init_callback_managers()
         return self._control_manager
 
     @property
     def navigation_manager(self) -> NodeNavigationManager:
-        """Access to the navigation manager."""
+        """Access to the navigation manager (created on first access)."""
+        if self._navigation_manager is None:
+            self._navigation_manager = NodeNavigationManager(self)
         return self._navigation_manager
 
     def validate_data(self) -> List[str]:
         """Validates node data."""
         errors = []
-        errors.extend(self._data_manager.validate_numeric_range())
-        errors.extend(self._data_manager.validate_fixed_values())
+        errors.extend(self.data_manager.validate_numeric_range())
+        errors.extend(self.data_manager.validate_fixed_values())
         return errors
 
     def validate_required_functions(self) -> List[Dict[str, str]]:
         """Checks that all required functions are generated."""
-        if self._control_manager is None:
+        control_manager = self.control_manager
+        if control_manager is None:
             return []
-        return self._control_manager.validate_required_functions()
+        return [self._stamped(missing, "node") for missing in control_manager.validate_required_functions()]
 
     def get_data_summary(self) -> Dict[str, Any]:
         """Node data summary."""
-        return self._data_manager.get_data_summary()
+        summary = self.data_manager.get_data_summary()
+        # The shared null manager does not know which node it serves
+        summary["id"] = self.id
+        return summary
 
     def get_control_summary(self) -> Dict[str, Any]:
         """Control summary."""
-        if self._control_manager is None:
+        control_manager = self.control_manager
+        if control_manager is None:
             return {
                 "node_id": self.id,
                 "type": self.type,
                 "role": self.role,
                 "has_control_manager": False
             }
-        return self._control_manager.get_control_summary()
+        return self._stamped(control_manager.get_control_summary())
 
     def get_navigation_info(self) -> Dict[str, Any]:
         """Node navigation information."""
-        return self._navigation_manager.get_navigation_info()
+        return self.navigation_manager.get_navigation_info()
 
     def print_control_info(self):
         """Prints control information."""
-        if self._control_manager is not None:
-            self._control_manager.print_control_info()
+        control_manager = self.control_manager
+        if control_manager is not None:
+            control_manager.print_control_info(self.id)
 
     def print_navigation_debug(self):
         """Prints debug navigation information."""
-        self._navigation_manager.print_navigation_debug()
+        self.navigation_manager.print_navigation_debug()
 
     # Basic utilities for debugging
     def __repr__(self):
@@ -355,8 +579,8 @@ class BaseFlatNode:
                     tree_flag = "✨"
         
         controls_str = ""
-        if self._control_manager and self._control_manager.controls:
-            controls_str = " [" + ", ".join([c["type"].value for c in self._control_manager.controls]) + "]"
+        if self.controls:
+            controls_str = " [" + ", ".join([c["type"].value for c in self.controls]) + "]"
         
         config_info = ""
         if self._controls_config:
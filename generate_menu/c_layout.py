@@ -0,0 +1,178 @@
+"""Storage types of the generated ids and sizes of the generated tables.
+
+``menu_id_t`` and ``menu_category_t`` used to be plain enums, which most
+ABIs store as ``int``. The enum constants stay, but each typedef now names
+the narrowest unsigned type that holds its ``*_COUNT`` value (the "no
+link" id), so every table row and struct that stores ids shrinks.
+
+:func:`table_sizes` estimates the generated tables for a 32-bit target
+(4-byte enums and pointers, natural alignment) with the enum and with the
+compact types, which gives the flash and RAM saved.
+"""
+
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+#: Candidate storage types, narrowest first: ``(C type, size in bytes)``.
+UNSIGNED_TYPES = (("uint8_t", 1), ("uint16_t", 2), ("uint32_t", 4))
+
+#: Enum and pointer size of the target the estimate assumes (Cortex-M, ESP32...).
+ENUM_SIZE = 4
+POINTER_SIZE = 4
+
+#: Length of the draw buffers of ``menu_context_t`` (``LCD_STRING_LEN`` of ``type.h.jinja``).
+LCD_STRING_LEN = 0x20
+
+#: Sizes of the scalar C types of the menu data; pointers take :data:`POINTER_SIZE`.
+_SCALAR_SIZES = {
+    "bool": 1, "int8_t": 1, "uint8_t": 1, "int16_t": 2, "uint16_t": 2,
+    "int32_t": 4, "uint32_t": 4, "float": 4, "int64_t": 8, "uint64_t": 8, "double": 8,
+}
+
+Field = Tuple[int, int]
+"""``(size, alignment)`` of a struct member."""
+
+
+def storage_type(count: int) -> Tuple[str, int]:
+    """Narrowest unsigned C type (and its size) that holds the values ``0..count``."""
+    for name, size in UNSIGNED_TYPES:
+        if count < 1 << (8 * size):
+            return name, size
+    raise ValueError(f"{count} does not fit in {UNSIGNED_TYPES[-1][0]}")
+
+
+class IdTypes:
+    """Storage types of ``menu_id_t``, ``menu_category_t`` and ``menu_str_t`` for one menu.
+
+    ``id_count`` and ``category_count`` are the ``MENU_ID_COUNT`` and
+    ``MENU_CATEGORY_COUNT`` values, ``string_pool_size`` the bytes of the
+    string pool that ``menu_str_t`` offsets address.
+    """
+
+    __slots__ = ("id", "id_size", "category", "category_size", "string", "string_size")
+
+    def __init__(self, id_count: int, category_count: int, string_pool_size: int = 0):
+        self.id, self.id_size = storage_type(id_count)
+        self.category, self.category_size = storage_type(category_count)
+        self.string, self.string_size = storage_type(string_pool_size)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IdTypes):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"IdTypes(menu_id_t={self.id}, menu_category_t={self.category})"
+
+
+class TableSize:
+    """Estimated size of one generated table with enum and with compact ids."""
+
+    __slots__ = ("name", "memory", "entries", "enum_size", "compact_size")
+
+    def __init__(self, name: str, memory: str, entries: int, enum_size: int, compact_size: int):
+        self.name = name
+        self.memory = memory
+        self.entries = entries
+        self.enum_size = enum_size
+        self.compact_size = compact_size
+
+    @property
+    def saved(self) -> int:
+        return self.enum_size - self.compact_size
+
+    def __repr__(self):
+        return f"TableSize({self.name}[{self.entries}] {self.memory}: {self.enum_size} -> {self.compact_size})"
+
+
+def _align(offset: int, alignment: int) -> int:
+    return -(-offset // alignment) * alignment
+
+
+def struct_field(fields: Sequence[Field]) -> Field:
+    """Layout of a struct of ``fields`` with natural alignment (empty structs take 0 bytes, as in GNU C)."""
+    offset, alignment = 0, 1
+    for size, field_alignment in fields:
+        offset = _align(offset, field_alignment) + size
+        alignment = max(alignment, field_alignment)
+    return _align(offset, alignment), alignment
+
+
+def union_field(members: Sequence[Field]) -> Field:
+    """Layout of a union of ``members``."""
+    alignment = max((member[1] for member in members), default=1)
+    return _align(max((member[0] for member in members), default=0), alignment), alignment
+
+
+def c_type_field(c_type: str) -> Field:
+    """Layout of a value of ``c_type`` (unknown scalars count as 4 bytes)."""
+    if "*" in c_type:
+        return POINTER_SIZE, POINTER_SIZE
+    size = _SCALAR_SIZES.get(c_type.replace("const", "").strip(), 4)
+    return size, size
+
+
+def _category_fields(categories: Mapping[str, Dict[str, Any]]) -> Tuple[Field, Field]:
+    """Layouts of the ``data`` unions of ``menu_node_config_t`` and ``menu_node_value_t``."""
+    byte, pointer = c_type_field("uint8_t"), c_type_field("void*")
+    configs, values = [], []
+    for category in categories.values():
+        value = c_type_field(category.get("c_type") or "void*")
+        role = category.get("role")
+        if role == "simple":
+            config, data = [value] * 4, [value]
+        elif role == "factor":
+            config, data = [value] * 4 + [byte, byte, pointer], [byte, value]
+        elif role == "fixed":
+            config, data = [byte, byte, pointer], [byte]
+        else:
+            config, data = [], [pointer]
+        if category.get("type") != "callback":
+            configs.append(struct_field(config))
+        values.append(struct_field(data))
+    return union_field(configs), union_field(values)
+
+
+def table_sizes(id_types: IdTypes, records: Mapping[str, Any], leaf_records: Mapping[str, Any],
+                categories: Mapping[str, Dict[str, Any]], node_names: bool) -> List[TableSize]:
+    """Estimated sizes of the id-indexed tables and the context, with enum and with compact ids.
+
+    The tables are indexed by ``menu_id_t``, so the leaf tables run up to the
+    last leaf id.
+    """
+    position = {node_id: index for index, node_id in enumerate(records, start=1)}
+    node_entries = len(records) + 1
+    leaf_entries = max((position[leaf_id] for leaf_id in leaf_records), default=-1) + 1
+    config_data, value_data = _category_fields(categories)
+    pointer = c_type_field("void*")
+    string = (id_types.string_size, id_types.string_size)
+
+    def rows(compact: bool) -> List[Tuple[str, str, int, Field]]:
+        node_id = (id_types.id_size,) * 2 if compact else (ENUM_SIZE, ENUM_SIZE)
+        category = (id_types.category_size,) * 2 if compact else (ENUM_SIZE, ENUM_SIZE)
+        # The compact node row also puts the title first and stores the tree type in a byte;
+        # then come the children's slice of s_menu_siblings, the position and the cyclic flag
+        siblings = [*[node_id] * 3, (1, 1)]
+        node = ([string, *[node_id] * 5, (1, 1), *siblings] if compact
+                else [*[node_id] * 5, string, (ENUM_SIZE, ENUM_SIZE), *siblings])
+        tables = [
+            ("s_menu_tree", "flash", node_entries, struct_field(node)),
+            ("s_menu_siblings", "flash", len(records), node_id),
+            ("s_menu_config", "flash", leaf_entries,
+             struct_field([node_id, category, *[pointer] * 6, config_data])),
+            ("s_menu_values", "RAM", leaf_entries, struct_field([node_id, value_data])),
+        ]
+        if node_names:
+            tables.append(("s_menu_id_names", "flash", node_entries,
+                           struct_field([node_id, string])))
+        # The compact context also puts the state first, ahead of the two ids
+        state = (ENUM_SIZE, ENUM_SIZE)
+        head = [state, node_id, node_id] if compact else [node_id, node_id, state]
+        tables.append(("menu_context_t", "RAM", 1, struct_field(
+            [*head, (1, 1), (1, 1), *[pointer] * 4, (LCD_STRING_LEN, 1), (LCD_STRING_LEN, 1)])))
+        return tables
+
+    return [TableSize(name, memory, entries, entries * enum_row[0], entries * compact_row[0])
+            for (name, memory, entries, enum_row), (_name, _memory, _entries, compact_row)
+            in zip(rows(False), rows(True))]
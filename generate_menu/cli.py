@@ -28,6 +28,9 @@ logger = logging.getLogger(__name__)
 #: Default main configuration file, resolved relative to the project root.
 DEFAULT_CONFIG = "config/config.yaml"
 
+#: Diff lines shown per out-of-date file in ``--check`` mode.
+CHECK_DIFF_LINES = 20
+
 
 def build_parser() -> argparse.ArgumentParser:
     """Builds the command-line argument parser."""
@@ -55,11 +58,28 @@ def build_parser() -> argparse.ArgumentParser:
             "but skip C-code generation."
         ),
     )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=_(
+            "Render in memory and compare with the generated files in the "
+            "output directory without writing anything; exit with 1 and "
+            "print a diff when they differ."
+        ),
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
         help=_("Enable DEBUG logging and detailed summaries."),
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=_(
+            "Print the render time of every template and the context keys "
+            "and node attributes it used, and the hottest includes and loops."
+        ),
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -110,7 +130,25 @@ def _setup_logging(level: int) -> None:
         root.addHandler(handler)
 
 
-def _run(config_path: str, flat_only: bool, debug: bool) -> int:
+def _report_differences(differences: dict[str, list[str]]) -> None:
+    """Logs the outputs that are out of date, with a shortened unified diff of each."""
+    logger.error("❌ " + _("{count} generated files are out of date:").format(count=len(differences)))
+    for path, diff in differences.items():
+        logger.error("  " + path)
+        for line in diff[:CHECK_DIFF_LINES]:
+            logger.error("    " + line.rstrip("\n"))
+        if len(diff) > CHECK_DIFF_LINES:
+            logger.error("    " + _("... {count} more diff lines").format(count=len(diff) - CHECK_DIFF_LINES))
+
+
+def _report_errors(errors: dict[str, str]) -> None:
+    """Logs the outputs whose templates failed to render."""
+    logger.error("❌ " + _("{count} generated files failed to render:").format(count=len(errors)))
+    for path, message in errors.items():
+        logger.error(f"  {path}: {message}")
+
+
+def _run(config_path: str, flat_only: bool, debug: bool, profile: bool = False, check: bool = False) -> int:
     """Runs the pipeline: load → validate → flatten → generate → save JSON."""
     from .common import save_json_data
     from .menu_generator import MenuGenerator
@@ -121,6 +159,18 @@ def _run(config_path: str, flat_only: bool, debug: bool) -> int:
     if not processor.validate_required_functions():
         return 1
 
+    if check:
+        # Nothing is written: the outputs are only compared with the files on disk
+        generator = MenuGenerator(config_path, processor=processor, profile=profile, check=True)
+        if generator.errors:
+            _report_errors(generator.errors)
+        if generator.differences:
+            _report_differences(generator.differences)
+        if generator.errors or generator.differences:
+            return 1
+        logger.info("✅ " + _("Generated files are up to date"))
+        return 0
+
     # Debug artifacts: the flattened menu and the functions summary.
     processor.save_flattern_json()
     save_json_data(processor.functions, "output/functions.json")
@@ -130,7 +180,10 @@ def _run(config_path: str, flat_only: bool, debug: bool) -> int:
         return 0
 
     # Constructing the generator renders all C sources.
-    MenuGenerator(config_path, processor=processor)
+    generator = MenuGenerator(config_path, processor=processor, profile=profile)
+    if generator.errors:
+        _report_errors(generator.errors)
+        return 1
 
     if debug:
         processor.print_detailed_function_summary()
@@ -158,7 +211,7 @@ def main(argv: list[str] | None = None) -> int:
     config_path = args.config or DEFAULT_CONFIG
 
     try:
-        return _run(config_path, args.flat_only, args.debug)
+        return _run(config_path, args.flat_only, args.debug, args.profile, args.check)
     except Exception as e:
         logger.error("❌ " + _("Error: {error}").format(error=e))
         if args.debug:
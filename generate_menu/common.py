@@ -1,8 +1,12 @@
+import difflib
+import hashlib
 import json
 import logging
 import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import Dict, Set, List, Optional, Any, Union
+from typing import Dict, Iterable, Set, List, Optional, Any, Union
 
 from .i18n import _
 
@@ -114,3 +118,96 @@ def save_json_data(data: Union[Dict, Set], output_path: str = None) -> bool:
     except Exception as e:
         logger.error(f"❌ {_('File save error: {error}').format(error=e)}")
         return False
+
+
+#: Text collected before it is encoded, hashed and written (see ``write_if_changed``).
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def file_digest(path: Union[str, Path]) -> Optional[bytes]:
+    """SHA-256 of a file read in blocks, ``None`` if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(WRITE_BUFFER_SIZE), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.digest()
+
+
+def _file_mode(path: Union[str, Path]) -> int:
+    """Permission bits for writing ``path``: those of the existing file, else ``0o666`` less the umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_if_changed(chunks: Iterable[str], output_path: Union[str, Path]) -> bool:
+    """Writes text chunks to a file unless it already has that content.
+
+    The chunks are buffered, hashed and written to a temporary file next to
+    ``output_path`` as they arrive, so the content is never held in memory
+    as a whole. The temporary file replaces the output only when its hash
+    differs from the existing file's; an unchanged output keeps its
+    modification time. The output keeps the permissions of the file it
+    replaces, and a new one gets those of ``open()``.
+
+    Returns:
+        ``True`` if the file was written.
+    """
+    directory = os.path.dirname(output_path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    digest = hashlib.sha256()
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            buffer: List[str] = []
+            size = 0
+            for chunk in chunks:
+                buffer.append(chunk)
+                size += len(chunk)
+                if size >= WRITE_BUFFER_SIZE:
+                    data = "".join(buffer).encode("utf-8")
+                    digest.update(data)
+                    f.write(data)
+                    buffer.clear()
+                    size = 0
+            data = "".join(buffer).encode("utf-8")
+            digest.update(data)
+            f.write(data)
+
+        if file_digest(output_path) == digest.digest():
+            os.remove(temp_path)
+            return False
+        # mkstemp() creates the file owner-only
+        os.chmod(temp_path, _file_mode(output_path))
+        os.replace(temp_path, output_path)
+        return True
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def diff_with_file(text: Optional[str], path: Union[str, Path]) -> List[str]:
+    """Unified diff turning the file at ``path`` into ``text``.
+
+    ``text=None`` means the file should not exist. A missing file is diffed
+    from ``/dev/null``. Returns no lines when the file already matches.
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+            current: Optional[str] = f.read()
+    except FileNotFoundError:
+        current = None
+    if current == text:
+        return []
+    return list(difflib.unified_diff(
+        (current or "").splitlines(keepends=True), (text or "").splitlines(keepends=True),
+        fromfile=str(path) if current is not None else "/dev/null",
+        tofile=str(path) if text is not None else "/dev/null"))
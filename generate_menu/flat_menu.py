@@ -0,0 +1,250 @@
+"""Compact, array-backed representation of a flattened menu.
+
+:class:`FlatMenu` is an alternative to the list of :class:`FlatNode` objects
+produced by :meth:`MenuFlattener.flatten`. Every node is a row addressed by an
+integer index, and the tree links are stored column-wise in ``array`` objects
+(struct-of-arrays) instead of object references. Node ids, titles and
+navigation modes live in a shared :class:`StringTable`, so repeated strings
+are stored once.
+
+Rows are laid out in the same depth-first pre-order as ``flatten()``, row 0
+being the virtual root node. :class:`FlatMenuNode` is a lightweight view over
+one row for consumers that prefer attribute access; templates can also
+iterate the columns directly.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional
+
+#: Index stored in a link column when the link is absent.
+NO_NODE = -1
+
+
+class StringTable:
+    """Interned string storage addressed by integer indexes."""
+
+    __slots__ = ("_strings", "_index")
+
+    def __init__(self):
+        self._strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        """Returns the index of ``value``, adding it on first use."""
+        if value is None:
+            return NO_NODE
+        index = self._index.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(value)
+            self._index[value] = index
+        return index
+
+    def get(self, index: int) -> Optional[str]:
+        """Returns the string at ``index`` or ``None`` for ``NO_NODE``."""
+        if index == NO_NODE:
+            return None
+        return self._strings[index]
+
+    def __getitem__(self, index: int) -> str:
+        return self._strings[index]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._strings)
+
+
+class FlatMenu:
+    """Struct-of-arrays menu: one row per node, one ``array`` per column.
+
+    Columns (all ``array('i')`` of length :attr:`size`):
+
+    - ``ids``, ``titles``, ``navigates`` — indexes into :attr:`strings`;
+    - ``parent``, ``first_child``, ``last_child``, ``prev``, ``next`` — row
+      indexes of the linked nodes or ``NO_NODE``;
+    - ``depth`` — nesting level (0 for the root).
+
+    ``prev``/``next`` already contain the cyclic wraparound for children of
+    parents with ``navigate == "cyclic"``.
+    """
+
+    def __init__(self, size: int):
+        self.strings = StringTable()
+        empty = array("i", [NO_NODE]) * size
+        self.ids = array("i", empty)
+        self.titles = array("i", empty)
+        self.navigates = array("i", empty)
+        self.parent = array("i", empty)
+        self.first_child = array("i", empty)
+        self.last_child = array("i", empty)
+        self.prev = array("i", empty)
+        self.next = array("i", empty)
+        self.depth = array("i", [0]) * size
+        self._size = 0
+        self._rows: Optional[Dict[str, int]] = None
+
+    # -- building -------------------------------------------------------------
+    def add_node(self, node_id: str, title: str, navigate: Optional[str],
+                 parent: int = NO_NODE) -> int:
+        """Appends a row and links it after the last child of ``parent``."""
+        row = self._size
+        self._size += 1
+
+        self.ids[row] = self.strings.intern(node_id)
+        self.titles[row] = self.strings.intern(title)
+        self.navigates[row] = self.strings.intern(navigate)
+
+        if parent != NO_NODE:
+            self.parent[row] = parent
+            self.depth[row] = self.depth[parent] + 1
+            prev = self.last_child[parent]
+            if prev == NO_NODE:
+                self.first_child[parent] = row
+            else:
+                self.next[prev] = row
+                self.prev[row] = prev
+            self.last_child[parent] = row
+
+        if self._rows is not None:
+            self._rows[node_id] = row
+        return row
+
+    def close_cycle(self, parent: int):
+        """Links the first and the last child of ``parent`` to each other."""
+        first = self.first_child[parent]
+        last = self.last_child[parent]
+        if first != last:
+            self.prev[first] = last
+            self.next[last] = first
+
+    # -- access ---------------------------------------------------------------
+    @property
+    def size(self) -> int:
+        """Number of rows, including the root."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the column buffers (strings not included)."""
+        columns = (self.ids, self.titles, self.navigates, self.parent, self.first_child,
+                   self.last_child, self.prev, self.next, self.depth)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def row_of(self, node_id: str) -> int:
+        """Returns the row of a node id or ``NO_NODE``."""
+        if self._rows is None:
+            # Built on first lookup only; plain iteration never needs it.
+            self._rows = {self.strings[self.ids[row]]: row for row in range(self._size)}
+        return self._rows.get(node_id, NO_NODE)
+
+    def node(self, node_id: str) -> Optional["FlatMenuNode"]:
+        """Returns a view over the row of ``node_id`` or ``None``."""
+        row = self.row_of(node_id)
+        if row == NO_NODE:
+            return None
+        return FlatMenuNode(self, row)
+
+    @property
+    def root(self) -> "FlatMenuNode":
+        return FlatMenuNode(self, 0)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, row: int) -> "FlatMenuNode":
+        if not 0 <= row < self._size:
+            raise IndexError(row)
+        return FlatMenuNode(self, row)
+
+    def __iter__(self) -> Iterator["FlatMenuNode"]:
+        for row in range(self._size):
+            yield FlatMenuNode(self, row)
+
+
+class FlatMenuNode:
+    """Lightweight read-only view over one row of a :class:`FlatMenu`."""
+
+    __slots__ = ("_menu", "_row")
+
+    def __init__(self, menu: FlatMenu, row: int):
+        self._menu = menu
+        self._row = row
+
+    def _view(self, row: int) -> Optional["FlatMenuNode"]:
+        if row == NO_NODE:
+            return None
+        return FlatMenuNode(self._menu, row)
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    @property
+    def id(self) -> str:
+        return self._menu.strings[self._menu.ids[self._row]]
+
+    @property
+    def name(self) -> str:
+        return self._menu.strings[self._menu.titles[self._row]]
+
+    @property
+    def navigate(self) -> Optional[str]:
+        return self._menu.strings.get(self._menu.navigates[self._row])
+
+    @property
+    def depth(self) -> int:
+        return self._menu.depth[self._row]
+
+    @property
+    def parent(self) -> Optional["FlatMenuNode"]:
+        return self._view(self._menu.parent[self._row])
+
+    @property
+    def first_child(self) -> Optional["FlatMenuNode"]:
+        return self._view(self._menu.first_child[self._row])
+
+    @property
+    def last_child(self) -> Optional["FlatMenuNode"]:
+        return self._view(self._menu.last_child[self._row])
+
+    @property
+    def prev_sibling(self) -> Optional["FlatMenuNode"]:
+        return self._view(self._menu.prev[self._row])
+
+    @property
+    def next_sibling(self) -> Optional["FlatMenuNode"]:
+        return self._view(self._menu.next[self._row])
+
+    @property
+    def children(self) -> List["FlatMenuNode"]:
+        """Child views in order (walks the sibling chain once)."""
+        menu = self._menu
+        row = menu.first_child[self._row]
+        last = menu.last_child[self._row]
+        children = []
+        while row != NO_NODE:
+            children.append(FlatMenuNode(menu, row))
+            if row == last:
+                break
+            row = menu.next[row]
+        return children
+
+    @property
+    def is_leaf(self) -> bool:
+        return self._menu.first_child[self._row] == NO_NODE
+
+    @property
+    def is_branch(self) -> bool:
+        return self._menu.first_child[self._row] != NO_NODE
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, FlatMenuNode) and other._menu is self._menu
+                and other._row == self._row)
+
+    def __hash__(self) -> int:
+        return hash((id(self._menu), self._row))
+
+    def __repr__(self):
+        return f"FlatMenuNode({self.id}, row={self._row})"
@@ -1,17 +1,10 @@
-from typing import Dict, List, Optional, Set, Any
+from typing import Optional
 from .base_flat_node import BaseFlatNode
-from .menu_config import MenuConfig
-from .menu_data import MenuData
 
 class FlatNode(BaseFlatNode):
     """Final node class - uses the manager composition from BaseFlatNode."""
-    
-    def __init__(self, original_node: Dict[str, Any], config: MenuConfig, menu_data: MenuData):
-        # Use inheritance from BaseFlatNode
-        super().__init__(original_node, config, menu_data)
-        
-        # Initialize the control manager
-        self._init_control_manager()
+
+    __slots__ = ()
 
     # Keep only backward-compatible properties for temporary support
     @property
@@ -0,0 +1,49 @@
+"""Read-only containers for data shared between consumers.
+
+Aggregated menu data is built once and then read by every template, summary
+and (possibly parallel) render. :class:`FrozenDict` and :func:`freeze` make
+those results immutable, so one snapshot can be shared by reference across
+threads, batch variants or a long-running process without defensive copies.
+
+``FrozenDict`` subclasses ``dict`` on purpose: ``json.dump``, Jinja2 and
+``{**info}`` keep working unchanged, and it pickles as a plain mapping.
+"""
+
+from typing import Any, Dict, Optional
+
+
+class FrozenDict(dict):
+    """A ``dict`` that rejects every in-place modification."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+def freeze(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """Returns a deeply read-only version of ``value``.
+
+    Dicts become :class:`FrozenDict` and lists become tuples; other objects
+    (nodes, enums, strings) are kept as they are. A ``FrozenDict`` is assumed
+    to be frozen already. Containers reachable several times are converted
+    once when the same ``memo`` is passed, so shared infos stay shared.
+    """
+    if isinstance(value, FrozenDict) or not isinstance(value, (dict, list, tuple)):
+        return value
+    if memo is None:
+        memo = {}
+    frozen = memo.get(id(value))
+    if frozen is None:
+        if isinstance(value, dict):
+            frozen = FrozenDict((key, freeze(item, memo)) for key, item in value.items())
+        else:
+            frozen = tuple(freeze(item, memo) for item in value)
+        memo[id(value)] = frozen
+    return frozen
@@ -8,7 +8,13 @@ logger = logging.getLogger(__name__)
 
 class CallbackManager:
     """Manager for handling callback functions of a menu node."""
-    
+
+    __slots__ = (
+        "_original_node", "_node_type", "_node_role", "_node_category", "_menu_data",
+        "click_cb", "position_cb", "double_click_cb", "long_click_cb", "event_cb", "draw_value_cb",
+        "_auto_click_function", "_auto_position_function", "_auto_click_info", "_auto_position_info",
+    )
+
     ALL_CALLBACK_TYPES = [
         'click_cb', 'position_cb', 'double_click_cb', 
         'long_click_cb', 'event_cb', 'draw_value_cb'
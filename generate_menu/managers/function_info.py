@@ -1,9 +1,9 @@
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from ..menu_data import MenuData, ControlType
 from .callback_manager import CallbackManager
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """Dataclass for storing function information."""
     name: str
@@ -52,6 +52,10 @@ class FunctionInfo:
             category=category or f"{node_type}_{node_role}"
         )
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict of the fields; a cheap ``asdict`` (all fields are scalars)."""
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
     @staticmethod
     def _extract_category(cb_info: Dict[str, Any]) -> Optional[str]:
         """Safely extracts the category."""
@@ -60,3 +64,5 @@ class FunctionInfo:
         category_data = cb_info["category"]
         return category_data.get("name") if isinstance(category_data, dict) else category_data
 
+
+_FIELD_NAMES = tuple(field.name for field in fields(FunctionInfo))
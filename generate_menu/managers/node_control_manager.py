@@ -1,7 +1,7 @@
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import asdict
+from typing import Dict, List, Optional, Any, Tuple
 
+from ..frozen import FrozenDict
 from ..i18n import _
 from ..menu_data import MenuData, ControlType
 from .callback_manager import CallbackManager
@@ -11,7 +11,13 @@ logger = logging.getLogger(__name__)
 
 class NodeControlManager:
     """Manager for node controls and automatic function generation."""
-    
+
+    __slots__ = (
+        "_node_id", "_node_type", "_node_role", "_node_c_type", "_original_node",
+        "_menu_data", "_callback_manager", "_node_navigate", "_controls_config", "_controls",
+        "_function_table",
+    )
+
     def __init__(self, node_id: str, node_type: str, node_role: str, node_c_type: str, 
                  original_node: Dict[str, Any], menu_data: MenuData, 
                  callback_manager: CallbackManager, node_navigate: Optional[str] = None):
@@ -27,6 +33,7 @@ class NodeControlManager:
         # Control configuration from JSON
         self._controls_config = original_node.get("controls")
         self._controls = []
+        self._function_table: Optional[Tuple[Dict[str, Any], ...]] = None
         
         # Initialize controls
         self._init_controls()
@@ -137,9 +144,24 @@ class NodeControlManager:
 
     # Properties for accessing functions
     @property
-    def all_function_infos(self) -> List[Dict[str, Any]]:
-        """All possible handler functions for this node with full information."""
+    def function_table(self) -> Tuple[Dict[str, Any], ...]:
+        """Handler functions of the node, built once and shared by all readers.
+
+        The controls and callbacks are resolved in ``__init__``, so the table
+        is computed on first access and kept until :meth:`invalidate_functions`.
+        The infos are read-only ``FrozenDict`` records.
+        """
+        if self._function_table is None:
+            self._function_table = self._build_function_table()
+        return self._function_table
+
+    def invalidate_functions(self):
+        """Drops the function table after the node controls or callbacks changed."""
+        self._function_table = None
+
+    def _build_function_table(self) -> Tuple[Dict[str, Any], ...]:
         infos = []
+        names = set()
         
         # Automatic functions via dataclass
         for auto_func in self._callback_manager.auto_functions_info:
@@ -148,25 +170,31 @@ class NodeControlManager:
                 auto_func["name"], auto_func["event_type"], 
                 auto_func["navigate"], auto_func["purpose"]
             )
-            infos.append(asdict(function_info))
+            infos.append(FrozenDict(function_info.to_dict()))
+            names.add(function_info.name)
         
         # Custom functions via dataclass
         for cb_type, cb_info in self._callback_manager.defined_callback_infos.items():
-            if cb_info and cb_info["custom"]:
-                # Check whether it duplicates automatic functions
-                if not any(info["name"] == cb_info["name"] for info in infos):
-                    function_info = FunctionInfo.create_custom(
-                        self._node_id, self._node_type, self._node_role, self._node_c_type,
-                        cb_info
-                    )
-                    infos.append(asdict(function_info))
+            # Skip custom callbacks that duplicate automatic functions
+            if cb_info and cb_info["custom"] and cb_info["name"] not in names:
+                function_info = FunctionInfo.create_custom(
+                    self._node_id, self._node_type, self._node_role, self._node_c_type,
+                    cb_info
+                )
+                infos.append(FrozenDict(function_info.to_dict()))
+                names.add(function_info.name)
         
-        return infos
+        return tuple(infos)
+
+    @property
+    def all_function_infos(self) -> List[Dict[str, Any]]:
+        """All possible handler functions for this node with full information."""
+        return list(self.function_table)
 
     @property
     def detailed_function_infos(self) -> Dict[str, Dict[str, Any]]:
         """Detailed information about all functions, grouped by name."""
-        return {info["name"]: info for info in self.all_function_infos}
+        return {info["name"]: info for info in self.function_table}
 
     # Methods for checking required functions
     def validate_required_functions(self) -> List[Dict[str, str]]:
@@ -209,15 +237,19 @@ class NodeControlManager:
             ],
             "has_required_controls": self.has_required_controls,
             "required_controls_count": len(self.required_controls),
-            "all_functions_count": len(self.all_function_infos),
+            "all_functions_count": len(self.function_table),
             "auto_click_function": self._callback_manager._auto_click_function,
             "auto_position_function": self._callback_manager._auto_position_function
         }
 
-    def print_control_info(self):
-        """Prints control information for debugging."""
+    def print_control_info(self, node_id: Optional[str] = None):
+        """Prints control information for debugging.
+
+        ``node_id`` names the node when the manager is shared by several nodes.
+        """
         summary = self.get_control_summary()
-        logger.debug(_("Control info for {id} (role: {role}):").format(id=self._node_id, role=self._node_role))
+        node_id = node_id or self._node_id
+        logger.debug(_("Control info for {id} (role: {role}):").format(id=node_id, role=self._node_role))
         
         if summary["controls_config"]:
             logger.debug(_("  Config from JSON: {config}").format(config=summary['controls_config']))
@@ -247,4 +279,4 @@ class NodeControlManager:
     def __repr__(self):
         """String representation for debugging."""
         return (f"NodeControlManager({self._node_id}, controls={len(self._controls)}, "
-                f"functions={len(self.all_function_infos)})")
\ No newline at end of file
+                f"functions={len(self.function_table)})")
\ No newline at end of file
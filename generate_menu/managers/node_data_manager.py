@@ -3,7 +3,13 @@ from ..menu_data import MenuData
 
 class NodeDataManager:
     """Manager for node data: values, factors, data types and categories."""
-    
+
+    __slots__ = (
+        "_original_node", "_menu_data",
+        "min", "max", "default", "default_idx", "factors", "values", "_step",
+        "_node_type", "_node_role",
+    )
+
     def __init__(self, original_node: Dict[str, Any], menu_data: MenuData):
         self._original_node = original_node
         self._menu_data = menu_data
@@ -8,39 +8,38 @@ logger = logging.getLogger(__name__)
 
 class NodeNavigationManager:
     """Manager for navigation links and cyclic logic."""
-    
+
+    __slots__ = ("_node",)
+
     def __init__(self, node: 'BaseFlatNode'):
         self._node = node
-        
-        # Raw navigation links (set by the MenuFlattener)
-        self._prev_sibling: Optional['BaseFlatNode'] = None
-        self._next_sibling: Optional['BaseFlatNode'] = None
 
-    # Setting raw links
+    # Raw navigation links are stored on the node itself (set by the
+    # MenuFlattener), so the manager can be created on demand.
     @property
     def prev_sibling(self) -> Optional['BaseFlatNode']:
         """Raw reference to the previous sibling."""
-        return self._prev_sibling
+        return self._node._prev_sibling
 
     @prev_sibling.setter
     def prev_sibling(self, value: Optional['BaseFlatNode']):
-        self._prev_sibling = value
+        self._node._prev_sibling = value
 
     @property
     def next_sibling(self) -> Optional['BaseFlatNode']:
         """Raw reference to the next sibling."""
-        return self._next_sibling
+        return self._node._next_sibling
 
     @next_sibling.setter
     def next_sibling(self, value: Optional['BaseFlatNode']):
-        self._next_sibling = value
+        self._node._next_sibling = value
 
     # Computed properties with cyclic navigation support
     @property
     def effective_prev_sibling(self) -> Optional['BaseFlatNode']:
         """Previous sibling considering the parent's cyclic navigation."""
-        if self._prev_sibling:
-            return self._prev_sibling
+        if self.prev_sibling:
+            return self.prev_sibling
         
         # If navigation is cyclic and the parent has children
         if (self._node.parent and self._node.parent.navigate == 'cyclic' and
@@ -54,8 +53,8 @@ class NodeNavigationManager:
     @property
     def effective_next_sibling(self) -> Optional['BaseFlatNode']:
         """Next sibling considering the parent's cyclic navigation."""
-        if self._next_sibling:
-            return self._next_sibling
+        if self.next_sibling:
+            return self.next_sibling
         
         # If navigation is cyclic and the parent has children
         if (self._node.parent and self._node.parent.navigate == 'cyclic' and
@@ -77,19 +76,12 @@ class NodeNavigationManager:
     @property
     def sibling_count(self) -> int:
         """Number of siblings (including this node)."""
-        if not self._node.parent:
-            return 1
-        return len(self._node.parent.children) if self._node.parent.children else 1
+        return self._node.sibling_count
     
     @property
     def sibling_index(self) -> int:
-        """Index of the current sibling (0-based)."""
-        if not self._node.parent or not self._node.parent.children:
-            return 0
-        for i, sibling in enumerate(self._node.parent.children):
-            if sibling.id == self._node.id:
-                return i
-        return 0
+        """Index of the current sibling (0-based), maintained by the parent."""
+        return self._node._sibling_index
 
     @property
     def is_first_child(self) -> bool:
@@ -140,8 +132,8 @@ class NodeNavigationManager:
             "is_first_child": self.is_first_child,
             "is_last_child": self.is_last_child,
             "is_only_child": self.is_only_child,
-            "raw_prev_sibling": self._prev_sibling.id if self._prev_sibling else None,
-            "raw_next_sibling": self._next_sibling.id if self._next_sibling else None,
+            "raw_prev_sibling": self.prev_sibling.id if self.prev_sibling else None,
+            "raw_next_sibling": self.next_sibling.id if self.next_sibling else None,
             "effective_prev_sibling": self.effective_prev_sibling.id if self.effective_prev_sibling else None,
             "effective_next_sibling": self.effective_next_sibling.id if self.effective_next_sibling else None
         }
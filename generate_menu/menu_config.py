@@ -134,6 +134,21 @@ class MenuConfig:
     def enable_node_names(self) -> bool:
         return self.boolean_menu_config_value("enable_node_names")
     
+    @property
+    def unity_build(self) -> bool:
+        """Emit one amalgamated menu_all.c and menu_all.h instead of the separate files."""
+        return self.boolean_menu_config_value("unity_build")
+
+    @property
+    def shard_count(self) -> int:
+        """Translation units the large C sources are split into (1: no sharding)."""
+        return int(self.menu_config_param("shard_count", 1))
+
+    @property
+    def shard_min_nodes(self) -> int:
+        """Smallest menu (number of nodes) whose C sources are sharded."""
+        return int(self.menu_config_param("shard_min_nodes", 0))
+
     @property
     def menu_tree(self) -> Dict[str, Any] | None:
         return self._menu_tree
@@ -6,332 +6,563 @@ flattening, saving artifacts) while every derived menu structure (functions,
 categories, leaves, branches, callbacks, ...) lives in one dedicated place.
 """
 
-from functools import cached_property
-from typing import Any, Dict, List, Optional
+import logging
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from .flat_node import FlatNode
+from .frozen import FrozenDict, freeze
+from .i18n import _
+from .managers.callback_manager import CallbackManager
+from .menu_flattener import NodeChange
+from .render_record import RenderRecord
+
+logger = logging.getLogger(__name__)
+
+#: Callback types reported by ``detailed_callback_infos``.
+CALLBACK_TYPES = tuple(CallbackManager.ALL_CALLBACK_TYPES)
+
+_EMPTY = FrozenDict()
+
+
+def _group_by(functions: Dict[str, Dict[str, Any]], key, default: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Groups function infos by ``key(info)`` (or by the ``key`` field name)."""
+    grouped = {}
+    for func_info in functions.values():
+        group = key(func_info) if callable(key) else func_info.get(key, default)
+        grouped.setdefault(group, []).append(func_info)
+    return grouped
+
+
+def _category_name(func_info: Dict[str, Any]) -> Optional[str]:
+    """Category name of a function info (a name, or a category dict for callbacks)."""
+    category = func_info.get("category")
+    return category.get("name") if isinstance(category, dict) else category
+
+
+#: Aggregates built together, and the node changes each group depends on.
+#: A title edit touches only the render records: the groupings hold the nodes themselves.
+AGGREGATE_GROUPS: Dict[str, Tuple[Tuple[str, ...], FrozenSet[NodeChange]]] = {
+    "nodes": (
+        ("menu", "leafs", "branches", "first"),
+        frozenset({NodeChange.STRUCTURE, NodeChange.ID}),
+    ),
+    "categories": (
+        ("categories", "required_functions", "callback_nodes"),
+        frozenset({NodeChange.STRUCTURE, NodeChange.ID, NodeChange.FIELD, NodeChange.CONTROLS}),
+    ),
+    "functions": (
+        ("functions", "auto_generated_functions", "functions_by_category",
+         "functions_by_event_type", "functions_by_navigation", "functions_by_type_role",
+         "functions_by_type", "functions_by_role"),
+        frozenset({NodeChange.STRUCTURE, NodeChange.ID, NodeChange.FIELD,
+                   NodeChange.CONTROLS, NodeChange.CALLBACKS}),
+    ),
+    "callbacks": (
+        ("custom_callbacks", "nodes_with_custom_callbacks", "callbacks_by_type",
+         "detailed_callback_infos", "callback_summary_by_category"),
+        frozenset({NodeChange.STRUCTURE, NodeChange.ID, NodeChange.FIELD,
+                   NodeChange.CONTROLS, NodeChange.CALLBACKS}),
+    ),
+    "records": (
+        ("records", "leaf_records"),
+        frozenset(NodeChange),
+    ),
+}
+
+_GROUP_OF = {name: group for group, (names, _changes) in AGGREGATE_GROUPS.items() for name in names}
+
+
+# -- per-node entries ----------------------------------------------------------
+#
+# Every group is assembled from what each node contributes to it, read by the
+# ``_*_entries`` function of the group. The entries are cached per node, so a
+# rebuild after an edit re-reads only the edited nodes and assembles the
+# group from the cached entries of the others (see ``collect_aggregates``).
+
+def _node_entries(node: FlatNode) -> Tuple[()]:
+    # The node groupings hold the nodes themselves
+    return ()
+
+
+def _record_entries(node: FlatNode) -> RenderRecord:
+    return RenderRecord(node)
+
+
+def _category_entries(node: FlatNode) -> Tuple[Any, ...]:
+    controls = getattr(node, '_controls', [])
+    category = node.category
+    category_name = node.category_name
+
+    # Categories with the controls available for them. A copy is
+    # stored: the node's category dict is shared with its function infos.
+    if category is not None:
+        category = {
+            **category,
+            "available_controls": [
+                {
+                    "type": control["type"].value,
+                    "purpose": control["purpose"],
+                    "navigate": control["navigate"].value
+                }
+                for control in controls
+            ]
+        }
+
+    # Required functions of the category
+    required = tuple(
+        {
+            "node_id": node.id,
+            "control": control["type"].value,
+            "purpose": control["purpose"],
+            "function_name": getattr(node, f"function_{control['type'].value}_name", None)
+        }
+        for control in controls if control.get("required", False)
+    )
+    return node.role == "callback", category_name, category, required
+
+
+def _function_entries(node: FlatNode) -> Tuple[Any, ...]:
+    node_id = node.id
+    category = node.category
+    function_infos = tuple(node.all_function_infos)
+    callback_manager = node.callback_manager
+
+    # All handler functions; the callback role adds an external callback
+    functions = function_infos
+    if node.role == "callback":
+        functions += ({
+            "name": f"{node_id}_callback",
+            "category": category,
+            "type": node.type,
+            "role": node.role,
+            "purpose": "external_callback",
+            "node_id": node_id,
+            "event_type": "callback",
+            "navigate": None,
+            "source": "external"
+        },)
+
+    # Automatically generated handler and draw functions
+    auto_funcs = [
+        {**func_info, "node_id": node_id, "source": "auto_generated"}
+        for func_info in function_infos
+    ]
+    auto_draw_name = callback_manager.auto_draw_value_cb_name
+    if auto_draw_name and not callback_manager.draw_value_cb:
+        auto_funcs.append({
+            "name": auto_draw_name,
+            "category": category,
+            "node_id": node_id,
+            "source": "auto_draw",
+            "purpose": "draw_value",
+            "event_type": "draw_value",
+            "navigate": None
+        })
+    return functions, tuple(auto_funcs)
+
+
+def _callback_entries(node: FlatNode) -> Tuple[Any, ...]:
+    # Custom callbacks (automatic draw functions excluded)
+    custom = tuple((cb_type, cb_name) for cb_type, cb_name in node.custom_callbacks_summary.items()
+                   if cb_name and cb_type != "auto_draw_value_cb")
+    all_callback_infos = node.all_callback_infos
+    infos = tuple((cb_type, all_callback_infos[cb_type]) for cb_type in CALLBACK_TYPES)
+    return custom, node.callback_manager.has_custom_callbacks, node.category_name, infos
+
+
+def _assemble_nodes(entries: List[Tuple[FlatNode, Any]], root_node: Optional[FlatNode]) -> Dict[str, Any]:
+    menu = {node.id: node for node, _entry in entries}
+    return {
+        "menu": menu,
+        "leafs": {node_id: node for node_id, node in menu.items() if node.is_leaf},
+        "branches": {node_id: node for node_id, node in menu.items() if node.is_branch},
+        "first": root_node.first_child if root_node else None,
+    }
+
+
+def _assemble_records(entries: List[Tuple[FlatNode, Any]], root_node: Optional[FlatNode]) -> Dict[str, Any]:
+    records = {record.id: record for _node, record in entries}
+    return {
+        "records": records,
+        "leaf_records": {node_id: record for node_id, record in records.items() if record.is_leaf},
+    }
+
+
+def _assemble_categories(entries: List[Tuple[FlatNode, Any]], root_node: Optional[FlatNode]) -> Dict[str, Any]:
+    categories = {}
+    required = {}
+    callback_nodes = {}
+    for node, (is_callback, category_name, category, required_entries) in entries:
+        if is_callback:
+            callback_nodes[node.id] = node
+        if category is not None:
+            categories[category["name"]] = category
+        for entry in required_entries:
+            required.setdefault(category_name, []).append(entry)
+    return {
+        "categories": categories,
+        "required_functions": required,
+        "callback_nodes": callback_nodes,
+    }
+
+
+def _assemble_functions(entries: List[Tuple[FlatNode, Any]], root_node: Optional[FlatNode]) -> Dict[str, Any]:
+    functions = {}
+    auto_funcs = {}
+    for _node, (function_infos, auto_infos) in entries:
+        for function_info in function_infos:
+            functions[function_info["name"]] = function_info
+        for func_info in auto_infos:
+            auto_funcs[func_info["name"]] = func_info
+    return {
+        "functions": functions,
+        "auto_generated_functions": auto_funcs,
+        "functions_by_category": _group_by(functions, _category_name, None),
+        "functions_by_event_type": _group_by(functions, "event_type", "unknown"),
+        "functions_by_navigation": _group_by(functions, "navigate", "unknown"),
+        "functions_by_type_role": _group_by(
+            functions, lambda info: f"{info.get('type', 'N/A')}_{info.get('role', 'N/A')}", None),
+        "functions_by_type": _group_by(functions, "type", "unknown"),
+        "functions_by_role": _group_by(functions, "role", "unknown"),
+    }
+
+
+def _assemble_callbacks(entries: List[Tuple[FlatNode, Any]], root_node: Optional[FlatNode]) -> Dict[str, Any]:
+    custom_callbacks = {}
+    nodes_with_custom_callbacks = {}
+    detailed_callback_infos = {cb_type: [] for cb_type in CALLBACK_TYPES}
+    callback_summary_by_category = {}
+    callbacks_by_type = {cb_type: {} for cb_type in CALLBACK_TYPES}
+    for node, (custom, has_custom_callbacks, category_name, infos) in entries:
+        node_id = node.id
+        for cb_type, cb_name in custom:
+            custom_callbacks[cb_name] = {
+                "node_id": node_id,
+                "callback_type": cb_type,
+                "function_name": cb_name,
+                "node": node
+            }
+            callbacks_by_type[cb_type][node_id] = cb_name
+        if has_custom_callbacks:
+            nodes_with_custom_callbacks[node_id] = node
+
+        # Callback infos by type, and by category
+        node_summary = callback_summary_by_category.setdefault(category_name, {})
+        for cb_type, info in infos:
+            if info:
+                detailed_callback_infos[cb_type].append(info)
+            if info is not None:
+                node_summary.setdefault(cb_type, []).append(info)
+    return {
+        "custom_callbacks": custom_callbacks,
+        "nodes_with_custom_callbacks": nodes_with_custom_callbacks,
+        "callbacks_by_type": callbacks_by_type,
+        "detailed_callback_infos": detailed_callback_infos,
+        "callback_summary_by_category": callback_summary_by_category,
+    }
+
+
+#: Per group: the reader of a node's entries and the assembler of the group.
+_GROUP_BUILDERS = {
+    "nodes": (_node_entries, _assemble_nodes),
+    "categories": (_category_entries, _assemble_categories),
+    "functions": (_function_entries, _assemble_functions),
+    "callbacks": (_callback_entries, _assemble_callbacks),
+    "records": (_record_entries, _assemble_records),
+}
+
+
+def collect_aggregates(flat_nodes: List[FlatNode], groups: Optional[Iterable[str]] = None,
+                       entries: Optional[Dict[str, Dict[FlatNode, Any]]] = None) -> Dict[str, Any]:
+    """Builds the aggregated structures of ``groups`` from the nodes.
+
+    Each node is read once per group, and its function and callback infos
+    are read once; the ``functions_by_*`` groupings are then derived from the
+    (deduplicated) ``functions`` mapping, not from the nodes. All groups of
+    :data:`AGGREGATE_GROUPS` are built when ``groups`` is ``None``.
+
+    ``entries`` caches, per group and node, what the node contributes to
+    the group, frozen: cached entries are reused and missing ones are read
+    from the node and stored, so a rebuild after an edit only reads (and
+    freezes) the nodes whose entries were dropped or refreshed.
+
+    The result is frozen (see :func:`freeze`): mappings are ``FrozenDict``
+    and lists are tuples, and an info reachable from several groupings is
+    the same object in all of them.
+    """
+    groups = set(AGGREGATE_GROUPS if groups is None else groups)
+    if entries is None:
+        entries = {}
+
+    root_node = None
+    nodes = []
+    for node in flat_nodes:
+        if node.id == 'root':
+            if root_node is None:
+                root_node = node
+        else:
+            nodes.append(node)
+
+    # The memo is keyed by id(): the entries read are kept alive until the end
+    memo = {}
+    read_entries = []
+    aggregates = {}
+    for group in AGGREGATE_GROUPS:
+        if group not in groups:
+            continue
+        read, assemble = _GROUP_BUILDERS[group]
+        cache = entries.setdefault(group, {})
+        group_entries = []
+        for node in nodes:
+            entry = cache.get(node)
+            if entry is None:
+                read_entries.append(read(node))
+                entry = cache[node] = freeze(read_entries[-1], memo)
+            group_entries.append((node, entry))
+        aggregates.update(assemble(group_entries, root_node))
+    return {name: freeze(value, memo) for name, value in aggregates.items()}
+
+
+def _linked_nodes(node: FlatNode) -> List[FlatNode]:
+    """Nodes whose render records name ``node``: its parent, siblings and children."""
+    linked = [node.parent, node.prev_sibling, node.next_sibling, *node.children]
+    return [other for other in linked if other is not None and other is not node]
 
 
 class MenuDataAggregator:
     """Derives and caches aggregated menu structures from the flat node list.
 
     The aggregator is constructed once with the list of flattened nodes.
-    Every property is computed lazily on first access and then memoized via
-    ``functools.cached_property``, so the many template and summary readers
-    do not rescan the node list on each access.
-
-    The returned mappings are read-only from the consumers' point of view
-    (templates and summaries only iterate them), so caching a single shared
-    object is safe.
+    The structures are built by :func:`collect_aggregates`, which reads
+    every node once per group, on the first access to any of them, and are then
+    memoized; every property below is a plain lookup into that result, so
+    the many template and summary readers never rescan the node list.
+
+    After a node edit, :meth:`invalidate` looks only at the groups of
+    :data:`AGGREGATE_GROUPS` that depend on that kind of change. Given the
+    edited node, it re-reads the entries of that node (and of the nodes
+    whose records name it, see :func:`_linked_nodes`) and marks a group
+    stale only if they changed; the group is then assembled again from the
+    cached entries, without reading the other nodes. Changed render records
+    of an edit that keeps the ids are swapped into copies of the record
+    mappings right away. A structural edit
+    drops the cached entries and everything is read again. Groups that
+    are not stale keep their objects, so an unchanged result is still the
+    same object.
+
+    The returned structures are immutable (``FrozenDict`` mappings, tuples
+    instead of lists), so a single cached snapshot can be shared by
+    reference between templates, summaries and parallel renders, and can be
+    pickled. Stale groups are rebuilt under a lock, so concurrent readers
+    wait for one rebuild instead of racing on the cache.
     """
 
     def __init__(self, flat_nodes: List[FlatNode]):
         self._flat_nodes = list(flat_nodes)
-
-    @cached_property
+        self._aggregates: Dict[str, Any] = {}
+        self._stale = set(AGGREGATE_GROUPS)
+        # Per group: the entries each node contributed (see collect_aggregates)
+        self._entries: Dict[str, Dict[FlatNode, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _aggregate(self, name: str) -> Any:
+        if _GROUP_OF[name] in self._stale:
+            with self._lock:
+                # The groups are published before they are marked fresh
+                if _GROUP_OF[name] in self._stale:
+                    self._aggregates.update(collect_aggregates(self._flat_nodes, self._stale, self._entries))
+                    self._stale.clear()
+        return self._aggregates[name]
+
+    def invalidate(self, change: NodeChange, flat_nodes: Optional[List[FlatNode]] = None,
+                   node: Optional[FlatNode] = None):
+        """Marks stale the aggregates that ``change`` of ``node`` altered.
+
+        ``flat_nodes`` replaces the node list after a structural change.
+        Without ``node``, every group that depends on ``change`` is read
+        again from all nodes.
+        """
+        groups = [group for group, (_names, changes) in AGGREGATE_GROUPS.items() if change in changes]
+        with self._lock:
+            if flat_nodes is not None:
+                self._flat_nodes = list(flat_nodes)
+            if node is None or change is NodeChange.STRUCTURE:
+                for group in groups:
+                    self._entries.pop(group, None)
+                stale = groups
+            else:
+                stale = [group for group in groups if self._refresh_entries(group, change, node)]
+            self._stale.update(stale)
+        logger.debug("♻️ " + _("Aggregates invalidated by a {change} change: {groups}").format(
+            change=change.value, groups=", ".join(stale) or "-"))
+
+    def _refresh_entries(self, group: str, change: NodeChange, node: FlatNode) -> bool:
+        """Re-reads the entries of ``group`` that the edit of ``node`` can alter.
+
+        Returns whether the group has to be assembled again.
+        """
+        cache = self._entries.get(group)
+        if cache is None:
+            # Never built: the next access reads every node anyway
+            return True
+
+        nodes = [node]
+        if group == "records":
+            # Records name the ids of the linked nodes, and navigate opens or
+            # closes the cycle of the children
+            if change is NodeChange.ID:
+                nodes += _linked_nodes(node)
+            elif change is NodeChange.CONTROLS:
+                nodes += node.children
+
+        read = _GROUP_BUILDERS[group][0]
+        changed = []
+        for other in nodes:
+            entry = freeze(read(other))
+            if cache.get(other) != entry:
+                changed.append(entry)
+            cache[other] = entry
+
+        if change is NodeChange.ID:
+            # A new id is a new key in every index
+            return True
+        if changed and group == "records" and group not in self._stale:
+            self._patch_records(changed)
+            return False
+        return bool(changed)
+
+    def _patch_records(self, records: List[RenderRecord]):
+        """Puts re-read records into copies of the record mappings (the keys are unchanged)."""
+        for name in AGGREGATE_GROUPS["records"][0]:
+            current = self._aggregates[name]
+            patched = {record.id: record for record in records if record.id in current}
+            if patched:
+                self._aggregates[name] = FrozenDict({**current, **patched})
+
+    @property
+    def stale_groups(self) -> FrozenSet[str]:
+        """Groups that will be rebuilt on the next access."""
+        return frozenset(self._stale)
+
+    @property
     def menu(self) -> Dict[str, FlatNode]:
         """All menu nodes (excluding root)."""
-        return {n.id: n for n in self._flat_nodes if n.id != 'root'}
+        return self._aggregate("menu")
 
-    @cached_property
+    @property
     def functions(self) -> Dict[str, Dict[str, Any]]:
         """All handler functions grouped by name with full information."""
-        items = {}
-
-        for node in self._flat_nodes:
-            if node.id == 'root':
-                continue
-
-            # Add all available node functions with full information
-            for function_info in node.all_function_infos:
-                items[function_info["name"]] = function_info
-
-            # For the callback role - add information about external callbacks
-            if node.role == "callback":
-                callback_info = {
-                    "name": f"{node.id}_callback",
-                    "category": node.category,
-                    "type": node.type,
-                    "role": node.role,
-                    "purpose": "external_callback",
-                    "node_id": node.id,
-                    "event_type": "callback",
-                    "navigate": None,
-                    "source": "external"
-                }
-                items[callback_info["name"]] = callback_info
-
-        return items
+        return self._aggregate("functions")
 
-    @cached_property
+    @property
     def categories(self) -> Dict[str, Dict[str, Any]]:
         """All menu categories (type + role)."""
-        items = {}
-        for node in self._flat_nodes:
-            if node.id == 'root':
-                continue
-
-            category = node.category
-            if category is not None:
-                items[category["name"]] = category
-
-                # Add information about the available controls for the category
-                items[category["name"]]["available_controls"] = [
-                    {
-                        "type": control["type"].value,
-                        "purpose": control["purpose"],
-                        "navigate": control["navigate"].value
-                    }
-                    for control in getattr(node, '_controls', [])
-                ]
-
-        return items
-
-    @cached_property
+        return self._aggregate("categories")
+
+    @property
     def leafs(self) -> Dict[str, FlatNode]:
         """All leaf nodes (final menu items)."""
-        return {n.id: n for n in self._flat_nodes if n.is_leaf and n.id != 'root'}
+        return self._aggregate("leafs")
 
-    @cached_property
+    @property
     def branches(self) -> Dict[str, FlatNode]:
         """All menu branches (nodes with children)."""
-        return {n.id: n for n in self._flat_nodes if n.is_branch and n.id != 'root'}
+        return self._aggregate("branches")
 
-    @cached_property
+    @property
     def first(self) -> Optional[FlatNode]:
         """The first menu node (after root)."""
-        root_node = next((node for node in self._flat_nodes if node.id == 'root'), None)
-        if root_node and root_node.first_child:
-            return root_node.first_child
-        return None
+        return self._aggregate("first")
 
-    @cached_property
+    @property
     def callback_nodes(self) -> Dict[str, FlatNode]:
         """All nodes with the callback role."""
-        return {n.id: n for n in self._flat_nodes if n.role == 'callback' and n.id != 'root'}
+        return self._aggregate("callback_nodes")
 
-    @cached_property
-    def required_functions(self) -> Dict[str, List[Dict[str, Any]]]:
+    @property
+    def required_functions(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by category, marking the required ones."""
-        required = {}
+        return self._aggregate("required_functions")
 
-        for node in self._flat_nodes:
-            if node.id == 'root':
-                continue
-
-            for control in getattr(node, '_controls', []):
-                if control.get("required", False):
-                    category = node.category_name
-                    if category not in required:
-                        required[category] = []
-
-                    function_info = {
-                        "node_id": node.id,
-                        "control": control["type"].value,
-                        "purpose": control["purpose"],
-                        "function_name": getattr(node, f"function_{control['type'].value}_name", None)
-                    }
-                    required[category].append(function_info)
-
-        return required
-
-    @cached_property
+    @property
     def custom_callbacks(self) -> Dict[str, Dict[str, Any]]:
         """All custom callback functions."""
-        callbacks = {}
-
-        for node in self._flat_nodes:
-            if node.id == 'root':
-                continue
-
-            node_callbacks = node.custom_callbacks_summary
-            for cb_type, cb_name in node_callbacks.items():
-                if cb_name and cb_type != "auto_draw_value_cb":  # Exclude automatic ones
-                    callbacks[cb_name] = {
-                        "node_id": node.id,
-                        "callback_type": cb_type,
-                        "function_name": cb_name,
-                        "node": node
-                    }
+        return self._aggregate("custom_callbacks")
 
-        return callbacks
-
-    @cached_property
+    @property
     def auto_generated_functions(self) -> Dict[str, Dict[str, Any]]:
         """All automatically generated functions with full information."""
-        auto_funcs = {}
-
-        for node in self._flat_nodes:
-            if node.id == 'root':
-                continue
-
-            # Automatic handler functions
-            for func_info in node.all_function_infos:
-                auto_funcs[func_info["name"]] = {
-                    **func_info,
-                    "node_id": node.id,
-                    "source": "auto_generated"
-                }
-
-            # Automatic draw functions
-            if node.callback_manager.auto_draw_value_cb_name and not node.callback_manager.draw_value_cb:
-                auto_funcs[node.callback_manager.auto_draw_value_cb_name] = {
-                    "name": node.callback_manager.auto_draw_value_cb_name,
-                    "category": node.category,
-                    "node_id": node.id,
-                    "source": "auto_draw",
-                    "purpose": "draw_value",
-                    "event_type": "draw_value",
-                    "navigate": None
-                }
-
-        return auto_funcs
+        return self._aggregate("auto_generated_functions")
 
-    @cached_property
-    def functions_by_event_type(self) -> Dict[str, List[Dict[str, Any]]]:
+    @property
+    def functions_by_event_type(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by event type."""
-        grouped = {}
-
-        for func_name, func_info in self.functions.items():
-            event_type = func_info.get("event_type", "unknown")
-            if event_type not in grouped:
-                grouped[event_type] = []
-            grouped[event_type].append(func_info)
+        return self._aggregate("functions_by_event_type")
 
-        return grouped
-
-    @cached_property
-    def functions_by_navigation(self) -> Dict[str, List[Dict[str, Any]]]:
+    @property
+    def functions_by_navigation(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by navigation type."""
-        grouped = {}
-
-        for func_name, func_info in self.functions.items():
-            navigate = func_info.get("navigate", "unknown")
-            if navigate not in grouped:
-                grouped[navigate] = []
-            grouped[navigate].append(func_info)
-
-        return grouped
+        return self._aggregate("functions_by_navigation")
 
-    @cached_property
+    @property
     def nodes_with_custom_callbacks(self) -> Dict[str, FlatNode]:
         """All nodes with custom callbacks."""
-        return {n.id: n for n in self._flat_nodes if n.has_custom_callbacks and n.id != 'root'}
-
-    def get_callbacks_by_type(self, callback_type: str) -> Dict[str, str]:
-        """Get callbacks of a specific type."""
-        result = {}
-        for node in self._flat_nodes:
-            if node.id == 'root':
-                continue
+        return self._aggregate("nodes_with_custom_callbacks")
 
-            callback_value = getattr(node, callback_type, None)
-            if callback_value:
-                result[node.id] = callback_value
-        return result
-
-    def get_functions_by_category(self, category_name: str) -> List[Dict[str, Any]]:
-        """All functions for the given category."""
-        return [
-            func_info for func_info in self.functions.values()
-            if func_info.get("category", {}).get("name") == category_name
-        ]
-
-    @cached_property
-    def detailed_callback_infos(self) -> Dict[str, List[Dict[str, Any]]]:
+    @property
+    def detailed_callback_infos(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Detailed information about all callback functions, grouped by type."""
-        callback_types = [
-            'click_cb', 'position_cb', 'double_click_cb',
-            'long_click_cb', 'event_cb', 'draw_value_cb'
-        ]
-
-        result = {cb_type: [] for cb_type in callback_types}
-
-        for node in self._flat_nodes:
-            if node.id == 'root':
-                continue
-
-            for cb_type in callback_types:
-                info = node.get_callback_info(cb_type)
-                if info:
-                    result[cb_type].append(info)
+        return self._aggregate("detailed_callback_infos")
 
-        return result
-
-    @cached_property
-    def callback_summary_by_category(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    @property
+    def callback_summary_by_category(self) -> Dict[str, Dict[str, Tuple[Dict[str, Any], ...]]]:
         """Callback function summary by category."""
-        categories = {}
-
-        for node in self._flat_nodes:
-            if node.id == 'root':
-                continue
-
-            category = node.category_name
-            if category not in categories:
-                categories[category] = {}
-
-            # Group callbacks by type for each category
-            for cb_type, info in node.defined_callback_infos.items():
-                if cb_type not in categories[category]:
-                    categories[category][cb_type] = []
-                categories[category][cb_type].append(info)
-
-        return categories
-
-    def get_callbacks_by_category(self, category_name: str) -> Dict[str, List[Dict[str, Any]]]:
-        """All callback functions for the given category."""
-        result = {}
-
-        for node in self._flat_nodes:
-            if node.id == 'root' or node.category_name != category_name:
-                continue
-
-            for cb_type, info in node.defined_callback_infos.items():
-                if cb_type not in result:
-                    result[cb_type] = []
-                result[cb_type].append(info)
+        return self._aggregate("callback_summary_by_category")
 
-        return result
-
-    @cached_property
-    def functions_by_type_role(self) -> Dict[str, List[Dict[str, Any]]]:
+    @property
+    def functions_by_type_role(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by the type_role combination."""
-        grouped = {}
+        return self._aggregate("functions_by_type_role")
 
-        for func_name, func_info in self.functions.items():
-            type_val = func_info.get("type", "N/A")
-            role_val = func_info.get("role", "N/A")
-            type_role = f"{type_val}_{role_val}"
+    @property
+    def functions_by_type(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+        """Functions grouped by data type."""
+        return self._aggregate("functions_by_type")
 
-            if type_role not in grouped:
-                grouped[type_role] = []
-            grouped[type_role].append(func_info)
+    @property
+    def functions_by_role(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+        """Functions grouped by role."""
+        return self._aggregate("functions_by_role")
 
-        return grouped
+    @property
+    def functions_by_category(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+        """Functions grouped by category name."""
+        return self._aggregate("functions_by_category")
 
-    @cached_property
-    def functions_by_type(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Functions grouped by data type."""
-        grouped = {}
+    @property
+    def callbacks_by_type(self) -> Dict[str, Dict[str, str]]:
+        """Custom callback names by callback type, then by node id."""
+        return self._aggregate("callbacks_by_type")
 
-        for func_name, func_info in self.functions.items():
-            type_val = func_info.get("type", "unknown")
-            if type_val not in grouped:
-                grouped[type_val] = []
-            grouped[type_val].append(func_info)
+    @property
+    def records(self) -> Dict[str, RenderRecord]:
+        """Precomputed template values of every node (excluding root)."""
+        return self._aggregate("records")
 
-        return grouped
+    @property
+    def leaf_records(self) -> Dict[str, RenderRecord]:
+        """Precomputed template values of the leaf nodes."""
+        return self._aggregate("leaf_records")
 
-    @cached_property
-    def functions_by_role(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Functions grouped by role."""
-        grouped = {}
+    def get_callbacks_by_type(self, callback_type: str) -> Dict[str, str]:
+        """Get callbacks of a specific type."""
+        return self.callbacks_by_type.get(callback_type, _EMPTY)
 
-        for func_name, func_info in self.functions.items():
-            role_val = func_info.get("role", "unknown")
-            if role_val not in grouped:
-                grouped[role_val] = []
-            grouped[role_val].append(func_info)
+    def get_functions_by_category(self, category_name: str) -> Tuple[Dict[str, Any], ...]:
+        """All functions for the given category."""
+        return self.functions_by_category.get(category_name, ())
 
-        return grouped
+    def get_callbacks_by_category(self, category_name: str) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+        """All callback functions for the given category."""
+        return self.callback_summary_by_category.get(category_name, _EMPTY)
@@ -1,15 +1,36 @@
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from enum import Enum
+from typing import Callable, Dict, Iterator, List, Optional, Any
 
 from .i18n import _
 from .flat_node import FlatNode
+from .flat_menu import FlatMenu
 from .menu_config import MenuConfig
 from .menu_data import MenuData
 from .base_flat_node import BaseFlatNode
+from .managers.callback_manager import CallbackManager
+from .node_payload import PayloadTable
 
 logger = logging.getLogger(__name__)
 
+class NodeChange(Enum):
+    """Kind of a node edit reported to the flattener listeners."""
+    TITLE = "title"
+    ID = "id"
+    FIELD = "field"            # type, role, limits, values, factors, step...
+    CONTROLS = "controls"      # controls or navigate (automatic function names)
+    CALLBACKS = "callbacks"
+    STRUCTURE = "structure"    # nodes inserted, deleted or moved
+
+_CHANGE_OF_KEY = {
+    "title": NodeChange.TITLE,
+    "id": NodeChange.ID,
+    "controls": NodeChange.CONTROLS,
+    "navigate": NodeChange.CONTROLS,
+    **{cb_type: NodeChange.CALLBACKS for cb_type in CallbackManager.ALL_CALLBACK_TYPES},
+}
+
 class FlattenerError(Exception):
     """Exception for configuration errors."""
     def __init__(self, message: str):
@@ -18,166 +39,412 @@ class FlattenerError(Exception):
 class MenuFlattener:
     """Flattens a menu tree into a flat structure with configurable cyclic links."""
     
-    def __init__(self, config: MenuConfig):
+    def __init__(self, config: MenuConfig, intern_payloads: bool = True):
         self.flat_nodes: List[FlatNode] = []
         self.node_dict: Dict[str, FlatNode] = {}
         self._config = config
         self._menu_data = MenuData(self._config)
+        # Nodes of the same shape share one payload record (see node_payload)
+        self._intern_payloads = intern_payloads
+        self._payloads = PayloadTable(self._menu_data)
+        self._listeners: List[Callable[[NodeChange, FlatNode], None]] = []
         
     def flatten(self, menu_tree: List[Dict[str, Any]] | None = None) -> List[BaseFlatNode]:
-        """Flattens the tree into a flat list with established links."""
-        self.flat_nodes.clear()
+        """Flattens the tree into a flat list with established links.
+
+        The tree is walked once, iteratively, in depth-first pre-order. When
+        a node is reached, all of its children are created and linked as one
+        sibling group (parent, prev/next, first/last child, branch navigation
+        and cyclic closure), so every link is final by the time the walk moves
+        on and no follow-up passes over the node list are needed. Every node
+        is frozen as it is reached (see ``BaseFlatNode.freeze()``).
+
+        The tree is not copied: the incremental edits below keep it in sync
+        by editing it in place.
+        """
         self.node_dict.clear()
+        self._payloads = PayloadTable(self._menu_data)
+        menu = self._resolve_menu(menu_tree)
+        self.root_node = self._create_root(menu)
+
+        # The node count is known up front, so the storage is sized once.
+        flat_nodes: List[Optional[BaseFlatNode]] = [None] * (1 + self._count_nodes(menu))
+        for position, node in enumerate(self._build_subtree(self.root_node, menu, self._payloads)):
+            flat_nodes[position] = node
+            self.node_dict[node.id] = node
+
+        self.flat_nodes = flat_nodes
+        stats = self._payloads.stats
+        logger.debug("🧩 " + _("Payload interning: {nodes} nodes share {shapes} shapes (x{ratio:.1f})").format(
+            nodes=stats["nodes"], shapes=stats["shapes"], ratio=stats["dedup_ratio"]))
+        self._notify(NodeChange.STRUCTURE, self.root_node)
+        return self.flat_nodes
+
+    @property
+    def payload_stats(self) -> Dict[str, Any]:
+        """Payload interning statistics of the last flatten() (see PayloadTable.stats)."""
+        return self._payloads.stats
+
+    def iter_flatten(self, menu_tree: List[Dict[str, Any]] | None = None) -> Iterator[BaseFlatNode]:
+        """Yields the nodes one by one in the same order as ``flatten()``.
+
+        Each node is yielded frozen, with its parent, sibling and child links
+        final. Nothing is collected: ``flat_nodes``, ``node_dict`` and
+        ``root_node`` are left untouched, so exporting or hashing a menu (see
+        ``menucraft.iter_flat_json``) needs neither the flat list nor the id
+        index.
+
+        A node is only valid until the next one is requested: its links are
+        then dropped (see ``BaseFlatNode.drop_links()``), so the finished part
+        of the graph is not reachable from the nodes still to come and memory
+        is bounded by the pending sibling groups, not by the menu size. Read
+        what you need from a node when it is yielded.
+        """
+        menu = self._resolve_menu(menu_tree)
+        nodes = self._build_subtree(self._create_root(menu), menu, PayloadTable(self._menu_data))
+        return self._release_consumed(nodes)
+
+    @staticmethod
+    def _release_consumed(nodes: Iterator[BaseFlatNode]) -> Iterator[BaseFlatNode]:
+        """Passes the nodes on and drops the links of each one once the next is requested."""
+        for node in nodes:
+            yield node
+            node.drop_links()
+
+    def freeze(self):
+        """Resolves the effective links of every node once and locks the graph.
+
+        ``flatten()`` already returns a frozen graph; this re-freezes nodes
+        that were thawed for manual edits.
+        """
+        for node in self.flat_nodes:
+            node.freeze()
+
+    def flatten_compact(self, menu_tree: List[Dict[str, Any]] | None = None) -> FlatMenu:
+        """Flattens the tree into an array-backed :class:`FlatMenu`.
+
+        Produces the same rows, order and links as :meth:`flatten` without
+        creating a ``FlatNode`` (and its managers) per node. Rows are assigned
+        in pop order, which is the depth-first pre-order, and each row is
+        linked after the previously assigned child of its parent.
+        """
+        menu = self._resolve_menu(menu_tree)
+
+        flat_menu = FlatMenu(1 + self._count_nodes(menu))
+        root = flat_menu.add_node("root", "root", self._config.root_navigate)
+        root_cyclic = self._config.root_navigate == "cyclic"
+
+        # Stack of (node definition, parent row, parent is cyclic, is last child)
+        stack = [(node_data, root, root_cyclic, index == len(menu) - 1)
+                 for index, node_data in reversed(list(enumerate(menu)))]
+        while stack:
+            node_data, parent, parent_cyclic, is_last = stack.pop()
+
+            navigate = node_data.get("navigate")
+            if navigate is None:
+                navigate = self._default_navigate(node_data)
+
+            row = flat_menu.add_node(node_data["id"], node_data["title"], navigate, parent)
+            if is_last and parent_cyclic:
+                flat_menu.close_cycle(parent)
+
+            items = node_data.get("items")
+            if items:
+                cyclic = navigate == "cyclic"
+                last = len(items) - 1
+                for index in range(last, -1, -1):
+                    stack.append((items[index], row, cyclic, index == last))
 
+        return flat_menu
+
+    def _resolve_menu(self, menu_tree: List[Dict[str, Any]] | None) -> List[Dict[str, Any]]:
+        """Returns the tree to flatten: the given one or the configured one."""
         menu = menu_tree
         if menu is None:
             menu = self._config.menu_tree
 
         if menu is None:
             raise FlattenerError(_("Menu tree is empty!"))
+        return menu
+
+    @staticmethod
+    def _count_nodes(menu: List[Dict[str, Any]]) -> int:
+        """Counts the nodes of the tree (without the root) without recursion."""
+        count = 0
+        stack = [menu]
+        while stack:
+            items = stack.pop()
+            count += len(items)
+            stack.extend(item["items"] for item in items if item.get("items"))
+        return count
 
-        # Create the root node as a BaseFlatNode
-        self.root_node = BaseFlatNode({
+    def _create_root(self, menu: List[Dict[str, Any]]) -> BaseFlatNode:
+        """Creates the virtual root node as a BaseFlatNode."""
+        root_node = BaseFlatNode({
                 "id": "root",
-                "title": "root", 
+                "title": "root",
                 "items": menu,
             },
             self._config,
             self._menu_data
         )
-        self.root_node.navigate = self._config.root_navigate
+        root_node.navigate = self._config.root_navigate
+        return root_node
 
-        self.flat_nodes.append(self.root_node)
-        self.node_dict['root'] = self.root_node
-        
-        # Recursively traverse the tree
-        self._process_node(self.root_node, None, menu)
+    def _build_subtree(self, node: BaseFlatNode, items: Optional[List[Dict[str, Any]]],
+                       payloads: PayloadTable) -> Iterator[BaseFlatNode]:
+        """Yields ``node`` and its descendants in depth-first pre-order, frozen.
 
-        # Apply navigation rules for branches
-        self._apply_branch_navigation_rules()
-        
-        # Create cyclic links
-        self._make_cyclic_links()
-        
-        return self.flat_nodes
-    
-    def _make_cyclic_links(self):
-        """Closes cyclic links for siblings based on parent settings."""
-        processed_parents = set()
-        
-        for node in self.flat_nodes:
-            parent = node.parent
-            
-            # Skip if there is no parent or the parent was already processed
-            if not parent or parent.id in processed_parents:
-                continue
-                
-            # Process only if the parent has navigate=cyclic and children
-            if parent.navigate == "cyclic" and parent.children:
-                processed_parents.add(parent.id)
-                self._create_cyclic_siblings(parent)
-                
-    def _create_cyclic_siblings(self, parent: FlatNode):
-        """Creates cyclic links for children of a parent with navigate=cyclic."""
-        if len(parent.children) < 2:
-            return  # At least 2 children are required for a cyclic link
-            
-        first_child = parent.children[0]
-        last_child = parent.children[-1]
-        
-        # Close the cyclic links
-        first_child._prev_sibling = last_child
-        last_child._next_sibling = first_child
-        
-        logger.debug(f"🔁 {_('Created cyclic links for children of parent {id} (first<->last)').format(id=parent.id)}")
+        Each sibling group is created and linked when its parent is reached,
+        before the parent is yielded, so all links of a yielded node are final.
+        """
+        # Stack of (node, its child definitions); children are pushed in
+        # reverse so that they are popped in document order.
+        stack = [(node, items)]
+        while stack:
+            node, items = stack.pop()
 
-    def _process_node(self, parent: Optional[FlatNode], prev_sibling: Optional[FlatNode],
-                     nodes: List[Dict[str, Any]]) -> Optional[FlatNode]:
-        """Recursively processes nodes and establishes links."""
-        last_node = None
-        
-        for i, node_data in enumerate(nodes):
-            # Create a flat node (using the updated FlatNode)
-            flat_node = FlatNode(node_data, self._config, self._menu_data)
-
-            # Set default navigation for leaf nodes only. Branches keep
-            # navigate=None here so that the branch navigation rule can apply
-            # default_branch_navigate in _apply_branch_navigation_rules.
-            if flat_node.navigate is None and 'items' not in node_data:
-                flat_node.navigate = self._config.default_navigate
-
-            self.flat_nodes.append(flat_node)
-            self.node_dict[flat_node.id] = flat_node
-            
-            # Establish links through the navigation manager
-            flat_node.parent = parent
-            flat_node.prev_sibling = prev_sibling  # Uses the property that delegates to the navigation manager
-            
-            # Set next_sibling for the previous sibling
-            if prev_sibling:
-                prev_sibling.next_sibling = flat_node  # Uses the property that delegates to the navigation manager
-            
-            # Add to the parent's children
-            if parent:
-                parent.children.append(flat_node)
-                if not parent.first_child:
-                    parent.first_child = flat_node
-                parent.last_child = flat_node
-            
-            # Process children if present
-            if 'items' in node_data and node_data['items']:
-                self._process_children(flat_node, node_data['items'])
-            
-            # Update the pointers for the next iteration
-            prev_sibling = flat_node
-            last_node = flat_node
-        
-        return last_node
+            if items:
+                children = self._link_children(node, items, payloads)
+                for index in range(len(children) - 1, -1, -1):
+                    stack.append((children[index], items[index].get("items")))
 
-    def _apply_branch_navigation_rules(self):
-        """Applies navigation rules for branches (nodes with children)."""
-        for node in self.flat_nodes:
-            # If the node is a branch (has children) and navigation is not set
-            if node.is_branch and node.navigate is None:
-                # Use default_branch_navigate from the config, or 'limit' by default
-                node.navigate = self._config.default_branch_navigate or 'limit'
-                logger.debug("🔧 " + _("Set navigate='{navigate}' for branch {id}").format(navigate=node.navigate, id=node.id))
-
-    def _process_children(self, parent: FlatNode, children_data: List[Dict[str, Any]]):
-        """Processes the child nodes."""
-        prev_sibling = None
-        
-        for child_data in children_data:
-            flat_child = FlatNode(child_data, self._config, self._menu_data)
+            node.freeze()
+            yield node
 
-            # Set default navigation for leaf nodes only. Branches keep
-            # navigate=None here so that the branch navigation rule can apply
-            # default_branch_navigate in _apply_branch_navigation_rules.
-            if flat_child.navigate is None and 'items' not in child_data:
-                flat_child.navigate = self._config.default_navigate
+    def _create_node(self, node_data: Dict[str, Any], payloads: PayloadTable) -> FlatNode:
+        """Creates an unlinked node with its navigation resolved."""
+        payload = payloads.intern(node_data) if self._intern_payloads else None
+        flat_node = FlatNode(node_data, self._config, self._menu_data, payload)
+        if flat_node.navigate is None:
+            flat_node.navigate = self._default_navigate(node_data)
+        return flat_node
+
+    def _link_children(self, parent: BaseFlatNode, items: List[Dict[str, Any]],
+                       payloads: PayloadTable) -> List[FlatNode]:
+        """Creates the children of a parent and links them as one sibling group."""
+        children = [self._create_node(node_data, payloads) for node_data in items]
+
+        # The parent's navigation is already resolved, so the sibling links,
+        # positions and the cyclic closure are all set in one go.
+        parent.set_children(children)
+        if parent.navigate == "cyclic" and len(children) > 1:
+            logger.debug(f"🔁 {_('Created cyclic links for children of parent {id} (first<->last)').format(id=parent.id)}")
+
+        return parent.children
+
+    def _default_navigate(self, node_data: Dict[str, Any]) -> Optional[str]:
+        """Returns the default navigation for a node without an explicit one."""
+        if 'items' not in node_data:
+            # Leaf nodes get default_navigate.
+            return self._config.default_navigate
+        if node_data['items']:
+            # Branches use default_branch_navigate from the config, or 'limit' by default
+            navigate = self._config.default_branch_navigate or 'limit'
+            logger.debug("🔧 " + _("Set navigate='{navigate}' for branch {id}").format(navigate=navigate, id=node_data['id']))
+            return navigate
+        return None
+
+    # -- incremental edits ---------------------------------------------------
+    #
+    # Each edit patches the flattened graph in place: only the affected
+    # sibling groups are relinked and refrozen, the moved slice of
+    # ``flat_nodes`` is spliced, and the source menu tree (the ``items``
+    # lists of the original node dicts) is kept in sync, so the result is the
+    # same as flattening the edited tree from scratch. Listeners are told
+    # what kind of change was made (see ``NodeChange``).
+    #
+    # The source tree is the one given to flatten() and is edited in place,
+    # not copied (a deep copy costs about as much as the flatten itself).
+    # Without a tree that is ``MenuConfig.menu_tree``, so the edits are seen
+    # by every other user of the config; flatten a copy to keep it intact.
+
+    def add_listener(self, listener: Callable[[NodeChange, FlatNode], None]):
+        """Registers ``listener(change, node)``, called after every edit and flatten()."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[NodeChange, FlatNode], None]):
+        self._listeners.remove(listener)
+
+    def _notify(self, change: NodeChange, node: FlatNode):
+        for listener in self._listeners:
+            listener(change, node)
+
+    def insert_node(self, parent_id: str, index: int, node_data: Dict[str, Any]) -> FlatNode:
+        """Inserts a node definition (with its ``items``) as child ``index`` of a parent.
+
+        ``node_data`` itself is inserted into the parent's ``items`` of the
+        source tree, which is edited in place.
+        """
+        parent = self._require_node(parent_id)
+        new_ids = [item["id"] for item in self._iter_definitions(node_data)]
+        for node_id in new_ids:
+            if node_id in self.node_dict:
+                raise FlattenerError(_("Node {id} already exists").format(id=node_id))
+        if len(set(new_ids)) != len(new_ids):
+            raise FlattenerError(_("Duplicate node ids in the inserted subtree"))
+
+        node = self._create_node(node_data, self._payloads)
+        subtree = list(self._build_subtree(node, node_data.get("items"), self._payloads))
+        self._attach(parent, index, node, subtree)
+        for subtree_node in subtree:
+            self.node_dict[subtree_node.id] = subtree_node
+
+        logger.debug("➕ " + _("Inserted node {id} into {parent}").format(id=node.id, parent=parent.id))
+        self._notify(NodeChange.STRUCTURE, node)
+        return node
+
+    def delete_node(self, node_id: str) -> FlatNode:
+        """Deletes a node with its whole subtree and returns the detached node.
+
+        The node's definition is removed from its parent's ``items`` of the
+        source tree, which is edited in place.
+        """
+        node = self._require_node(node_id, allow_root=False)
+        subtree = self._detach(node)
+        for subtree_node in subtree:
+            del self.node_dict[subtree_node.id]
+            self._payloads.release(subtree_node.payload)
+
+        logger.debug("➖ " + _("Deleted node {id} ({count} nodes)").format(id=node_id, count=len(subtree)))
+        self._notify(NodeChange.STRUCTURE, node)
+        return node
+
+    def move_node(self, node_id: str, parent_id: str, index: int) -> FlatNode:
+        """Moves a node with its subtree to become child ``index`` of another parent.
+
+        The node's definition is moved between the ``items`` of the source
+        tree, which is edited in place.
+        """
+        node = self._require_node(node_id, allow_root=False)
+        parent = self._require_node(parent_id)
+        if any(subtree_node is parent for subtree_node in self._subtree(node)):
+            raise FlattenerError(_("Cannot move node {id} into its own subtree").format(id=node_id))
+
+        subtree = self._detach(node)
+        self._attach(parent, index, node, subtree)
+
+        logger.debug("↔️ " + _("Moved node {id} to {parent}").format(id=node_id, parent=parent.id))
+        self._notify(NodeChange.STRUCTURE, node)
+        return node
+
+    def update_node(self, node_id: str, changes: Dict[str, Any]) -> FlatNode:
+        """Changes fields of a node; a ``None`` value removes the field.
+
+        Children are edited with insert/delete/move, not through ``items``.
+        Listeners get one notification per kind of changed field. The
+        node's definition dict in the source tree is changed in place.
+        """
+        node = self._require_node(node_id, allow_root=False)
+        if "items" in changes:
+            raise FlattenerError(_("Use insert_node/delete_node to change the children of {id}").format(id=node_id))
+        new_id = changes.get("id", node_id)
+        if new_id != node_id and new_id in self.node_dict:
+            raise FlattenerError(_("Node {id} already exists").format(id=new_id))
+
+        original = node.original_node
+        for key, value in changes.items():
+            if value is None:
+                original.pop(key, None)
+            else:
+                original[key] = value
+
+        if new_id != node_id:
+            del self.node_dict[node_id]
+            self.node_dict[new_id] = node
+        self._payloads.release(node.payload)
+        node.reload_data(self._payloads.intern(original) if self._intern_payloads else None)
+        if "navigate" in changes:
+            # Also reopens or closes the cycle of the children
+            node.thaw()
+            self._refresh_navigate(node)
+            node.freeze()
+
+        logger.debug("✏️ " + _("Updated node {id}").format(id=new_id))
+        for change in {_CHANGE_OF_KEY.get(key, NodeChange.FIELD): None for key in changes}:
+            self._notify(change, node)
+        return node
+
+    def _require_node(self, node_id: str, allow_root: bool = True) -> BaseFlatNode:
+        node = self.node_dict.get(node_id)
+        if node is None:
+            raise FlattenerError(_("Node {id} not found").format(id=node_id))
+        if not allow_root and node is self.root_node:
+            raise FlattenerError(_("The root node cannot be edited"))
+        return node
+
+    def _attach(self, parent: BaseFlatNode, index: int, node: BaseFlatNode, subtree: List[BaseFlatNode]):
+        """Links ``node`` under ``parent`` and splices ``subtree`` into ``flat_nodes``."""
+        self._thaw_group(parent)
+        parent.insert_child(index, node)
+        index = node.sibling_index
+        parent.original_node.setdefault("items", []).insert(index, node.original_node)
+        self._refresh_navigate(parent)
+
+        # Pre-order: right after the parent, or after the previous sibling's subtree
+        if index == 0:
+            position = self.flat_nodes.index(parent) + 1
+        else:
+            previous = parent.children[index - 1]
+            position = self.flat_nodes.index(previous) + len(self._subtree(previous))
+        self.flat_nodes[position:position] = subtree
+        self._freeze_group(parent)
+
+    def _detach(self, node: BaseFlatNode) -> List[BaseFlatNode]:
+        """Unlinks ``node`` from its parent and cuts its subtree out of ``flat_nodes``."""
+        subtree = self._subtree(node)
+        position = self.flat_nodes.index(node)
+        del self.flat_nodes[position:position + len(subtree)]
+
+        parent = node.parent
+        self._thaw_group(parent)
+        node.thaw()
+        index = parent.remove_child(node)
+        del parent.original_node["items"][index]
+        self._refresh_navigate(parent)
+        node.freeze()
+        self._freeze_group(parent)
+        return subtree
+
+    def _refresh_navigate(self, node: BaseFlatNode):
+        """Re-applies the default navigation of a node whose children changed."""
+        if node is self.root_node:
+            return
+        navigate = node.original_node.get("navigate")
+        node.navigate = navigate if navigate is not None else self._default_navigate(node.original_node)
+
+    @staticmethod
+    def _thaw_group(parent: BaseFlatNode):
+        parent.thaw()
+        for child in parent.children:
+            child.thaw()
+
+    @staticmethod
+    def _freeze_group(parent: BaseFlatNode):
+        parent.freeze()
+        for child in parent.children:
+            child.freeze()
+
+    @staticmethod
+    def _subtree(node: BaseFlatNode) -> List[BaseFlatNode]:
+        """Nodes of the subtree rooted at ``node`` in pre-order."""
+        nodes = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            nodes.append(current)
+            stack.extend(reversed(current.children))
+        return nodes
+
+    @staticmethod
+    def _iter_definitions(node_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Node definitions of a subtree, without recursion."""
+        stack = [node_data]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(current.get("items") or ())
 
-            self.flat_nodes.append(flat_child)
-            self.node_dict[flat_child.id] = flat_child
-            
-            # Establish links through the navigation manager
-            flat_child.parent = parent
-            flat_child.prev_sibling = prev_sibling  # Uses the property
-            
-            if prev_sibling:
-                prev_sibling.next_sibling = flat_child  # Uses the property
-            
-            # Add to the parent's children
-            parent.children.append(flat_child)
-            if not parent.first_child:
-                parent.first_child = flat_child
-            parent.last_child = flat_child
-            
-            # Recursively process grandchildren
-            if 'items' in child_data and child_data["items"]:
-                self._process_children(flat_child, child_data["items"])
-            
-            prev_sibling = flat_child
-    
     def get_node_by_id(self, node_id: str) -> Optional[FlatNode]:
         """Returns a node by its ID."""
         return self.node_dict.get(node_id)
@@ -3,91 +3,401 @@
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set, TypeVar
 
 from jinja2 import (
-    Environment,
     FileSystemLoader,
     TemplateSyntaxError,
     UndefinedError,
     TemplateError,
 )
 
+from .c_layout import IdTypes, TableSize, storage_type, table_sizes
+from .common import diff_with_file, write_if_changed
 from .i18n import _
 from .menu_config import MenuConfig
+from .flat_node import FlatNode
+from .menu_flattener import NodeChange
 from .menucraft import MenuCraft
+from .render_record import changed_fields, sibling_groups
+from .sharding import SHARDED_TEMPLATES, shard_contexts, shard_key, shard_path
+from .string_pool import StringPool, c_literal, menu_strings
+from .template_context import LazyContext, TemplateAccess, TrackingEnvironment
+from .template_deps import TemplateDependencyGraph
+from .template_profile import BlockProfile, RenderProfiler
+from .unity_build import UNITY_HEADER, UNITY_SOURCE, amalgamate
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+#: Context names holding render records; an edit is traced to the record fields it changed.
+RECORD_CONTEXT_KEYS = frozenset({'records', 'leaf_records'})
+
+#: Context names whose values (or shard slices) hold nodes, so node attributes reach templates through them.
+NODE_CONTEXT_KEYS = frozenset(
+    name for key in {'menu', 'first', 'leafs'} | RECORD_CONTEXT_KEYS for name in (key, shard_key(key)))
+
+#: Node attributes a change can alter; changes not listed may alter any attribute.
+_CHANGED_NODE_ATTRIBUTES = {
+    NodeChange.TITLE: frozenset({'name'}),
+    NodeChange.CALLBACKS: frozenset(
+        name for name in dir(FlatNode)
+        if not name.startswith('_') and ('_cb' in name or 'callback' in name or 'function' in name)
+    ),
+}
+
+#: Context names the table size estimate reads.
+TABLE_SIZE_CONTEXT_KEYS = frozenset({'id_types', 'records', 'leaf_records', 'categories'})
+
+#: Template blocks listed in the ``--profile`` report.
+PROFILE_HOTTEST_BLOCKS = 15
+
 
 class MenuGenerator:
-    """Generates C source files from the Jinja2 templates."""
+    """Generates C source files from the Jinja2 templates.
+
+    The template context is lazy: an aggregate is computed when the first
+    template uses it. Every render records the context keys it used (and,
+    with ``profile``, the node attributes and the render time is reported,
+    along with the time of every include and loop, see :class:`RenderProfiler`).
+
+    Node edits made through the processor's flattener are collected, and
+    :meth:`regenerate` re-renders only the outputs whose templates depend on
+    what changed (see :class:`TemplateDependencyGraph`).
+
+    Outputs are streamed to disk with ``template.generate()`` (``stream``),
+    so peak memory does not grow with the output size, and a file whose
+    content did not change is left untouched.
+
+    When the menu has at least ``shard_min_nodes`` nodes, the templates of
+    :data:`SHARDED_TEMPLATES` are split into ``shard_count`` translation
+    units (see :mod:`.sharding`). With ``unity_build`` all outputs are
+    amalgamated into one source and one public header instead (see
+    :mod:`.unity_build`).
+
+    With ``check`` nothing is written: every output is rendered in memory and
+    compared with the file on disk, and :attr:`differences` collects the
+    unified diffs of the outputs that are out of date.
 
-    def __init__(self, config_json, processor: Optional[MenuCraft] = None):
+    An output whose template fails to render is logged and recorded in
+    :attr:`errors`, so a caller can fail instead of reporting success.
+    """
+
+    def __init__(self, config_json, processor: Optional[MenuCraft] = None, profile: bool = False,
+                 stream: bool = True, check: bool = False):
         self._processor = processor if processor is not None else MenuCraft(config_json)
         self._config: MenuConfig = self._processor.config
-        self._env = Environment(
+        self._profile = profile
+        self._stream = stream
+        self._check = check
+        self._differences: Dict[str, List[str]] = {}
+        self._errors: Dict[str, str] = {}
+        self._env = TrackingEnvironment(
             loader=FileSystemLoader(str(self._config.templates_path)),
             trim_blocks=True,
             lstrip_blocks=True,
-            extensions=['jinja2.ext.debug'],
+            extensions=['jinja2.ext.debug'] + ([RenderProfiler] if profile else []),
+            track_attributes=profile,
         )
+        # Menu text echoed into the generated C, e.g. in comments
+        self._env.filters['c_literal'] = c_literal
         self._files = self._config.generation_files
-        self._context = {}
+        self._context = LazyContext({})
+        self._access: Dict[str, TemplateAccess] = {}
+        self._graph: Optional[TemplateDependencyGraph] = None
+        self._pending_changes: Set[NodeChange] = set()
 
         self._generate()
+        self._processor.flattener.add_listener(self._on_node_change)
 
     def _generate(self):
         self._build_template_context()
         self._generate_code()
+        self._print_table_sizes()
+        self._print_string_pool()
+        if self._profile:
+            self._print_profile()
+
+    @property
+    def differences(self) -> Dict[str, List[str]]:
+        """With ``check``: unified diff lines per output that differs from the rendered content."""
+        return self._differences
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """Error message per output whose template failed to render on its last render."""
+        return self._errors
 
     def save_flatterned_menu(self, output_path: str | None = None):
         self._processor.save_flattern_json(output_path)
 
     def _build_template_context(self):
-        self._context = {
-            'menu': self._processor.menu,
-            'first': self._processor.first,
-            'leafs': self._processor.leafs,
-            'categories': self._processor.categories,
-            'functions': self._processor.functions,
-            'wrap_by_name_functions': self._config.wrap_by_name_functions,
-            'enable_node_names': self._config.enable_node_names,
-            'include_files': self._config.include_files,
-        }
+        processor = self._processor
+        config = self._config
+        context = self._context = LazyContext({
+            'menu': lambda: processor.menu,
+            'first': lambda: processor.first,
+            'leafs': lambda: processor.leafs,
+            'records': lambda: processor.records,
+            'leaf_records': lambda: processor.leaf_records,
+            'sibling_groups': lambda: sibling_groups(processor.records),
+            'categories': lambda: processor.categories,
+            'id_types': lambda: IdTypes(len(processor.records) + 1, len(processor.categories) + 1,
+                                        context['string_pool'].size),
+            'string_pool': lambda: StringPool(menu_strings(processor.records, config.enable_node_names)),
+            'functions': lambda: processor.functions,
+            'functions_by_category': lambda: processor.functions_by_category,
+            'callbacks_by_type': lambda: processor.callbacks_by_type,
+            'callbacks_by_category': lambda: processor.callback_summary_by_category,
+            'wrap_by_name_functions': lambda: config.wrap_by_name_functions,
+            'enable_node_names': lambda: config.enable_node_names,
+            'include_files': lambda: config.include_files,
+        })
+
+    @property
+    def dependency_graph(self) -> TemplateDependencyGraph:
+        """Static inputs of every configured template (built on first use)."""
+        if self._graph is None:
+            self._graph = TemplateDependencyGraph(self._env, [str(name) for name in self._files or {}])
+        return self._graph
+
+    def _on_node_change(self, change: NodeChange, node):
+        self._pending_changes.add(change)
+
+    def regenerate(self) -> List[str]:
+        """Re-renders the outputs affected by the node edits since the last render.
+
+        Returns the names of the re-rendered templates.
+        """
+        if not self._pending_changes:
+            return []
+
+        # Context values that changed: the aggregates are rebuilt on demand
+        previous = self._context
+        self._build_template_context()
+        changed_keys = set()
+        changed_attributes = set()
+        for key in previous.computed:
+            old, new = previous[key], self._context[key]
+            if old is new:
+                continue
+            if key in RECORD_CONTEXT_KEYS:
+                fields = changed_fields(old, new)
+                if fields is not None:
+                    changed_attributes |= fields
+                    continue
+            if old != new:
+                changed_keys.add(key)
+        # A sharded template reads its slice of the mapping
+        changed_keys |= {shard_key(key) for key in changed_keys}
+
+        for change in self._pending_changes:
+            attributes = _CHANGED_NODE_ATTRIBUTES.get(change)
+            if attributes is None:
+                changed_attributes = None
+                break
+            changed_attributes |= attributes
+        self._pending_changes.clear()
+
+        affected = self.dependency_graph.affected(changed_keys, changed_attributes, NODE_CONTEXT_KEYS)
+        if self._config.unity_build:
+            if affected:
+                self._generate_unity()
+        else:
+            for template in affected:
+                self._render(template, self._files[template])
+        logger.info("🔁 " + _("Re-rendered {count} of {total} templates").format(
+            count=len(affected), total=len(self._files or ())))
+        return affected
+
+    @property
+    def template_access(self) -> Dict[str, TemplateAccess]:
+        """Per template: the context keys (and node attributes) its last render used."""
+        return self._access
+
+    @property
+    def block_profile(self) -> List[BlockProfile]:
+        """Timed includes and loops of the rendered templates, hottest first (``profile`` only)."""
+        profiler = self._env.extensions.get(RenderProfiler.identifier)
+        return profiler.hottest() if profiler is not None else []
+
+    @property
+    def table_sizes(self) -> List[TableSize]:
+        """Estimated sizes of the generated id-indexed tables with enum and with compact ids."""
+        return table_sizes(self._context['id_types'], self._context['records'], self._context['leaf_records'],
+                           self._context['categories'], self._config.enable_node_names)
+
+    def _print_table_sizes(self):
+        """Logs the storage of the ids and the memory it saves in the tables.
+
+        Logged with ``profile``, or when the rendered templates already
+        resolved the context keys it reads: the log never builds aggregates.
+        """
+        if not (self._profile or TABLE_SIZE_CONTEXT_KEYS <= self._context.computed):
+            return
+        tables = self.table_sizes
+        id_types = self._context['id_types']
+        logger.info("📦 " + _("menu_id_t: {id_type}, menu_category_t: {category_type}; "
+                             "the tables save {flash} B of flash and {ram} B of RAM").format(
+            id_type=id_types.id,
+            category_type=id_types.category,
+            flash=sum(table.saved for table in tables if table.memory == "flash"),
+            ram=sum(table.saved for table in tables if table.memory == "RAM")))
+        for table in tables:
+            logger.debug("  " + _("{table}[{entries}] ({memory}): {compact} B instead of {enum} B").format(
+                table=table.name, entries=table.entries, memory=table.memory,
+                compact=table.compact_size, enum=table.enum_size))
+
+    def _print_string_pool(self):
+        """Logs the size of the string pool, like :meth:`_print_table_sizes` only if it was built."""
+        if not (self._profile or 'string_pool' in self._context.computed):
+            return
+        pool = self._context['string_pool']
+        logger.info("🔤 " + _("String pool: {count} distinct of {references} strings, {size} B instead of "
+                             "{referenced} B, offsets: {offset_type}").format(
+            count=len(pool), references=pool.references, size=pool.size,
+            referenced=pool.referenced_size, offset_type=storage_type(pool.size)[0]))
+
+    def _print_profile(self):
+        """Logs render times and what every template used from the context."""
+        logger.info("\n📈 " + _("Template profile:"))
+        for access in sorted(self._access.values(), key=lambda item: item.time, reverse=True):
+            logger.info("  " + _("{template}: {time:.1f} ms, context: {keys}, node attributes: {attributes}").format(
+                template=access.template,
+                time=access.time * 1000,
+                keys=", ".join(sorted(access.context_keys)) or "-",
+                attributes=", ".join(sorted(access.node_attributes)) or "-"))
+        blocks = self.block_profile[:PROFILE_HOTTEST_BLOCKS]
+        if blocks:
+            logger.info("\n🔥 " + _("Hottest template blocks:"))
+            for block in blocks:
+                logger.info("  " + _("{template}:{line} {kind}: {time}, {calls} calls, {iterations} iterations | {source}").format(
+                    template=block.template,
+                    line=block.line,
+                    kind=block.kind,
+                    time=f"{block.time * 1000:.1f} ms" if block.timed else "-",
+                    calls=block.calls,
+                    iterations=block.iterations,
+                    source=block.source))
+        unused = set(self._context) - set().union(*(access.context_keys for access in self._access.values()))
+        if unused:
+            logger.info("  " + _("Context keys used by no template: {keys}").format(keys=", ".join(sorted(unused))))
 
     def _generate_code(self):
+        if self._config.unity_build:
+            self._generate_unity()
+            return
         if self._files is not None:
             for template, output in self._files.items():
                 logger.info(_("Generate: {template} => {output}").format(
                     template=template, output=output))
-                self._generate_file(template, output, self._context)
+                self._render(template, output)
+
+    def _generate_unity(self):
+        """Renders all templates in memory and writes the unity build source and header."""
+        rendered = []
+        for template, output in (self._files or {}).items():
+            logger.info(_("Generate: {template} => {output}").format(template=template, output=UNITY_SOURCE))
+            spec = SHARDED_TEMPLATES.get(str(template))
+            context = shard_contexts(self._context, spec, 1)[0] if spec is not None else self._context
+            text = self._render_template(template, context, output, "".join)
+            if text is None:
+                return
+            rendered.append((str(output), text))
+
+        source, header = amalgamate(rendered)
+        output_directory = Path(self._config.output_directory)
+        for path, text in ((output_directory / UNITY_SOURCE, source),
+                           (output_directory / "include" / UNITY_HEADER, header)):
+            self._save([text], path)
+
+    @property
+    def shard_count(self) -> int:
+        """Translation units the sharded templates are split into for this menu."""
+        if self._config.unity_build or len(self._processor.menu) < self._config.shard_min_nodes:
+            return 1
+        return max(1, self._config.shard_count)
+
+    def _render(self, template_name: str, output_path: str | Path):
+        """Generates the output of a template, split into shards if it is sharded."""
+        spec = SHARDED_TEMPLATES.get(str(template_name))
+        if spec is None:
+            self._generate_file(template_name, output_path, self._context)
+            return
+
+        contexts = shard_contexts(self._context, spec, self.shard_count)
+        for index, context in enumerate(contexts):
+            self._generate_file(template_name, shard_path(output_path, index), context)
+
+        # Shards left over from a run with more shards
+        index = len(contexts)
+        while shard_path(output_path, index).exists():
+            stale = shard_path(output_path, index)
+            if self._check:
+                self._differences[str(stale)] = diff_with_file(None, stale)
+            else:
+                os.remove(stale)
+                logger.info("🗑️ " + _("Removed stale shard {path}").format(path=stale))
+            index += 1
 
     def _generate_file(self, template_name: str, output_path: str | Path, template_data):
         """Generates a specific file."""
         logger.info(_("Generate from {template} to {output}").format(
             template=template_name, output=output_path))
 
-        try:
-            # Load the template
-            template = self._env.get_template(str(template_name))
+        self._render_template(template_name, template_data, output_path,
+                              lambda chunks: self._save(chunks, output_path))
 
-            # Render
-            content = template.render(**template_data)
+    def _save(self, chunks: Iterable[str], output_path: str | Path) -> bool:
+        """Writes an output if its content changed; with ``check``, only compares it.
 
-            # Save
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        Returns whether the file differed from the rendered content.
+        """
+        if self._check:
+            diff = diff_with_file("".join(chunks), output_path)
+            if diff:
+                self._differences[str(output_path)] = diff
+                logger.info(f"❗ {_('Differs {path}').format(path=output_path)}")
+            else:
+                logger.info(f"✅ {_('Up to date {path}').format(path=output_path)}")
+            return bool(diff)
 
+        written = write_if_changed(chunks, output_path)
+        if written:
             logger.info(f"✅ {_('Generated {path}').format(path=output_path)}")
+        else:
+            logger.info(f"✅ {_('Unchanged {path}').format(path=output_path)}")
+        return written
+
+    def _render_template(self, template_name: str, template_data, output_path: str | Path,
+                         consume: Callable[[Iterable[str]], T]) -> Optional[T]:
+        """Renders a template and passes its text chunks to ``consume``.
+
+        Returns what ``consume`` returned, or ``None`` if rendering failed
+        (the error is logged and recorded in :attr:`errors`).
+        """
+        try:
+            # Load the template
+            template = self._env.get_template(str(template_name))
+
+            # Render and consume; context names are resolved from the lazy context.
+            # ``generate()`` is consumed inside the tracking block.
+            with self._env.tracking(str(template_name), template_data) as access:
+                chunks = template.generate() if self._stream else [template.render()]
+                result = consume(chunks)
+            self._access[str(template_name)] = access
+            self._errors.pop(str(output_path), None)
+            return result
 
         except TemplateSyntaxError as e:
-            logger.error(f"❌ {_('Template Syntax Error: {error}').format(error=str(e))}")
+            message = _('Template Syntax Error: {error}').format(error=str(e))
         except UndefinedError as e:
-            logger.error(f"❌ {_('Undefined Variable Error: {error}').format(error=str(e))}")
+            message = _('Undefined Variable Error: {error}').format(error=str(e))
         except TemplateError as e:
-            logger.error(f"❌ {_('General Template Error: {error}').format(error=str(e))}")
+            message = _('General Template Error: {error}').format(error=str(e))
         except Exception as e:
-            logger.error(f"❌ {_('Error generating {path} file: {error}').format(
-                path=output_path, error=e)}")
+            message = _('Error generating {path} file: {error}').format(path=output_path, error=e)
+        logger.error(f"❌ {message}")
+        self._errors[str(output_path)] = message
+        return None
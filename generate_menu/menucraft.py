@@ -1,13 +1,15 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import textwrap
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 from .flat_node import FlatNode
 from .menu_validator import MenuValidator
 from .menu_config import MenuConfig, ConfigError
-from .menu_flattener import MenuFlattener, FlattenerError
+from .menu_flattener import MenuFlattener, FlattenerError, NodeChange
 from .menu_data import ControlType
 from .menu_data_aggregator import MenuDataAggregator
+from .render_record import RenderRecord
 from .i18n import _
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,49 @@ class ProcessorError(Exception):
         super().__init__(message)
 
 
+def flat_node_record(node: FlatNode) -> Dict[str, Any]:
+    """JSON record of one node in the flat menu file."""
+    return {
+        "id": node.id,
+        "name": node.name,
+        "type": node.type,
+        "role": node.role,
+        "parent": node.parent.id if node.parent else None,
+        "prev_sibling": node.prev_sibling.id if node.prev_sibling else None,
+        "next_sibling": node.next_sibling.id if node.next_sibling else None,
+        "children": [child.id for child in node.children],
+        "is_leaf": node.is_leaf,
+        "is_branch": node.is_branch,
+        "controls": [
+            {
+                "type": control["type"].value,
+                "purpose": control["purpose"],
+                "navigate": control["navigate"].value,
+                "required": control["required"]
+            }
+            for control in getattr(node, '_controls', [])
+        ]
+    }
+
+
+def iter_flat_json(nodes: Iterable[FlatNode]) -> Iterator[str]:
+    """Yields the flat menu JSON document in chunks, one node record at a time.
+
+    ``nodes`` may be a generator such as ``MenuFlattener.iter_flatten()``, so
+    the document is never held in memory as a whole. The text is identical
+    to ``json.dump({"nodes": [...]}, indent=2, ensure_ascii=False)``.
+    """
+    opened = False
+    for node in nodes:
+        if node.id == 'root':
+            continue
+        record = json.dumps(flat_node_record(node), indent=2, ensure_ascii=False)
+        yield ('{\n  "nodes": [\n' if not opened else ",\n") + textwrap.indent(record, "    ")
+        opened = True
+
+    yield "\n  ]\n}" if opened else '{\n  "nodes": []\n}'
+
+
 class MenuCraft:
     """Orchestrates the menu pipeline: load → validate → flatten.
 
@@ -47,10 +92,19 @@ class MenuCraft:
             self._flattener = MenuFlattener(self._config)
             self._flat_nodes = self._flattener.flatten()
             self._aggregator = MenuDataAggregator(self._flat_nodes)
+            # Node edits made through the flattener refresh only the dependent aggregates
+            self._flattener.add_listener(self._on_node_change)
 
             # Debug information about controls
             self._print_control_summary()
 
+    def _on_node_change(self, change: NodeChange, node: FlatNode):
+        if change is NodeChange.STRUCTURE:
+            self._flat_nodes = self._flattener.flat_nodes
+            self._aggregator.invalidate(change, self._flat_nodes)
+        else:
+            self._aggregator.invalidate(change, node=node)
+
     def _print_control_summary(self):
         """Prints a control summary for debugging."""
         logger.debug("\n📊 " + _("Control summary:"))
@@ -63,41 +117,20 @@ class MenuCraft:
         logger.debug("")
 
     def save_flattern_json(self, file_name: str | None = None):
-        """Saves the flat menu representation to JSON (optional)."""
+        """Saves the flat menu representation to JSON (optional).
+
+        The document is streamed node by node from the flat nodes already
+        held, which the flattener keeps in sync with the edits (see
+        ``iter_flat_json``), so the text is never held in memory as a whole.
+        """
         if file_name is None and self._config.flatten:
             file_name = self._config.flatten
 
         if file_name:
-            flat_data = {
-                "nodes": [
-                    {
-                        "id": node.id,
-                        "name": node.name,
-                        "type": node.type,
-                        "role": node.role,
-                        "parent": node.parent.id if node.parent else None,
-                        "prev_sibling": node.prev_sibling.id if node.prev_sibling else None,
-                        "next_sibling": node.next_sibling.id if node.next_sibling else None,
-                        "children": [child.id for child in node.children],
-                        "is_leaf": node.is_leaf,
-                        "is_branch": node.is_branch,
-                        "controls": [
-                            {
-                                "type": control["type"].value,
-                                "purpose": control["purpose"],
-                                "navigate": control["navigate"].value,
-                                "required": control["required"]
-                            }
-                            for control in getattr(node, '_controls', [])
-                        ]
-                    }
-                    for node in self._flat_nodes if node.id != 'root'
-                ]
-            }
-
             try:
                 with open(file_name, 'w', encoding='utf-8') as f:
-                    json.dump(flat_data, f, indent=2, ensure_ascii=False)
+                    for chunk in iter_flat_json(self._flat_nodes):
+                        f.write(chunk)
                 logger.info("✅ " + _("Flat menu saved to {path}").format(path=file_name))
             except Exception as e:
                 logger.error("❌ " + _("Error saving flat menu: {error}").format(error=e))
@@ -111,6 +144,11 @@ class MenuCraft:
         """Access to the aggregated menu data."""
         return self._aggregator
 
+    @property
+    def flattener(self) -> MenuFlattener:
+        """The flattener; its edit operations keep :attr:`data` up to date."""
+        return self._flattener
+
     # ------------------------------------------------------------------
     # Aggregation API (delegated to MenuDataAggregator, memoized there).
     # These accessors keep the public interface used by the CLI, the
@@ -153,7 +191,7 @@ class MenuCraft:
         return self._aggregator.callback_nodes
 
     @property
-    def required_functions(self) -> Dict[str, List[Dict[str, Any]]]:
+    def required_functions(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by category, marking the required ones."""
         return self._aggregator.required_functions
 
@@ -168,12 +206,12 @@ class MenuCraft:
         return self._aggregator.auto_generated_functions
 
     @property
-    def functions_by_event_type(self) -> Dict[str, List[Dict[str, Any]]]:
+    def functions_by_event_type(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by event type."""
         return self._aggregator.functions_by_event_type
 
     @property
-    def functions_by_navigation(self) -> Dict[str, List[Dict[str, Any]]]:
+    def functions_by_navigation(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by navigation type."""
         return self._aggregator.functions_by_navigation
 
@@ -182,40 +220,60 @@ class MenuCraft:
         """All nodes with custom callbacks."""
         return self._aggregator.nodes_with_custom_callbacks
 
+    @property
+    def functions_by_category(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+        """Functions grouped by category name."""
+        return self._aggregator.functions_by_category
+
+    @property
+    def callbacks_by_type(self) -> Dict[str, Dict[str, str]]:
+        """Custom callback names by callback type, then by node id."""
+        return self._aggregator.callbacks_by_type
+
+    @property
+    def records(self) -> Dict[str, RenderRecord]:
+        """Precomputed template values of every node (excluding root)."""
+        return self._aggregator.records
+
+    @property
+    def leaf_records(self) -> Dict[str, RenderRecord]:
+        """Precomputed template values of the leaf nodes."""
+        return self._aggregator.leaf_records
+
     def get_callbacks_by_type(self, callback_type: str) -> Dict[str, str]:
         """Get callbacks of a specific type."""
         return self._aggregator.get_callbacks_by_type(callback_type)
 
-    def get_functions_by_category(self, category_name: str) -> List[Dict[str, Any]]:
+    def get_functions_by_category(self, category_name: str) -> Tuple[Dict[str, Any], ...]:
         """All functions for the given category."""
         return self._aggregator.get_functions_by_category(category_name)
 
-    def get_callbacks_by_category(self, category_name: str) -> Dict[str, List[Dict[str, Any]]]:
+    def get_callbacks_by_category(self, category_name: str) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """All callback functions for the given category."""
         return self._aggregator.get_callbacks_by_category(category_name)
 
     @property
-    def detailed_callback_infos(self) -> Dict[str, List[Dict[str, Any]]]:
+    def detailed_callback_infos(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Detailed information about all callback functions, grouped by type."""
         return self._aggregator.detailed_callback_infos
 
     @property
-    def callback_summary_by_category(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    def callback_summary_by_category(self) -> Dict[str, Dict[str, Tuple[Dict[str, Any], ...]]]:
         """Callback function summary by category."""
         return self._aggregator.callback_summary_by_category
 
     @property
-    def functions_by_type_role(self) -> Dict[str, List[Dict[str, Any]]]:
+    def functions_by_type_role(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by the type_role combination."""
         return self._aggregator.functions_by_type_role
 
     @property
-    def functions_by_type(self) -> Dict[str, List[Dict[str, Any]]]:
+    def functions_by_type(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by data type."""
         return self._aggregator.functions_by_type
 
     @property
-    def functions_by_role(self) -> Dict[str, List[Dict[str, Any]]]:
+    def functions_by_role(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
         """Functions grouped by role."""
         return self._aggregator.functions_by_role
 
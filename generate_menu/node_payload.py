@@ -0,0 +1,180 @@
+"""Interning of identical node payloads.
+
+Large generated menus repeat the same leaf shape (type, role, limits,
+values/factors, step, controls, callbacks) many times. :class:`PayloadTable`
+maps every distinct shape to one :class:`NodePayload` that holds the data,
+callback and control managers of that shape, so a node keeps only its id,
+title and links. The ``node_id`` fields that the managers report are filled
+in by the node itself (see ``BaseFlatNode``).
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from .menu_data import MenuData
+from .managers.node_data_manager import NodeDataManager
+from .managers.node_control_manager import NodeControlManager
+from .managers.callback_manager import CallbackManager
+
+# Node keys that carry data or callbacks. A node without any of them (a plain
+# branch or the root) has nothing for its data and callback managers to hold.
+PAYLOAD_KEYS = frozenset((
+    "type", "role", "min", "max", "default", "default_idx", "factors", "values", "step",
+    *CallbackManager.ALL_CALLBACK_TYPES,
+))
+
+# Keys that belong to the node itself rather than to its shape.
+_NODE_OWN_KEYS = frozenset(("id", "title", "items"))
+
+
+def has_payload(node_data: Dict[str, Any]) -> bool:
+    """Whether the node definition has any data or callback keys."""
+    return not PAYLOAD_KEYS.isdisjoint(node_data)
+
+
+def build_callback_managers(
+    node_data: Dict[str, Any], data_manager: NodeDataManager, menu_data: MenuData,
+    node_id: Optional[str]
+) -> Tuple[CallbackManager, Optional[NodeControlManager]]:
+    """Creates the callback manager and, for typed nodes, the control manager.
+
+    Both are built together because the control manager fills in the
+    automatic click/position functions of the callback manager.
+    """
+    callback_manager = CallbackManager(
+        node_data,
+        data_manager.type,
+        data_manager.role,
+        data_manager.category,
+        menu_data
+    )
+    if data_manager.type is None or data_manager.role is None:
+        return callback_manager, None
+
+    control_manager = NodeControlManager(
+        node_id=node_id,
+        node_type=data_manager.type,
+        node_role=data_manager.role,
+        node_c_type=data_manager.c_type,
+        original_node=node_data,
+        menu_data=menu_data,
+        callback_manager=callback_manager,
+        # The node's own setting, not the default applied by the flattener
+        node_navigate=node_data.get("navigate")
+    )
+    return callback_manager, control_manager
+
+
+def _hashable(value: Any) -> Any:
+    """Converts a JSON-like value into a hashable one."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    return value
+
+
+class NodePayload:
+    """Shared, read-only data and control record of one node shape.
+
+    Managers are built on first access, once per shape. Their ``node_id``
+    fields are ``None``: the shape does not belong to a single node.
+    """
+
+    __slots__ = (
+        "key", "fields", "uses", "_menu_data",
+        "_data_manager", "_callback_manager", "_control_manager", "_function_infos",
+    )
+
+    def __init__(self, key: Tuple, fields: Dict[str, Any], menu_data: MenuData):
+        self.key = key
+        self.fields = fields
+        self.uses = 0
+        self._menu_data = menu_data
+        self._data_manager: Optional[NodeDataManager] = None
+        self._callback_manager: Optional[CallbackManager] = None
+        self._control_manager: Optional[NodeControlManager] = None
+        self._function_infos: Optional[Tuple[Dict[str, Any], ...]] = None
+
+    @property
+    def data_manager(self) -> NodeDataManager:
+        if self._data_manager is None:
+            self._data_manager = NodeDataManager(self.fields, self._menu_data)
+        return self._data_manager
+
+    @property
+    def callback_manager(self) -> CallbackManager:
+        if self._callback_manager is None:
+            self._build_callback_managers()
+        return self._callback_manager
+
+    @property
+    def control_manager(self) -> Optional[NodeControlManager]:
+        if self._callback_manager is None:
+            self._build_callback_managers()
+        return self._control_manager
+
+    def _build_callback_managers(self):
+        self._callback_manager, self._control_manager = build_callback_managers(
+            self.fields, self.data_manager, self._menu_data, None)
+
+    @property
+    def function_infos(self) -> Tuple[Dict[str, Any], ...]:
+        """Function infos of the shape, built once (``node_id`` is ``None``)."""
+        if self._function_infos is None:
+            control_manager = self.control_manager
+            self._function_infos = control_manager.function_table if control_manager else ()
+        return self._function_infos
+
+    def __repr__(self):
+        return f"NodePayload({self.fields.get('type')}_{self.fields.get('role')}, uses={self.uses})"
+
+
+class PayloadTable:
+    """Maps node definitions to shared :class:`NodePayload` records by shape."""
+
+    __slots__ = ("_menu_data", "_payloads", "_nodes")
+
+    def __init__(self, menu_data: MenuData):
+        self._menu_data = menu_data
+        self._payloads: Dict[Tuple, NodePayload] = {}
+        self._nodes = 0
+
+    def intern(self, node_data: Dict[str, Any]) -> Optional[NodePayload]:
+        """Returns the payload for the shape of ``node_data`` (``None`` without payload)."""
+        if not has_payload(node_data):
+            return None
+
+        fields = {k: v for k, v in node_data.items() if k not in _NODE_OWN_KEYS}
+        key = _hashable(fields)
+        payload = self._payloads.get(key)
+        if payload is None:
+            payload = self._payloads[key] = NodePayload(key, fields, self._menu_data)
+        payload.uses += 1
+        self._nodes += 1
+        return payload
+
+    def release(self, payload: Optional[NodePayload]):
+        """Drops one use of ``payload``; the shape is forgotten after its last use."""
+        if payload is None:
+            return
+        payload.uses -= 1
+        self._nodes -= 1
+        if payload.uses <= 0:
+            self._payloads.pop(payload.key, None)
+
+    def clear(self):
+        self._payloads.clear()
+        self._nodes = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Interning statistics: nodes with payload, distinct shapes, dedup ratio."""
+        shapes = len(self._payloads)
+        return {
+            "nodes": self._nodes,
+            "shapes": shapes,
+            "dedup_ratio": self._nodes / shapes if shapes else 1.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._payloads)
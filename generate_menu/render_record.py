@@ -0,0 +1,164 @@
+"""Flat per-node records read by the C templates.
+
+The data templates emit one table row per node and used to derive every
+cell in the template: ``item_id.upper()``, the link targets' enum names,
+the category enum and six ``effective_*_cb_name`` lookups (each going
+through the callback manager and building a fresh info dict). A
+:class:`RenderRecord` holds those values precomputed once per node, as the
+strings the C initializers need, so the templates only read attributes.
+"""
+
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+from .base_flat_node import BaseFlatNode
+from .managers.callback_manager import CallbackManager
+
+#: Enum value written for a missing link (no parent, child or sibling).
+NO_LINK = "MENU_ID_COUNT"
+
+#: C initializer of an unset callback.
+NO_CALLBACK = "NULL"
+
+
+def id_enum(node_id: str) -> str:
+    """C enum name of a node id (``hi_delay`` → ``MENU_ID_HI_DELAY``)."""
+    return f"MENU_ID_{node_id.upper()}"
+
+
+def _link_enum(node: Optional[BaseFlatNode]) -> str:
+    return id_enum(node.id) if node is not None else NO_LINK
+
+
+class RenderRecord:
+    """Precomputed template values of one node.
+
+    ``enum``, ``parent``, ``child``, ``prev`` and ``next`` are ``menu_id_t``
+    enum names (:data:`NO_LINK` for a missing link), ``position`` is the
+    index among the siblings, ``category_enum`` is a
+    ``menu_category_t`` name and the ``*_cb`` fields are C initializers
+    (the function name, or :data:`NO_CALLBACK`). The data fields are copied
+    from the node as they are.
+    """
+
+    __slots__ = (
+        "id", "enum", "title", "parent", "child", "prev", "next", "position", "is_leaf", "tree_type",
+        "type", "role", "category_name", "category_enum",
+        "click_cb", "position_cb", "double_click_cb", "long_click_cb", "event_cb", "draw_value_cb",
+        "c_type", "c_str_factors", "c_str_values", "values", "default", "step", "min", "max",
+        "factors_default_idx", "fixed_count", "values_default_idx", "values_count",
+    )
+
+    def __init__(self, node: BaseFlatNode):
+        self.id = node.id
+        self.enum = id_enum(node.id)
+        self.title = node.name
+        self.parent = _link_enum(node.parent)
+        self.child = _link_enum(node.first_child)
+        self.prev = _link_enum(node.prev_sibling)
+        self.next = _link_enum(node.next_sibling)
+        self.position = node.sibling_index
+        self.is_leaf = node.is_leaf
+        self.tree_type = "LEAF" if self.is_leaf else "BRANCH"
+
+        self.type = node.type
+        self.role = node.role
+        self.category_name = node.category_name
+        self.category_enum = (f"MENU_CATEGORY_{self.category_name.upper()}"
+                              if self.category_name is not None else None)
+
+        # One pass over the callback infos instead of an info lookup per type
+        infos = node.all_callback_infos
+        for cb_type in CallbackManager.ALL_CALLBACK_TYPES:
+            info = infos.get(cb_type)
+            setattr(self, cb_type, info["name"] if info and info.get("name") else NO_CALLBACK)
+
+        if self.is_leaf:
+            self.c_type = node.c_type
+            self.c_str_factors = node.c_str_factors
+            self.c_str_values = node.c_str_values
+            self.values = tuple(node.values) if node.values is not None else None
+            self.default = node.default
+            self.step = node.step
+            self.min = node.min
+            self.max = node.max
+            self.factors_default_idx = node.factors_default_idx
+            self.fixed_count = node.fixed_count
+            self.values_default_idx = node.values_default_idx
+            self.values_count = node.values_count
+        else:
+            self.c_type = self.c_str_factors = self.c_str_values = self.values = None
+            self.default = self.step = self.min = self.max = None
+            self.factors_default_idx = self.fixed_count = None
+            self.values_default_idx = self.values_count = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RenderRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"RenderRecord({self.id}, {self.enum}, {self.tree_type})"
+
+
+def changed_fields(old: Mapping[str, RenderRecord], new: Mapping[str, RenderRecord]) -> Optional[Set[str]]:
+    """Record fields that differ between two record sets with the same nodes.
+
+    Returns ``None`` when the node ids or their order differ.
+    """
+    if list(old) != list(new):
+        return None
+    changed: Set[str] = set()
+    for node_id, record in new.items():
+        previous = old[node_id]
+        if previous is not record:
+            changed.update(name for name in RenderRecord.__slots__
+                           if getattr(previous, name) != getattr(record, name))
+    return changed
+
+
+class SiblingGroup:
+    """The children of one node as a slice of the generated sibling array.
+
+    ``offset`` is the index of the first child in ``s_menu_siblings``,
+    ``ids`` the children's enum names in order and ``cyclic`` whether
+    navigation wraps around from the last child to the first.
+    """
+
+    __slots__ = ("offset", "ids", "cyclic")
+
+    def __init__(self, offset: int, ids: Tuple[str, ...], cyclic: bool):
+        self.offset = offset
+        self.ids = ids
+        self.cyclic = cyclic
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SiblingGroup):
+            return NotImplemented
+        return (self.offset, self.ids, self.cyclic) == (other.offset, other.ids, other.cyclic)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"SiblingGroup({self.offset}, {len(self.ids)} ids, cyclic={self.cyclic})"
+
+
+def sibling_groups(records: Mapping[str, RenderRecord]) -> Dict[str, SiblingGroup]:
+    """Children of every branch (root included), by the parent's enum name.
+
+    The groups are laid out back to back in the order of their parents'
+    first child, so together they form the sibling array. A group is
+    cyclic when the flattener closed its first child's ``prev`` link.
+    """
+    children: Dict[str, List[RenderRecord]] = {}
+    for record in records.values():
+        children.setdefault(record.parent, []).append(record)
+
+    groups: Dict[str, SiblingGroup] = {}
+    offset = 0
+    for parent, group in children.items():
+        group.sort(key=lambda record: record.position)
+        groups[parent] = SiblingGroup(offset, tuple(record.enum for record in group), group[0].prev != NO_LINK)
+        offset += len(group)
+    return groups
@@ -0,0 +1,110 @@
+"""Splitting of large generated C sources into several translation units.
+
+For big menus a single ``menu_edit.c`` or ``menu_data_config.c`` becomes the
+longest compile job of the firmware build and serializes ``make -j``. A
+sharded template is rendered once per shard: each render sees the items of
+one contiguous slice of a context mapping as ``shard_<key>`` (plus ``shard``
+and ``shard_count``), and shard 0 also emits the one-time definitions
+(accessors, id-indexed tables). Shard 0 keeps the configured output name,
+shard ``k`` is written next to it as ``<stem>_<k><suffix>``.
+
+The headers and accessors stay the same. The id-indexed tables
+(``s_menu_config``, ``s_menu_tree``...) remain whole: an accessor returns
+one contiguous array, which C cannot assemble from several translation
+units, so only what the tables reference (factor and value arrays) and the
+generated handlers are distributed.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+#: Purposes of the functions generated by ``edit.c.jinja``.
+EDIT_PURPOSES = frozenset({"change_index", "change_factor_index", "change_value"})
+
+
+class ShardSpec:
+    """How a template is split: the context mapping and the items that count."""
+
+    __slots__ = ("key", "select")
+
+    def __init__(self, key: str, select: Callable[[Any], bool]):
+        self.key = key
+        self.select = select
+
+    @property
+    def shard_key(self) -> str:
+        """Name under which a render sees its slice of :attr:`key`."""
+        return shard_key(self.key)
+
+
+#: Templates that can be split, by template name.
+SHARDED_TEMPLATES: Dict[str, ShardSpec] = {
+    "edit.c.jinja": ShardSpec("functions", lambda info: info.get("purpose") in EDIT_PURPOSES),
+    "draw.c.jinja": ShardSpec("functions", lambda info: info.get("event_type") == "draw_value"),
+    "data_config.c.jinja": ShardSpec(
+        "leaf_records",
+        lambda record: record.c_str_factors is not None or record.c_str_values is not None),
+}
+
+
+def shard_key(key: str) -> str:
+    """Context name of the per-shard slice of ``key``."""
+    return f"shard_{key}"
+
+
+def shard_path(path, index: int) -> Path:
+    """Output of shard ``index``: the configured path for shard 0, ``<stem>_<index>`` otherwise."""
+    path = Path(path)
+    return path if index == 0 else path.with_name(f"{path.stem}_{index}{path.suffix}")
+
+
+def split(items: Mapping[str, Any], count: int, select: Optional[Callable[[Any], bool]] = None) -> List[Dict[str, Any]]:
+    """Splits the selected items into at most ``count`` contiguous, balanced slices.
+
+    There is always at least one slice, and no slice is empty unless there
+    is nothing to select.
+    """
+    selected = [(key, value) for key, value in items.items() if select is None or select(value)]
+    count = max(1, min(count, len(selected)))
+    size, extra = divmod(len(selected), count)
+    slices, start = [], 0
+    for index in range(count):
+        end = start + size + (1 if index < extra else 0)
+        slices.append(dict(selected[start:end]))
+        start = end
+    return slices
+
+
+class ShardContext(Mapping):
+    """A template context with the shard variables laid over it."""
+
+    def __init__(self, base: Mapping[str, Any], shard: Dict[str, Any]):
+        self._base = base
+        self._shard = shard
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._shard:
+            return self._shard[key]
+        return self._base[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shard or key in self._base
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._shard
+        yield from (key for key in self._base if key not in self._shard)
+
+    def __len__(self) -> int:
+        return len(self._shard) + sum(1 for key in self._base if key not in self._shard)
+
+
+def shard_contexts(base: Mapping[str, Any], spec: ShardSpec, count: int) -> List[ShardContext]:
+    """One context per shard of a sharded template.
+
+    With a single shard the whole mapping is passed, so the output is the
+    same as that of an unsharded render.
+    """
+    items = base[spec.key]
+    slices = split(items, count, spec.select) if count > 1 else [items]
+    return [ShardContext(base, {"shard": index, "shard_count": len(slices), spec.shard_key: items_slice})
+            for index, items_slice in enumerate(slices)]
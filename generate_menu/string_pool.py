@@ -0,0 +1,115 @@
+"""Deduplicated pool of the menu strings.
+
+Node titles, the values of fixed string items and the node names used to
+be separate C literals (the names even in a fixed 32-byte buffer per
+node). :class:`StringPool` lays every distinct string out once in a single
+``const char`` blob, NUL-terminated, and the tables store byte offsets
+into it (``menu_str_t``, as narrow as the blob allows). A string that is
+the tail of another one, like ``"On"`` of ``"Turn On"``, can point into
+it instead of taking its own bytes (``share_suffixes``).
+
+Offsets count UTF-8 bytes, as the C compiler lays out the literals.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+#: Title of the root node, which has no render record.
+ROOT_TITLE = "root"
+
+#: C escapes of the characters that cannot appear as is in a literal.
+_ESCAPES = {'"': '\\"', "\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+
+def c_literal(text: str) -> str:
+    """``text`` as the body of a C string literal (without the quotes).
+
+    Other control characters are written as three-digit octal escapes, so
+    a following digit can never extend them.
+    """
+    return "".join(_ESCAPES.get(char, f"\\{ord(char):03o}" if ord(char) < 0x20 else char)
+                   for char in text)
+
+
+class StringPool:
+    """Distinct strings laid out back to back, each followed by a NUL.
+
+    ``strings`` may repeat; :attr:`references` counts them all. The owners
+    (strings with their own bytes) keep the order of their first
+    occurrence.
+    """
+
+    __slots__ = ("entries", "offsets", "size", "references", "referenced_size")
+
+    def __init__(self, strings: Iterable[str], share_suffixes: bool = True):
+        strings = list(strings)
+        distinct = list(dict.fromkeys(strings))
+        encoded = {text: text.encode("utf-8") for text in distinct}
+
+        # A string that ends another one is stored inside it
+        host: Dict[str, str] = {}
+        if share_suffixes:
+            by_tail = sorted(distinct, key=lambda text: encoded[text][::-1])
+            for shorter, longer in zip(by_tail, by_tail[1:]):
+                if encoded[longer].endswith(encoded[shorter]):
+                    host[shorter] = longer
+            for text in reversed(by_tail):
+                if text in host and host[text] in host:
+                    host[text] = host[host[text]]
+
+        #: ``(offset, string)`` of the strings that own their bytes, in blob order.
+        self.entries: List[Tuple[int, str]] = []
+        self.offsets: Dict[str, int] = {}
+        offset = 0
+        for text in distinct:
+            if text not in host:
+                self.entries.append((offset, text))
+                self.offsets[text] = offset
+                offset += len(encoded[text]) + 1
+        for text, owner in host.items():
+            self.offsets[text] = self.offsets[owner] + len(encoded[owner]) - len(encoded[text])
+
+        #: Bytes of the blob, terminators included.
+        self.size = offset
+        self.references = len(strings)
+        #: Bytes the strings would take as one literal each.
+        self.referenced_size = sum(len(text.encode("utf-8")) + 1 for text in strings)
+
+    @property
+    def literals(self) -> List[Tuple[int, str]]:
+        """``(offset, C literal body)`` of the stored strings, in blob order."""
+        return [(offset, c_literal(text)) for offset, text in self.entries]
+
+    def __getitem__(self, text: str) -> int:
+        """Offset of ``text`` in the blob."""
+        return self.offsets[text]
+
+    def __contains__(self, text: object) -> bool:
+        return text in self.offsets
+
+    def __len__(self) -> int:
+        """Number of distinct strings."""
+        return len(self.offsets)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StringPool):
+            return NotImplemented
+        return self.offsets == other.offsets and self.entries == other.entries
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"StringPool({len(self)} strings, {len(self.entries)} stored, {self.size} B)"
+
+
+def menu_strings(records: Mapping[str, Any], node_names: bool) -> Iterator[str]:
+    """Strings of the generated tables: titles, fixed string values and, with ``node_names``, the node names."""
+    yield ROOT_TITLE
+    for record in records.values():
+        yield record.title
+    for record in records.values():
+        if record.type == "string" and record.values:
+            yield from record.values
+    if node_names:
+        yield "MENU_ID_ROOT"
+        for record in records.values():
+            yield record.enum
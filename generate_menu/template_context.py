@@ -0,0 +1,170 @@
+"""Lazy, access-tracked template context for the Jinja2 renderer.
+
+:class:`LazyContext` maps context names to factories and computes each value
+on first use, so templates that are not rendered never force the aggregates
+they would have needed. :class:`TrackingEnvironment` resolves template names
+from the active lazy context and records, per render, which context keys and
+(optionally) which node attributes the template touched.
+
+Both are safe to share between threads: a lazy value is computed once under
+a lock, and the render in progress is kept in a context variable, so
+concurrent renders on one environment do not see each other's context or
+access record.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Set, Tuple
+
+from jinja2 import Environment
+from jinja2.runtime import Context, missing
+
+from .base_flat_node import BaseFlatNode
+from .render_record import RenderRecord
+from .template_profile import RenderProfiler
+
+#: Objects whose attribute reads are recorded as node attributes.
+_NODE_TYPES = (BaseFlatNode, RenderRecord)
+
+
+class LazyContext(Mapping):
+    """Template variables computed on first access and then cached."""
+
+    def __init__(self, factories: Dict[str, Callable[[], Any]]):
+        self._factories = factories
+        self._values: Dict[str, Any] = {}
+        # Reentrant: a factory may read other keys
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with self._lock:
+            try:
+                return self._values[key]
+            except KeyError:
+                value = self._values[key] = self._factories[key]()
+                return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    @property
+    def computed(self) -> Set[str]:
+        """Keys whose values have been computed so far."""
+        return set(self._values)
+
+
+class TemplateAccess:
+    """What one template render used, and how long it took."""
+
+    __slots__ = ("template", "context_keys", "node_attributes", "time")
+
+    def __init__(self, template: str):
+        self.template = template
+        self.context_keys: Set[str] = set()
+        self.node_attributes: Set[str] = set()
+        self.time = 0.0
+
+    def __repr__(self):
+        return (f"TemplateAccess({self.template}, keys={sorted(self.context_keys)}, "
+                f"node_attributes={len(self.node_attributes)}, time={self.time:.4f})")
+
+
+#: Environment, lazy context and access record of the render in progress in this thread.
+_ACTIVE_RENDER: ContextVar[Optional[Tuple["TrackingEnvironment", LazyContext, TemplateAccess]]] = \
+    ContextVar("active_render", default=None)
+
+
+class _TrackedContext(Context):
+    """Resolves names missing from the render variables in the lazy context.
+
+    Included templates get a copy of the parent variables, so the lazy
+    context is looked up from the render in progress rather than copied along.
+    """
+
+    def resolve_or_missing(self, key: str) -> Any:
+        value = super().resolve_or_missing(key)
+        if value is missing:
+            render = _ACTIVE_RENDER.get()
+            if render is not None and render[0] is self.environment:
+                _environment, source, access = render
+                if key in source:
+                    access.context_keys.add(key)
+                    value = source[key]
+        return value
+
+
+class TrackingEnvironment(Environment):
+    """Jinja2 environment rendering from a :class:`LazyContext` with access tracking.
+
+    Node attribute tracking (reads on nodes and on their render records)
+    wraps every attribute lookup in the templates, so it is only done
+    when ``track_attributes`` is set (``--profile``). With the
+    :class:`RenderProfiler` extension, templates are instrumented when
+    they are compiled.
+
+    The render in progress is kept per thread, not on the environment, so
+    one environment can render in several threads at once.
+    """
+
+    context_class = _TrackedContext
+
+    def __init__(self, *args, track_attributes: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.track_attributes = track_attributes
+
+    @property
+    def context_source(self) -> Optional[LazyContext]:
+        """Lazy context of the render in progress in this thread, if any."""
+        render = _ACTIVE_RENDER.get()
+        return render[1] if render is not None and render[0] is self else None
+
+    @property
+    def access(self) -> Optional[TemplateAccess]:
+        """Access record of the render in progress in this thread, if any."""
+        render = _ACTIVE_RENDER.get()
+        return render[2] if render is not None and render[0] is self else None
+
+    @contextmanager
+    def tracking(self, template: str, source: LazyContext) -> Iterator[TemplateAccess]:
+        """Renders inside the block (in this thread) resolve from ``source`` and are recorded."""
+        access = TemplateAccess(template)
+        token = _ACTIVE_RENDER.set((self, source, access))
+        start = time.perf_counter()
+        try:
+            yield access
+        finally:
+            access.time = time.perf_counter() - start
+            _ACTIVE_RENDER.reset(token)
+
+    def _generate(self, source, name, filename, defer_init=False):
+        # Block profiling rewrites the parsed template before it is compiled
+        profiler = self.extensions.get(RenderProfiler.identifier)
+        if profiler is not None and name is not None and self.loader is not None:
+            profiler.instrument(source, name, self.loader.get_source(self, name)[0])
+        return super()._generate(source, name, filename, defer_init)
+
+    def getattr(self, obj: Any, attribute: str) -> Any:
+        if self.track_attributes and isinstance(obj, _NODE_TYPES):
+            access = self.access
+            if access is not None:
+                access.node_attributes.add(attribute)
+        return super().getattr(obj, attribute)
+
+    def getitem(self, obj: Any, argument: Any) -> Any:
+        if self.track_attributes and isinstance(obj, _NODE_TYPES):
+            access = self.access
+            if access is not None:
+                access.node_attributes.add(str(argument))
+        return super().getitem(obj, argument)
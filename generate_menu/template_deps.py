@@ -0,0 +1,118 @@
+"""Static dependency analysis of the Jinja2 templates.
+
+Every template is parsed once into the Jinja2 AST to find the context names
+it reads (undeclared variables), the templates it includes, and the
+attributes it reads on plain names (``item.name`` on a loop variable,
+``first.id``...). :class:`TemplateDependencyGraph` folds the includes into
+each rendered template, so after an edit the generator can tell which
+outputs depend on the changed inputs and re-render only those.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from jinja2 import Environment, meta, nodes
+
+
+class TemplateDeps:
+    """Inputs of one template: context names, attributes and includes."""
+
+    __slots__ = ("name", "context_keys", "attributes", "includes")
+
+    def __init__(self, name: str, context_keys: FrozenSet[str], attributes: FrozenSet[str],
+                 includes: Tuple[str, ...] = ()):
+        self.name = name
+        self.context_keys = context_keys
+        self.attributes = attributes
+        self.includes = includes
+
+    def __repr__(self):
+        return (f"TemplateDeps({self.name}, keys={sorted(self.context_keys)}, "
+                f"attributes={len(self.attributes)}, includes={list(self.includes)})")
+
+
+def analyze_template(env: Environment, name: str) -> TemplateDeps:
+    """Parses a template and collects its own (not included) inputs."""
+    source, _filename, _uptodate = env.loader.get_source(env, name)
+    ast = env.parse(source, name)
+
+    # Method calls (``menu.items()``, ``id.upper()``) are not data reads
+    called = {id(call.node) for call in ast.find_all(nodes.Call)}
+    attributes: Set[str] = set()
+    for node in ast.find_all(nodes.Getattr):
+        if isinstance(node.node, nodes.Name) and id(node) not in called:
+            attributes.add(node.attr)
+    for node in ast.find_all(nodes.Getitem):
+        if (isinstance(node.node, nodes.Name) and isinstance(node.arg, nodes.Const)
+                and isinstance(node.arg.value, str)):
+            attributes.add(node.arg.value)
+
+    # Dynamic includes (``None``) cannot be resolved statically
+    includes = tuple(include for include in meta.find_referenced_templates(ast) if include is not None)
+    return TemplateDeps(name, frozenset(meta.find_undeclared_variables(ast)),
+                        frozenset(attributes), includes)
+
+
+class TemplateDependencyGraph:
+    """Inputs of each rendered template, including everything it includes."""
+
+    def __init__(self, env: Environment, templates: Iterable[str]):
+        self._env = env
+        self._own: Dict[str, TemplateDeps] = {}
+        self._closed: Dict[str, TemplateDeps] = {}
+        for name in templates:
+            self._closed[name] = self._close(name)
+
+    def _analyze(self, name: str) -> TemplateDeps:
+        deps = self._own.get(name)
+        if deps is None:
+            deps = self._own[name] = analyze_template(self._env, name)
+        return deps
+
+    def _close(self, name: str) -> TemplateDeps:
+        """Merges the inputs of ``name`` and of all templates it includes."""
+        keys: Set[str] = set()
+        attributes: Set[str] = set()
+        seen = {name}
+        stack = [name]
+        while stack:
+            deps = self._analyze(stack.pop())
+            keys |= deps.context_keys
+            attributes |= deps.attributes
+            for include in deps.includes:
+                if include not in seen:
+                    seen.add(include)
+                    stack.append(include)
+        seen.discard(name)
+        return TemplateDeps(name, frozenset(keys), frozenset(attributes), tuple(sorted(seen)))
+
+    def __getitem__(self, name: str) -> TemplateDeps:
+        return self._closed[name]
+
+    def __iter__(self):
+        return iter(self._closed)
+
+    def __len__(self) -> int:
+        return len(self._closed)
+
+    def affected(self, changed_keys: Iterable[str], changed_attributes: Optional[Iterable[str]],
+                 node_keys: Iterable[str]) -> List[str]:
+        """Templates to re-render after a change.
+
+        A template is affected when it reads a changed context name, or when
+        it reads a context name holding nodes (``node_keys``) and one of the
+        changed node attributes. ``changed_attributes=None`` means any node
+        attribute may have changed; an empty iterable means none did.
+        """
+        changed_keys = frozenset(changed_keys)
+        node_keys = frozenset(node_keys)
+        if changed_attributes is not None:
+            changed_attributes = frozenset(changed_attributes)
+
+        affected = []
+        for name, deps in self._closed.items():
+            if deps.context_keys & changed_keys:
+                affected.append(name)
+            elif deps.context_keys & node_keys and (
+                    changed_attributes is None or deps.attributes & changed_attributes):
+                affected.append(name)
+        return affected
@@ -0,0 +1,110 @@
+"""Block-level render profiler for the Jinja2 templates.
+
+:class:`RenderProfiler` is a Jinja2 extension that instruments a template's
+AST before it is compiled: every ``{% include %}`` and every outermost
+``{% for %}`` of a template is wrapped in a call block that times its
+render, and each loop body (nested loops included) counts its iterations.
+The results are collected per source line as :class:`BlockProfile` records,
+so the hottest lines of the customized templates can be reported.
+
+The instrumentation only exists in environments the extension is added to
+(``MenuGenerator(profile=True)``); other renders are unaffected.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+
+
+class BlockProfile:
+    """Timing of one ``include`` or ``for`` block of a template."""
+
+    __slots__ = ("template", "line", "kind", "source", "time", "calls", "iterations", "timed")
+
+    def __init__(self, template: str, line: int, kind: str, source: str, timed: bool):
+        self.template = template
+        self.line = line
+        self.kind = kind
+        self.source = source
+        self.timed = timed
+        self.time = 0.0
+        self.calls = 0
+        self.iterations = 0
+
+    def __repr__(self):
+        return (f"BlockProfile({self.template}:{self.line} {self.kind}, time={self.time:.4f}, "
+                f"calls={self.calls}, iterations={self.iterations})")
+
+
+class RenderProfiler(Extension):
+    """Times includes and outermost loops, and counts loop iterations."""
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        self.blocks: Dict[Tuple[str, int, str], BlockProfile] = {}
+
+    def instrument(self, ast: nodes.Template, name: Optional[str], source: str):
+        """Rewrites ``ast`` in place so that rendering it records its blocks."""
+        lines = source.splitlines()
+        template = name or "<string>"
+
+        def block(node: nodes.Node, kind: str, timed: bool) -> Tuple[str, int, str]:
+            key = (template, node.lineno, kind)
+            if key not in self.blocks:
+                text = lines[node.lineno - 1].strip() if 0 < node.lineno <= len(lines) else ""
+                self.blocks[key] = BlockProfile(template, node.lineno, kind, text, timed)
+            return key
+
+        def timed(node: nodes.Node, key: Tuple[str, int, str]) -> nodes.CallBlock:
+            call = self.call_method("_timed", [nodes.Const(key)], lineno=node.lineno)
+            return nodes.CallBlock(call, [], [], [node], lineno=node.lineno)
+
+        def visit(body: List[nodes.Node], in_loop: bool) -> List[nodes.Node]:
+            result = []
+            for node in body:
+                if isinstance(node, nodes.For):
+                    key = block(node, "for", timed=not in_loop)
+                    tick = self.call_method("_tick", [nodes.Const(key)], lineno=node.lineno)
+                    node.body = [nodes.ExprStmt(tick, lineno=node.lineno)] + visit(node.body, True)
+                    node.else_ = visit(node.else_, in_loop)
+                    result.append(node if in_loop else timed(node, key))
+                    continue
+                if isinstance(node, nodes.Include):
+                    result.append(timed(node, block(node, "include", timed=True)))
+                    continue
+                # Statements with nested bodies: if/elif/else, with, filter, macro...
+                for branch in [node, *getattr(node, "elif_", ())]:
+                    for field in ("body", "else_"):
+                        children = getattr(branch, field, None)
+                        if isinstance(children, list):
+                            setattr(branch, field, visit(children, in_loop))
+                result.append(node)
+            return result
+
+        ast.body = visit(ast.body, False)
+
+    def _timed(self, key: Tuple[str, int, str], caller) -> str:
+        start = time.perf_counter()
+        try:
+            return caller()
+        finally:
+            profile = self.blocks[key]
+            profile.time += time.perf_counter() - start
+            profile.calls += 1
+
+    def _tick(self, key: Tuple[str, int, str]):
+        self.blocks[key].iterations += 1
+
+    def hottest(self, limit: Optional[int] = None) -> List[BlockProfile]:
+        """Timed blocks by total time, then loops by iteration count."""
+        blocks = sorted(self.blocks.values(),
+                        key=lambda item: (item.timed, item.time, item.iterations), reverse=True)
+        return blocks[:limit] if limit is not None else blocks
+
+    def reset(self):
+        """Clears the collected timings (the instrumentation stays)."""
+        for profile in self.blocks.values():
+            profile.time = 0.0
+            profile.calls = profile.iterations = 0
@@ -0,0 +1,115 @@
+"""Amalgamation of the generated C sources into a unity build.
+
+Instead of the separate ``menu_*.c`` modules, a unity build emits one
+``menu_all.c`` and one public header, ``menu_all.h``. The compiler then
+sees the whole menu runtime at once and can inline the navigation, draw
+and edit functions across modules, which cuts call overhead in the input
+handlers and lets unused functions be dropped.
+
+* The header concatenates all generated headers in include order, without
+  the includes between them. Types, enums and macros stay public, and so
+  do the prototypes of the public API (``menu.h``, ``menu_name.h``) and
+  of the user callbacks, which the generated code does not define.
+* The source includes the header, declares every other generated function
+  ``static`` and then concatenates the modules in configuration order.
+
+The amalgamation works on the generated text. It relies on the layout the
+templates produce: function definitions and prototypes start in column 0
+and fit on one line (up to the opening brace).
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+#: Generated headers that declare the public API (menu control, node-name lookup).
+PUBLIC_HEADERS = ("menu.h", "menu_name.h")
+
+#: Names of the amalgamated source and header.
+UNITY_SOURCE = "menu_all.c"
+UNITY_HEADER = "menu_all.h"
+
+_LOCAL_INCLUDE = re.compile(r'^\s*#\s*include\s+"([^"]+)"')
+# ``const menu_node_t *menu_data_get_tree(void) {`` / ``void menu_init(void);``
+_FUNCTION = re.compile(r'^(?!static\b|typedef\b|extern\b)[A-Za-z_][\w\s\*]*?\b(\w+)\s*\([^;{]*\)\s*([;{])\s*$')
+
+
+def _name(path: str) -> str:
+    return path.replace("\\", "/").rsplit("/", 1)[-1]
+
+
+def _function(line: str) -> Tuple[str, str]:
+    """``(name, ';' or '{')`` of a prototype or definition line, or ``('', '')``."""
+    match = _FUNCTION.match(line)
+    return (match.group(1), match.group(2)) if match else ("", "")
+
+
+def _header_order(headers: Dict[str, str]) -> List[str]:
+    """Header names, each after the generated headers it includes."""
+    order: List[str] = []
+    visiting: Set[str] = set()
+
+    def visit(name: str):
+        if name in order or name in visiting:
+            return
+        visiting.add(name)
+        for line in headers[name].splitlines():
+            match = _LOCAL_INCLUDE.match(line)
+            if match and _name(match.group(1)) in headers:
+                visit(_name(match.group(1)))
+        visiting.discard(name)
+        order.append(name)
+
+    for name in headers:
+        visit(name)
+    return order
+
+
+def amalgamate(files: Iterable[Tuple[str, str]]) -> Tuple[str, str]:
+    """Builds the unity ``(source, header)`` texts from the generated files.
+
+    ``files`` are ``(output path, text)`` pairs in configuration order; the
+    ``.h`` files are the headers, the ``.c`` files the modules.
+    """
+    headers: Dict[str, str] = {}
+    sources: List[Tuple[str, str]] = []
+    for path, text in files:
+        if path.endswith(".h"):
+            headers[_name(path)] = text
+        elif path.endswith(".c"):
+            sources.append((_name(path), text))
+
+    defined = {name for _path, text in sources for line in text.splitlines()
+               for name, kind in [_function(line)] if kind == "{"}
+    public = {name for header in PUBLIC_HEADERS for line in headers.get(header, "").splitlines()
+              for name, kind in [_function(line)] if kind == ";"}
+    internal = defined - public
+
+    def strip_includes(text: str) -> List[str]:
+        return [line for line in text.splitlines()
+                if not ((match := _LOCAL_INCLUDE.match(line)) and _name(match.group(1)) in headers)]
+
+    guard = re.sub(r"\W", "_", UNITY_HEADER).upper()
+    header_lines = [f"#ifndef {guard}", f"#define {guard}", ""]
+    prototypes: List[str] = []
+    for name in _header_order(headers):
+        header_lines.append(f"/* ---- {name} ---- */")
+        for line in strip_includes(headers[name]):
+            function, kind = _function(line)
+            if kind == ";" and function in internal:
+                prototypes.append(f"static {line}")
+            else:
+                header_lines.append(line)
+        header_lines.append("")
+    header_lines.append(f"#endif /* {guard} */")
+
+    source_lines = [f'#include "{UNITY_HEADER}"', ""]
+    if prototypes:
+        source_lines += ["/* ---- internal functions ---- */", *prototypes, ""]
+    for name, text in sources:
+        source_lines.append(f"/* ---- {name} ---- */")
+        for line in strip_includes(text):
+            function, kind = _function(line)
+            source_lines.append(f"static {line}" if kind == "{" and function in internal else line)
+        source_lines.append("")
+
+    return "\n".join(source_lines), "\n".join(header_lines) + "\n"
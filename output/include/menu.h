@@ -0,0 +1,24 @@
+#ifndef MENU_HANDLE_H
+#define MENU_HANDLE_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include <stddef.h>
+
+#include "menu_type.h"
+
+void menu_init(void);
+void menu_position(int8_t delta);
+void menu_enter(void);
+void menu_back(void);
+void menu_reset(void);
+void menu_update(void);
+void menu_set_update(void);
+char* menu_title_buf(void);
+char* menu_value_buf(void);
+bool menu_needs_redraw(void);
+bool menu_ack_redraw(void);
+void menu_set_dirty(void);
+menu_state_t menu_state(void);
+
+#endif /* MENU_HANDLE_H */
\ No newline at end of file
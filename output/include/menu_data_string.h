@@ -0,0 +1,11 @@
+#ifndef MENU_DATA_STRING_H
+#define MENU_DATA_STRING_H
+
+#include <stdint.h>
+#include <stdbool.h>
+
+#include "menu_type.h"
+
+const char *menu_data_get_strings(void);
+
+#endif /* MENU_DATA_STRING_H */
\ No newline at end of file
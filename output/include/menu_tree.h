@@ -0,0 +1,26 @@
+#ifndef MENU_TREE_H
+#define MENU_TREE_H
+
+#include <stdint.h>
+#include <stdbool.h>
+#include <stddef.h>
+
+#include "menu_type.h"
+
+#define MENU_TITLE_LEN 0x10
+
+typedef struct menu_node {
+    menu_str_t title;           ///< Смещение заголовка в пуле строк
+    menu_id_t id;
+    menu_id_t parent;
+    menu_id_t child;
+    menu_id_t prev;
+    menu_id_t next;
+    menu_tree_type_t type;
+    menu_index_t children;      ///< Начало детей в массиве соседей (ctx->siblings)
+    menu_index_t child_count;
+    menu_index_t position;      ///< Позиция узла среди соседей
+    bool cyclic;                ///< Переход по детям закольцован
+} menu_node_t;
+
+#endif /* MENU_STRUCT_H */
\ No newline at end of file
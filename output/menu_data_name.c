@@ -0,0 +1,80 @@
+#include "menu_data_name.h"
+#include "menu_name.h"
+
+static const menu_node_name_t s_menu_id_names[] = {
+    [MENU_ID_ROOT] = {MENU_ID_ROOT, 169},
+    [MENU_ID_START] = {
+            .id = MENU_ID_START,
+            .name = 182,
+    },
+    [MENU_ID_REGIMES] = {
+            .id = MENU_ID_REGIMES,
+            .name = 196,
+    },
+    [MENU_ID_VERSION] = {
+            .id = MENU_ID_VERSION,
+            .name = 212,
+    },
+    [MENU_ID_SETTINGS] = {
+            .id = MENU_ID_SETTINGS,
+            .name = 228,
+    },
+    [MENU_ID_PWM_FREQUENCY] = {
+            .id = MENU_ID_PWM_FREQUENCY,
+            .name = 245,
+    },
+    [MENU_ID_HI_CHANNEL] = {
+            .id = MENU_ID_HI_CHANNEL,
+            .name = 267,
+    },
+    [MENU_ID_HI_ON] = {
+            .id = MENU_ID_HI_ON,
+            .name = 286,
+    },
+    [MENU_ID_HI_DELAY] = {
+            .id = MENU_ID_HI_DELAY,
+            .name = 300,
+    },
+    [MENU_ID_HI_DURATION] = {
+            .id = MENU_ID_HI_DURATION,
+            .name = 317,
+    },
+    [MENU_ID_HI_PWM_ON] = {
+            .id = MENU_ID_HI_PWM_ON,
+            .name = 337,
+    },
+    [MENU_ID_HI_DUTY] = {
+            .id = MENU_ID_HI_DUTY,
+            .name = 355,
+    },
+    [MENU_ID_LO_CHANNEL] = {
+            .id = MENU_ID_LO_CHANNEL,
+            .name = 371,
+    },
+    [MENU_ID_LO_ON] = {
+            .id = MENU_ID_LO_ON,
+            .name = 390,
+    },
+    [MENU_ID_LO_DELAY] = {
+            .id = MENU_ID_LO_DELAY,
+            .name = 404,
+    },
+    [MENU_ID_LO_DURATION] = {
+            .id = MENU_ID_LO_DURATION,
+            .name = 421,
+    },
+    [MENU_ID_LO_PWM_ON] = {
+            .id = MENU_ID_LO_PWM_ON,
+            .name = 441,
+    },
+    [MENU_ID_LO_DUTY] = {
+            .id = MENU_ID_LO_DUTY,
+            .name = 459,
+    },
+    
+};
+
+const menu_node_name_t *menu_data_get_node_names(void) {
+    return s_menu_id_names;
+}
+
@@ -0,0 +1,46 @@
+#include "menu_data_string.h"
+
+// Пул строк меню: 38 строк, 475 байт.
+// Каждая различная строка хранится один раз; таблицы ссылаются на неё смещением menu_str_t
+static const char s_menu_strings[] =
+    /* 0 */ "root\0"
+    /* 5 */ "Start\0"
+    /* 11 */ "Regimes\0"
+    /* 19 */ "Firmware version\0"
+    /* 36 */ "Settings\0"
+    /* 45 */ "PWM Frequency\0"
+    /* 59 */ "Hi Channel\0"
+    /* 70 */ "Hi On/Off\0"
+    /* 80 */ "Delay\0"
+    /* 86 */ "Duration\0"
+    /* 95 */ "PWM On/Off\0"
+    /* 106 */ "PWM Duty\0"
+    /* 115 */ "Lo Channel\0"
+    /* 126 */ "Lo On/Off\0"
+    /* 136 */ "Started\0"
+    /* 144 */ "Simple\0"
+    /* 151 */ "Strong\0"
+    /* 158 */ "Quality\0"
+    /* 166 */ "On\0"
+    /* 169 */ "MENU_ID_ROOT\0"
+    /* 182 */ "MENU_ID_START\0"
+    /* 196 */ "MENU_ID_REGIMES\0"
+    /* 212 */ "MENU_ID_VERSION\0"
+    /* 228 */ "MENU_ID_SETTINGS\0"
+    /* 245 */ "MENU_ID_PWM_FREQUENCY\0"
+    /* 267 */ "MENU_ID_HI_CHANNEL\0"
+    /* 286 */ "MENU_ID_HI_ON\0"
+    /* 300 */ "MENU_ID_HI_DELAY\0"
+    /* 317 */ "MENU_ID_HI_DURATION\0"
+    /* 337 */ "MENU_ID_HI_PWM_ON\0"
+    /* 355 */ "MENU_ID_HI_DUTY\0"
+    /* 371 */ "MENU_ID_LO_CHANNEL\0"
+    /* 390 */ "MENU_ID_LO_ON\0"
+    /* 404 */ "MENU_ID_LO_DELAY\0"
+    /* 421 */ "MENU_ID_LO_DURATION\0"
+    /* 441 */ "MENU_ID_LO_PWM_ON\0"
+    /* 459 */ "MENU_ID_LO_DUTY\0";
+
+const char *menu_data_get_strings(void) {
+    return s_menu_strings;
+}
\ No newline at end of file
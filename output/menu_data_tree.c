@@ -0,0 +1,220 @@
+#include "menu_data_tree.h"
+#include "menu_tree.h"
+
+static const menu_node_t s_menu_tree[] = {
+    [MENU_ID_ROOT] = {
+        .id = MENU_ID_ROOT,
+        .title = 0, // root
+        .parent = MENU_ID_COUNT,
+        .child = MENU_ID_START,
+        .prev = MENU_ID_COUNT,
+        .next = MENU_ID_COUNT,
+        .children = 0,
+        .child_count = 4,
+        .cyclic = true,
+        .position = 0,
+        .type = MENU_TREE_TYPE_BRANCH
+    },
+    [MENU_ID_START] = {
+        .id = MENU_ID_START,
+        .title = 5, // Start
+        .parent = MENU_ID_ROOT,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_SETTINGS,
+        .next = MENU_ID_REGIMES,
+        .position = 0,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_REGIMES] = {
+        .id = MENU_ID_REGIMES,
+        .title = 11, // Regimes
+        .parent = MENU_ID_ROOT,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_START,
+        .next = MENU_ID_VERSION,
+        .position = 1,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_VERSION] = {
+        .id = MENU_ID_VERSION,
+        .title = 19, // Firmware version
+        .parent = MENU_ID_ROOT,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_REGIMES,
+        .next = MENU_ID_SETTINGS,
+        .position = 2,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_SETTINGS] = {
+        .id = MENU_ID_SETTINGS,
+        .title = 36, // Settings
+        .parent = MENU_ID_ROOT,
+        .child = MENU_ID_PWM_FREQUENCY,
+        .prev = MENU_ID_VERSION,
+        .next = MENU_ID_START,
+        .children = 4,
+        .child_count = 3,
+        .cyclic = false,
+        .position = 3,
+        .type = MENU_TREE_TYPE_BRANCH
+    },
+    [MENU_ID_PWM_FREQUENCY] = {
+        .id = MENU_ID_PWM_FREQUENCY,
+        .title = 45, // PWM Frequency
+        .parent = MENU_ID_SETTINGS,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_COUNT,
+        .next = MENU_ID_HI_CHANNEL,
+        .position = 0,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_HI_CHANNEL] = {
+        .id = MENU_ID_HI_CHANNEL,
+        .title = 59, // Hi Channel
+        .parent = MENU_ID_SETTINGS,
+        .child = MENU_ID_HI_ON,
+        .prev = MENU_ID_PWM_FREQUENCY,
+        .next = MENU_ID_LO_CHANNEL,
+        .children = 7,
+        .child_count = 5,
+        .cyclic = true,
+        .position = 1,
+        .type = MENU_TREE_TYPE_BRANCH
+    },
+    [MENU_ID_HI_ON] = {
+        .id = MENU_ID_HI_ON,
+        .title = 70, // Hi On/Off
+        .parent = MENU_ID_HI_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_HI_DUTY,
+        .next = MENU_ID_HI_DELAY,
+        .position = 0,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_HI_DELAY] = {
+        .id = MENU_ID_HI_DELAY,
+        .title = 80, // Delay
+        .parent = MENU_ID_HI_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_HI_ON,
+        .next = MENU_ID_HI_DURATION,
+        .position = 1,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_HI_DURATION] = {
+        .id = MENU_ID_HI_DURATION,
+        .title = 86, // Duration
+        .parent = MENU_ID_HI_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_HI_DELAY,
+        .next = MENU_ID_HI_PWM_ON,
+        .position = 2,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_HI_PWM_ON] = {
+        .id = MENU_ID_HI_PWM_ON,
+        .title = 95, // PWM On/Off
+        .parent = MENU_ID_HI_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_HI_DURATION,
+        .next = MENU_ID_HI_DUTY,
+        .position = 3,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_HI_DUTY] = {
+        .id = MENU_ID_HI_DUTY,
+        .title = 106, // PWM Duty
+        .parent = MENU_ID_HI_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_HI_PWM_ON,
+        .next = MENU_ID_HI_ON,
+        .position = 4,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_LO_CHANNEL] = {
+        .id = MENU_ID_LO_CHANNEL,
+        .title = 115, // Lo Channel
+        .parent = MENU_ID_SETTINGS,
+        .child = MENU_ID_LO_ON,
+        .prev = MENU_ID_HI_CHANNEL,
+        .next = MENU_ID_COUNT,
+        .children = 12,
+        .child_count = 5,
+        .cyclic = true,
+        .position = 2,
+        .type = MENU_TREE_TYPE_BRANCH
+    },
+    [MENU_ID_LO_ON] = {
+        .id = MENU_ID_LO_ON,
+        .title = 126, // Lo On/Off
+        .parent = MENU_ID_LO_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_LO_DUTY,
+        .next = MENU_ID_LO_DELAY,
+        .position = 0,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_LO_DELAY] = {
+        .id = MENU_ID_LO_DELAY,
+        .title = 80, // Delay
+        .parent = MENU_ID_LO_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_LO_ON,
+        .next = MENU_ID_LO_DURATION,
+        .position = 1,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_LO_DURATION] = {
+        .id = MENU_ID_LO_DURATION,
+        .title = 86, // Duration
+        .parent = MENU_ID_LO_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_LO_DELAY,
+        .next = MENU_ID_LO_PWM_ON,
+        .position = 2,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_LO_PWM_ON] = {
+        .id = MENU_ID_LO_PWM_ON,
+        .title = 95, // PWM On/Off
+        .parent = MENU_ID_LO_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_LO_DURATION,
+        .next = MENU_ID_LO_DUTY,
+        .position = 3,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+    [MENU_ID_LO_DUTY] = {
+        .id = MENU_ID_LO_DUTY,
+        .title = 106, // PWM Duty
+        .parent = MENU_ID_LO_CHANNEL,
+        .child = MENU_ID_COUNT,
+        .prev = MENU_ID_LO_PWM_ON,
+        .next = MENU_ID_LO_ON,
+        .position = 4,
+        .type = MENU_TREE_TYPE_LEAF
+    },
+};
+
+static const menu_id_t s_menu_siblings[] = {
+    // MENU_ID_ROOT
+    MENU_ID_START, MENU_ID_REGIMES, MENU_ID_VERSION, MENU_ID_SETTINGS,
+    // MENU_ID_SETTINGS
+    MENU_ID_PWM_FREQUENCY, MENU_ID_HI_CHANNEL, MENU_ID_LO_CHANNEL,
+    // MENU_ID_HI_CHANNEL
+    MENU_ID_HI_ON, MENU_ID_HI_DELAY, MENU_ID_HI_DURATION, MENU_ID_HI_PWM_ON, MENU_ID_HI_DUTY,
+    // MENU_ID_LO_CHANNEL
+    MENU_ID_LO_ON, MENU_ID_LO_DELAY, MENU_ID_LO_DURATION, MENU_ID_LO_PWM_ON, MENU_ID_LO_DUTY,
+};
+
+const menu_node_t *menu_data_get_tree(void) {
+    return s_menu_tree;
+}
+
+const menu_id_t *menu_data_get_siblings(void) {
+    return s_menu_siblings;
+}
+
+menu_id_t menu_data_get_first_id(void) {
+    return MENU_ID_START;
+}
\ No newline at end of file
@@ -14,7 +14,7 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
-def _run_entrypoint(env_extra=None):
+def _run_entrypoint(env_extra=None, args=()):
     """Runs the root generate_menu.py entry point in a subprocess."""
     env = dict(os.environ)
     # Force UTF-8 stdout/stderr in the subprocess: on Windows the console
@@ -23,7 +23,7 @@ def _run_entrypoint(env_extra=None):
     if env_extra:
         env.update(env_extra)
     return subprocess.run(
-        [sys.executable, "generate_menu.py"],
+        [sys.executable, "generate_menu.py", *args],
         cwd=str(PROJECT_ROOT),
         env=env,
         capture_output=True,
@@ -68,3 +68,11 @@ def test_russian_entrypoint_output():
     assert result.returncode == 0, result.stderr
     assert "Конфигурация" in result.stdout
     assert "успешно загружена" in result.stdout
+
+
+def test_check_entrypoint_reports_up_to_date_output():
+    """After a generation run, --check finds nothing to change and exits with 0."""
+    assert _run_entrypoint().returncode == 0
+    result = _run_entrypoint(args=["--check"])
+    assert result.returncode == 0, result.stderr
+    assert "up to date" in result.stdout
@@ -6,6 +6,7 @@ before constructing a ``MenuGenerator``.
 """
 
 import json
+import os
 from pathlib import Path
 
 #: Files the generator must produce from the bundled templates.
@@ -21,6 +22,7 @@ EXPECTED_FILES = [
     "menu_data_context.c",
     "menu_data_value.c",
     "menu_data_name.c",
+    "menu_data_string.c",
     "include/menu.h",
     "include/menu_context.h",
     "include/menu_name.h",
@@ -29,6 +31,7 @@ EXPECTED_FILES = [
     "include/menu_navigate.h",
     "include/menu_config.h",
     "include/menu_type.h",
+    "include/menu_data_string.h",
 ]
 
 
@@ -100,3 +103,318 @@ def test_generated_data_file_contains_node_titles(monkeypatch, project_root):
     content = data_c.read_text(encoding="utf-8")
     assert "s_values_str_start" in content
     assert '"Start"' in content
+
+
+def test_ids_use_the_narrowest_storage_type(monkeypatch, project_root):
+    """The bundled menu stores its ids and categories in bytes, which shrinks the flash tables."""
+    monkeypatch.chdir(project_root)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    generator = MenuGenerator("./config/config.yaml")
+
+    type_h = (project_root / "output" / "include" / "menu_type.h").read_text(encoding="utf-8")
+    assert "typedef uint8_t menu_id_t;" in type_h
+    assert "typedef uint8_t menu_category_t;" in type_h
+    assert "    MENU_ID_COUNT = 18\n};" in type_h
+    tables = {table.name: table for table in generator.table_sizes}
+    assert tables["s_menu_tree"].entries == 18
+    assert tables["s_menu_tree"].compact_size < tables["s_menu_tree"].enum_size
+
+
+def test_tree_lists_children_by_parent(monkeypatch, project_root):
+    """The tree holds each node's position and every branch's slice of the sibling array."""
+    monkeypatch.chdir(project_root)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    MenuGenerator("./config/config.yaml")
+
+    tree_c = (project_root / "output" / "menu_data_tree.c").read_text(encoding="utf-8")
+    assert "    // MENU_ID_SETTINGS\n    MENU_ID_PWM_FREQUENCY, MENU_ID_HI_CHANNEL, MENU_ID_LO_CHANNEL,\n" in tree_c
+    assert ".children = 4,\n        .child_count = 3,\n        .cyclic = false,\n" in tree_c
+    navigate_c = (project_root / "output" / "menu_navigate.c").read_text(encoding="utf-8")
+    assert "ctx->siblings[parent->children + position]" in navigate_c
+
+
+def test_strings_are_pooled(monkeypatch, project_root):
+    """Titles, fixed values and node names are offsets into one deduplicated string pool."""
+    monkeypatch.chdir(project_root)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    generator = MenuGenerator("./config/config.yaml")
+    pool = generator._context["string_pool"]
+
+    output = project_root / "output"
+    strings_c = (output / "menu_data_string.c").read_text(encoding="utf-8")
+    assert strings_c.count('"Delay\\0"') == 1
+    tree_c = (output / "menu_data_tree.c").read_text(encoding="utf-8")
+    assert f'.title = {pool["Delay"]}, // "Delay"' in tree_c
+    config_c = (output / "menu_data_config.c").read_text(encoding="utf-8")
+    assert f"s_values_str_hi_on[] = {{ {pool['Off']}, {pool['On']} }}; // \"Off\", \"On\"\n" in config_c
+    assert "const char name[" not in (output / "include" / "menu_name.h").read_text(encoding="utf-8")
+
+
+def test_menu_text_in_comments_is_escaped(monkeypatch, project_root, tmp_path):
+    """Titles and fixed values echoed in comments cannot continue or break the comment line."""
+    import shutil
+
+    for directory in ("config", "menu", "templates"):
+        shutil.copytree(project_root / directory, tmp_path / directory)
+    monkeypatch.chdir(tmp_path)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    generator = MenuGenerator("./config/config.yaml")
+    generator._processor.flattener.update_node("hi_on", {"title": "C:\\", "values": ["Off\\", "On\nline"]})
+    generator.regenerate()
+    pool = generator._context["string_pool"]
+    title, value = pool["C:\\"], pool["On\nline"]
+
+    output = tmp_path / "output"
+    tree_c = (output / "menu_data_tree.c").read_text(encoding="utf-8")
+    assert f'.title = {title}, // "C:\\\\"\n        .parent = ' in tree_c
+    config_c = (output / "menu_data_config.c").read_text(encoding="utf-8")
+    assert f'{value} }}; // "Off\\\\", "On\\nline"\n' in config_c
+
+
+def test_generator_records_template_access(monkeypatch, project_root):
+    """Each render records the context keys (and, profiled, node attributes) it used."""
+    monkeypatch.chdir(project_root)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    generator = MenuGenerator("./config/config.yaml", profile=True)
+    access = generator.template_access
+
+    # edit.c.jinja reads its slice of the functions, in its included templates too
+    assert access["edit.c.jinja"].context_keys == {"shard_functions"}
+    assert {"first", "records"} <= access["data_tree.c.jinja"].context_keys
+    assert {"next", "title"} <= access["data_tree.c.jinja"].node_attributes
+    assert access["handle.h.jinja"].context_keys == set()
+
+
+def test_regenerate_renders_only_affected_templates(monkeypatch, project_root, tmp_path):
+    """After a title edit only the string pool consumers are re-rendered, with full-run output."""
+    import shutil
+
+    for directory in ("config", "menu", "templates"):
+        shutil.copytree(project_root / directory, tmp_path / directory)
+    monkeypatch.chdir(tmp_path)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    generator = MenuGenerator("./config/config.yaml")
+    processor = generator._processor
+    output = tmp_path / "output"
+
+    assert generator.regenerate() == []
+
+    # The string pool and the tables holding offsets into it, nothing else
+    processor.flattener.update_node("hi_delay", {"title": "Pause"})
+    assert sorted(generator.regenerate()) == [
+        "data_config.c.jinja", "data_name.c.jinja", "data_string.c.jinja", "data_tree.c.jinja"]
+    assert '"Pause\\0"' in (output / "menu_data_string.c").read_text(encoding="utf-8")
+
+    processor.flattener.update_node("hi_delay", {"event_cb": "hi_delay_event_cb"})
+    affected = generator.regenerate()
+    assert "data_tree.c.jinja" not in affected
+    assert "data_config.c.jinja" in affected
+
+    rendered = {path: path.read_text(encoding="utf-8") for path in output.rglob("*.[ch]")}
+    MenuGenerator("./config/config.yaml", processor=processor)
+    assert rendered == {path: path.read_text(encoding="utf-8") for path in output.rglob("*.[ch]")}
+
+
+def test_streamed_output_matches_render_and_skips_unchanged(monkeypatch, project_root):
+    """Streamed and fully rendered outputs agree; unchanged files are not rewritten."""
+    monkeypatch.chdir(project_root)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    generator = MenuGenerator("./config/config.yaml", stream=False)
+    output = project_root / "output"
+    paths = [output / relative for relative in EXPECTED_FILES]
+    rendered = {path: path.read_text(encoding="utf-8") for path in paths}
+    for path in paths:
+        os.utime(path, (0, 0))
+
+    MenuGenerator("./config/config.yaml", processor=generator._processor)
+    assert rendered == {path: path.read_text(encoding="utf-8") for path in paths}
+    assert all(path.stat().st_mtime == 0 for path in paths)
+
+
+def test_profile_reports_template_blocks(monkeypatch, project_root):
+    """With ``profile`` every include and outermost loop is timed; the output is unchanged."""
+    monkeypatch.chdir(project_root)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    output = project_root / "output"
+    generator = MenuGenerator("./config/config.yaml")
+    rendered = {path: path.read_text(encoding="utf-8") for path in output.rglob("*.[ch]")}
+    assert generator.block_profile == []
+
+    generator = MenuGenerator("./config/config.yaml", processor=generator._processor, profile=True)
+    assert rendered == {path: path.read_text(encoding="utf-8") for path in output.rglob("*.[ch]")}
+
+    blocks = {(block.template, block.kind): block for block in generator.block_profile}
+    loop = blocks[("edit.c.jinja", "for")]
+    assert loop.calls == 1
+    assert loop.iterations == len(generator._processor.functions)
+    assert blocks[("edit.c.jinja", "include")].calls > 0
+
+
+def test_sharded_output(monkeypatch, project_root, tmp_path):
+    """Large-menu sharding splits handlers and factor/value arrays; one shard is the plain output."""
+    import shutil
+
+    import yaml
+
+    for directory in ("config", "menu", "templates"):
+        shutil.copytree(project_root / directory, tmp_path / directory)
+    monkeypatch.chdir(tmp_path)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    menu_path = tmp_path / "menu" / "menu.yaml"
+    menu = yaml.safe_load(menu_path.read_text(encoding="utf-8"))
+    output = tmp_path / "output"
+
+    MenuGenerator("./config/config.yaml")
+    plain = {path: path.read_text(encoding="utf-8") for path in output.rglob("*.[ch]")}
+
+    menu["config"]["shard_count"] = 3
+    menu_path.write_text(yaml.safe_dump(menu, allow_unicode=True), encoding="utf-8")
+    generator = MenuGenerator("./config/config.yaml")
+    assert generator.shard_count == 3
+
+    for stem in ("menu_edit", "menu_draw", "menu_data_config"):
+        shards = [output / f"{stem}.c", output / f"{stem}_1.c", output / f"{stem}_2.c"]
+        assert all(path.is_file() for path in shards)
+        assert not (output / f"{stem}_3.c").exists()
+
+    # Every handler is defined in exactly one shard; shared code only in shard 0
+    edit = "".join((output / name).read_text(encoding="utf-8")
+                   for name in ("menu_edit.c", "menu_edit_1.c", "menu_edit_2.c"))
+    assert edit.count("void ") == plain[output / "menu_edit.c"].count("void ")
+    assert "bool menu_draw_update" not in (output / "menu_draw_1.c").read_text(encoding="utf-8")
+    config = (output / "menu_data_config.c").read_text(encoding="utf-8")
+    assert "extern const" in config and "static const menu_node_config_t s_menu_config[]" in config
+    assert "s_menu_config" not in (output / "menu_data_config_2.c").read_text(encoding="utf-8")
+    for header in output.glob("include/*.h"):
+        assert header.read_text(encoding="utf-8") == plain[header]
+
+    # Too small a menu is not sharded, and the extra shards are removed
+    menu["config"]["shard_min_nodes"] = 1000
+    menu_path.write_text(yaml.safe_dump(menu, allow_unicode=True), encoding="utf-8")
+    MenuGenerator("./config/config.yaml")
+    assert plain == {path: path.read_text(encoding="utf-8") for path in output.rglob("*.[ch]")}
+
+
+def test_unity_build_output(monkeypatch, project_root, tmp_path):
+    """The unity build writes one source and one header with the internal functions static."""
+    import shutil
+
+    import yaml
+
+    for directory in ("config", "menu", "templates"):
+        shutil.copytree(project_root / directory, tmp_path / directory)
+    monkeypatch.chdir(tmp_path)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    menu_path = tmp_path / "menu" / "menu.yaml"
+    menu = yaml.safe_load(menu_path.read_text(encoding="utf-8"))
+    menu["config"]["unity_build"] = True
+    menu_path.write_text(yaml.safe_dump(menu, allow_unicode=True), encoding="utf-8")
+
+    MenuGenerator("./config/config.yaml")
+
+    output = tmp_path / "output"
+    assert sorted(str(path.relative_to(output)) for path in output.rglob("*.[ch]")) == [
+        "include/menu_all.h", "menu_all.c"]
+    source = (output / "menu_all.c").read_text(encoding="utf-8")
+    header = (output / "include" / "menu_all.h").read_text(encoding="utf-8")
+    assert "static void menu_navigate_handle_position(" in source
+    assert "\nvoid menu_init(void) {" in source
+    assert "void menu_init(void);" in header and "menu_navigate_handle_position" not in header
+    assert "typedef struct menu_context {" in header
+
+
+def test_check_mode_reports_differences_without_writing(monkeypatch, project_root, tmp_path):
+    """Check mode compares the renders with the output directory and writes nothing."""
+    import shutil
+
+    for directory in ("config", "menu", "templates"):
+        shutil.copytree(project_root / directory, tmp_path / directory)
+    monkeypatch.chdir(tmp_path)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    generator = MenuGenerator("./config/config.yaml", check=True)
+    assert not (tmp_path / "output").exists()
+    assert "output/menu.c" in {Path(path).as_posix() for path in generator.differences}
+
+    MenuGenerator("./config/config.yaml")
+    assert MenuGenerator("./config/config.yaml", check=True).differences == {}
+
+    menu_c = tmp_path / "output" / "menu.c"
+    edited = "/* local edit */\n" + menu_c.read_text(encoding="utf-8")
+    menu_c.write_text(edited, encoding="utf-8")
+    differences = MenuGenerator("./config/config.yaml", check=True).differences
+    assert [Path(path).name for path in differences] == ["menu.c"]
+    assert "-/* local edit */\n" in differences[next(iter(differences))]
+    assert menu_c.read_text(encoding="utf-8") == edited
+
+
+def test_check_mode_fails_on_a_broken_template(monkeypatch, project_root, tmp_path):
+    """A template that fails to render is an error in check mode, not an up-to-date output."""
+    import shutil
+
+    for directory in ("config", "menu", "templates"):
+        shutil.copytree(project_root / directory, tmp_path / directory)
+    monkeypatch.chdir(tmp_path)
+
+    from generate_menu.cli import _run
+    from generate_menu.menu_generator import MenuGenerator
+
+    MenuGenerator("./config/config.yaml")
+    assert _run("./config/config.yaml", flat_only=False, debug=False, check=True) == 0
+
+    (tmp_path / "templates" / "handle.c.jinja").write_text("{{ missing.value }}\n", encoding="utf-8")
+    generator = MenuGenerator("./config/config.yaml", check=True)
+    assert [Path(path).name for path in generator.errors] == ["menu.c"]
+    assert generator.differences == {}
+    assert _run("./config/config.yaml", flat_only=False, debug=False, check=True) == 1
+
+
+def test_table_sizes_are_logged_only_from_resolved_context(monkeypatch, project_root, tmp_path, caplog):
+    """The table size and string pool logs reuse what rendering resolved; with ``profile`` they are always logged."""
+    import logging
+    import shutil
+
+    for directory in ("config", "menu", "templates"):
+        shutil.copytree(project_root / directory, tmp_path / directory)
+    monkeypatch.chdir(tmp_path)
+    caplog.set_level(logging.INFO)
+
+    from generate_menu.menu_generator import MenuGenerator
+
+    MenuGenerator("./config/config.yaml")
+    assert "menu_id_t: uint8_t" in caplog.text
+    assert "String pool:" in caplog.text
+
+    # handle.h.jinja reads nothing from the context
+    (tmp_path / "config" / "files.yaml").write_text(
+        "templates_path: ./templates/\nfiles:\n  handle.h.jinja: include/menu.h\n", encoding="utf-8")
+    caplog.clear()
+    generator = MenuGenerator("./config/config.yaml")
+    assert "menu_id_t:" not in caplog.text and "String pool:" not in caplog.text
+    assert generator._context.computed == set()
+
+    caplog.clear()
+    MenuGenerator("./config/config.yaml", profile=True)
+    assert "menu_id_t: uint8_t" in caplog.text
+    assert "offsets: uint16_t" in caplog.text
@@ -0,0 +1,47 @@
+"""Unit tests for the compact id storage types and the table size estimate."""
+
+import pytest
+
+from generate_menu.c_layout import IdTypes, storage_type, struct_field, table_sizes, union_field
+
+
+def test_storage_type_holds_the_count():
+    assert storage_type(18) == ("uint8_t", 1)
+    assert storage_type(255) == ("uint8_t", 1)
+    assert storage_type(256) == ("uint16_t", 2)
+    assert storage_type(70000) == ("uint32_t", 4)
+    with pytest.raises(ValueError):
+        storage_type(1 << 32)
+
+    assert IdTypes(300, 5) == IdTypes(300, 5)
+    assert (IdTypes(300, 5).id, IdTypes(300, 5).category) == ("uint16_t", "uint8_t")
+    assert IdTypes(4, 3, 255).string == "uint8_t" and IdTypes(4, 3, 256).string == "uint16_t"
+
+
+def test_struct_layout():
+    assert struct_field([(1, 1), (4, 4), (1, 1)]) == (12, 4)
+    assert struct_field([(4, 4), (1, 1), (1, 1)]) == (8, 4)
+    assert struct_field([(2, 2), (0x20, 1)]) == (34, 2)
+    assert struct_field([]) == (0, 1)
+    assert union_field([(1, 1), (5, 1), (4, 4)]) == (8, 4)
+
+
+def test_table_sizes():
+    records = {"start": None, "speed": None, "level": None}
+    leaf_records = {"speed": None, "level": None}
+    categories = {
+        "ubyte_simple": {"type": "ubyte", "role": "simple", "c_type": "uint8_t"},
+        "string_fixed": {"type": "string", "role": "fixed", "c_type": "const char*"},
+    }
+    tables = {table.name: table for table in table_sizes(IdTypes(4, 3, 300), records, leaf_records, categories, True)}
+
+    assert {name: table.entries for name, table in tables.items()} == {
+        "s_menu_tree": 4, "s_menu_siblings": 3, "s_menu_config": 4, "s_menu_values": 4, "s_menu_id_names": 4, "menu_context_t": 1}
+    # 5 ids, uint16_t title offset, tree type, 3 sibling indexes and a flag: 44 bytes as enums, 12 compact
+    assert (tables["s_menu_tree"].enum_size, tables["s_menu_tree"].compact_size) == (4 * 44, 4 * 12)
+    assert tables["s_menu_siblings"].saved == 3 * 3
+    # The uint8_t data union packs right after the id
+    assert (tables["s_menu_values"].enum_size, tables["s_menu_values"].compact_size) == (4 * 8, 4 * 2)
+    assert (tables["s_menu_id_names"].enum_size, tables["s_menu_id_names"].compact_size) == (4 * 8, 4 * 4)
+    assert tables["menu_context_t"].saved == 8
+    assert all(table.memory == "RAM" for name, table in tables.items() if name in ("s_menu_values", "menu_context_t"))
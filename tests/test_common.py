@@ -0,0 +1,69 @@
+"""Unit tests for the streamed write-if-changed and diff helpers."""
+
+import hashlib
+import os
+import stat
+
+import pytest
+
+from generate_menu import common
+from generate_menu.common import diff_with_file, file_digest, write_if_changed
+
+
+def test_write_if_changed_streams_and_skips_identical_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(common, "WRITE_BUFFER_SIZE", 8)
+    path = tmp_path / "out" / "menu.c"
+    chunks = ["int ", "x = 1;\n", "/* Пауза */\n", "int y;\n"]
+
+    assert write_if_changed(iter(chunks), path)
+    assert path.read_text(encoding="utf-8") == "".join(chunks)
+    assert file_digest(path) == hashlib.sha256("".join(chunks).encode("utf-8")).digest()
+
+    os.utime(path, (0, 0))
+    assert not write_if_changed(iter(chunks), path)
+    assert path.stat().st_mtime == 0
+
+    assert write_if_changed(iter(chunks[:2]), path)
+    assert path.read_text(encoding="utf-8") == "int x = 1;\n"
+    assert sorted(p.name for p in path.parent.iterdir()) == ["menu.c"]
+
+
+def test_write_if_changed_removes_temporary_file_on_error(tmp_path):
+    def failing():
+        yield "partial"
+        raise RuntimeError("render failed")
+
+    path = tmp_path / "menu.c"
+    try:
+        write_if_changed(failing(), path)
+    except RuntimeError:
+        pass
+    assert list(tmp_path.iterdir()) == []
+    assert file_digest(path) is None
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_write_if_changed_keeps_file_permissions(tmp_path):
+    path = tmp_path / "menu.c"
+    umask = os.umask(0o022)
+    try:
+        assert write_if_changed(["int x;\n"], path)
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    path.chmod(0o640)
+    assert write_if_changed(["int y;\n"], path)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_diff_with_file(tmp_path):
+    path = tmp_path / "menu.c"
+    assert diff_with_file(None, path) == []
+    assert diff_with_file("int x;\n", path)[:2] == ["--- /dev/null\n", f"+++ {path}\n"]
+
+    path.write_text("int x;\nint y;\n", encoding="utf-8")
+    assert diff_with_file("int x;\nint y;\n", path) == []
+    diff = diff_with_file("int x;\nint z;\n", path)
+    assert "-int y;\n" in diff and "+int z;\n" in diff
+    assert diff_with_file(None, path)[1] == "+++ /dev/null\n"
@@ -0,0 +1,54 @@
+"""Unit tests for the streamed flat menu JSON writer."""
+
+import hashlib
+import json
+
+from generate_menu.menucraft import flat_node_record, iter_flat_json
+
+
+def test_streamed_json_matches_json_dump(menu_flattener):
+    flat_nodes = menu_flattener.flatten()
+    expected = json.dumps(
+        {"nodes": [flat_node_record(node) for node in flat_nodes if node.id != "root"]},
+        indent=2, ensure_ascii=False)
+
+    assert "".join(iter_flat_json(flat_nodes)) == expected
+    assert json.loads("".join(iter_flat_json(menu_flattener.iter_flatten())))["nodes"][0]["id"] == "start"
+
+
+def test_streamed_json_of_empty_menu(menu_flattener):
+    text = "".join(iter_flat_json(menu_flattener.iter_flatten([])))
+    assert text == json.dumps({"nodes": []}, indent=2)
+
+
+def test_streamed_json_can_be_hashed_chunk_by_chunk(menu_flattener):
+    digest = hashlib.sha256()
+    for chunk in iter_flat_json(menu_flattener.iter_flatten()):
+        digest.update(chunk.encode("utf-8"))
+
+    whole = "".join(iter_flat_json(menu_flattener.flatten())).encode("utf-8")
+    assert digest.hexdigest() == hashlib.sha256(whole).hexdigest()
+
+
+def test_saved_json_streams_the_edited_menu(monkeypatch, project_root, tmp_path):
+    """save_flattern_json() streams the held, edited nodes without flattening again."""
+    from generate_menu.menu_flattener import MenuFlattener
+    from generate_menu.menucraft import MenuCraft
+
+    monkeypatch.chdir(project_root)
+    processor = MenuCraft("./config/config.yaml")
+    processor.flattener.update_node("version", {"title": "Firmware"})
+    processor.flattener.delete_node("pwm_frequency")
+
+    flattened = []
+    for name in ("flatten", "iter_flatten"):
+        original = getattr(MenuFlattener, name)
+        monkeypatch.setattr(MenuFlattener, name, lambda self, *args, _original=original:
+                            flattened.append(True) or _original(self, *args))
+
+    path = tmp_path / "flat.json"
+    processor.save_flattern_json(str(path))
+
+    assert not flattened
+    assert '"Firmware"' in path.read_text(encoding="utf-8")
+    assert path.read_text(encoding="utf-8") == "".join(iter_flat_json(processor.flattener.flat_nodes))
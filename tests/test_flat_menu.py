@@ -0,0 +1,61 @@
+"""Unit tests for the array-backed ``FlatMenu`` representation."""
+
+from generate_menu.flat_menu import NO_NODE, FlatMenu
+
+
+def _links(node):
+    def node_id(other):
+        return other.id if other is not None else None
+
+    return (
+        node.id,
+        node.name,
+        node.navigate,
+        node_id(node.parent),
+        node_id(node.first_child),
+        node_id(node.last_child),
+        node_id(node.prev_sibling),
+        node_id(node.next_sibling),
+        [child.id for child in node.children],
+        node.is_leaf,
+    )
+
+
+def test_compact_matches_object_graph(menu_config):
+    from generate_menu.menu_flattener import MenuFlattener
+
+    flattener = MenuFlattener(menu_config)
+    flat_nodes = flattener.flatten()
+    flat_menu = flattener.flatten_compact()
+
+    assert isinstance(flat_menu, FlatMenu)
+    assert len(flat_menu) == len(flat_nodes) == 18
+    assert [_links(view) for view in flat_menu] == [_links(node) for node in flat_nodes]
+
+
+def test_compact_columns_and_string_table(menu_flattener):
+    flat_menu = menu_flattener.flatten_compact()
+
+    root = flat_menu.root
+    assert root.id == "root"
+    assert flat_menu.parent[0] == NO_NODE
+    assert flat_menu.depth[0] == 0
+
+    hi_on = flat_menu.node("hi_on")
+    assert hi_on.depth == 3
+    assert flat_menu.parent[hi_on.row] == flat_menu.row_of("hi_channel")
+    # hi_channel is cyclic: the first child wraps around to the last one.
+    assert hi_on.prev_sibling.id == "hi_duty"
+    assert flat_menu.node("missing") is None
+
+    # Repeated titles ("Delay", "PWM Duty", ...) are stored once.
+    titles = [view.name for view in flat_menu]
+    assert len(flat_menu.strings) < len(titles) * 2
+    assert flat_menu.titles[flat_menu.row_of("hi_delay")] == flat_menu.titles[flat_menu.row_of("lo_delay")]
+
+
+def test_compact_empty_menu_is_root_only(menu_flattener):
+    flat_menu = menu_flattener.flatten_compact([])
+    assert len(flat_menu) == 1
+    assert flat_menu.root.children == []
+    assert flat_menu.root.is_leaf
@@ -1,5 +1,7 @@
 """Unit tests for MenuFlattener (tree flattening and sibling/cyclic links)."""
 
+import pytest
+
 
 def test_flatten_real_config(menu_flattener):
     flat = menu_flattener.flatten()
@@ -69,9 +71,9 @@ def test_branch_without_explicit_navigate_gets_default_branch_navigate(menu_flat
     Branches without an explicit navigate receive default_branch_navigate
     ("cyclic"), so their children are cyclic-linked.
 
-    ``_process_node`` applies ``default_navigate`` only to leaf nodes; branches
-    keep ``navigate=None`` until ``_apply_branch_navigation_rules`` runs, which
-    then applies ``default_branch_navigate`` ("cyclic" in menu.yaml).
+    ``_apply_default_navigation`` applies ``default_navigate`` only to leaf
+    nodes; branches receive ``default_branch_navigate`` ("cyclic" in
+    menu.yaml) before their own children are linked.
     """
     menu_flattener.flatten()
     hi_channel = menu_flattener.get_node_by_id("hi_channel")
@@ -91,3 +93,220 @@ def test_flatten_empty_list_returns_root_only(menu_flattener):
     assert len(flat) == 1
     assert flat[0].id == "root"
     assert flat[0].children == []
+
+
+def test_flatten_order_is_depth_first(menu_flattener):
+    flat = menu_flattener.flatten()
+    ids = [node.id for node in flat]
+    assert ids[:6] == ["root", "start", "regimes", "version", "settings", "pwm_frequency"]
+    assert ids.index("hi_duty") < ids.index("lo_channel")
+    assert None not in flat
+
+
+def test_flatten_deep_tree_without_recursion(menu_flattener):
+    """Trees deeper than the interpreter recursion limit still flatten."""
+    import sys
+
+    depth = sys.getrecursionlimit() + 100
+    leaf = {"id": "leaf", "title": "Leaf", "type": "ubyte", "role": "simple",
+            "min": 0, "max": 10, "default": 0}
+    menu = [leaf]
+    for level in range(depth):
+        menu = [{"id": f"level_{level}", "title": "Level", "items": menu}]
+
+    flat = menu_flattener.flatten(menu)
+    assert len(flat) == depth + 2
+    assert flat[-1].id == "leaf"
+    assert flat[-1].parent.id == "level_0"
+
+
+def test_nodes_and_managers_are_slotted(menu_flattener):
+    """Nodes, their managers and function infos carry no per-instance __dict__."""
+    menu_flattener.flatten()
+    node = menu_flattener.get_node_by_id("hi_delay")
+
+    for obj in (node, node.data_manager, node.control_manager,
+                node.navigation_manager, node.callback_manager):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+    from generate_menu.managers.function_info import FunctionInfo
+    info = FunctionInfo.create_auto("hi_delay", "udword", "factor", "uint32_t",
+                                    "udword_factor_click_cyclic_factor_cb", "click", "cyclic",
+                                    "change_factor_index")
+    assert not hasattr(info, "__dict__")
+
+
+def test_managers_are_created_on_first_access(menu_flattener):
+    """Flattening builds no managers; typed nodes build their own on demand."""
+    menu_flattener.flatten()
+    node = menu_flattener.get_node_by_id("hi_delay")
+
+    assert node._data_manager is None
+    assert node._callback_manager is None
+    assert node._navigation_manager is None
+
+    # The control manager fills in the automatic functions of the callback manager
+    assert node.get_click_info()["name"] == node.control_manager.all_function_infos[0]["name"]
+    assert node.navigation_manager is node.navigation_manager
+
+
+def test_function_table_is_memoized(menu_flattener):
+    """Function infos are built once per node and rebuilt only on invalidation."""
+    from dataclasses import asdict
+    from generate_menu.managers.function_info import FunctionInfo
+
+    info = FunctionInfo.create_auto("hi_delay", "udword", "factor", "uint32_t",
+                                    "udword_factor_click_cyclic_factor_cb", "click", "cyclic",
+                                    "change_factor_index")
+    assert info.to_dict() == asdict(info)
+
+    menu_flattener.flatten()
+    node = menu_flattener.get_node_by_id("hi_delay")
+    table = node.function_table
+
+    assert isinstance(table, tuple) and table
+    assert node.function_table is table
+    assert node.all_function_infos == list(table)
+    assert all(info["node_id"] == "hi_delay" for info in table)
+    assert node.control_manager.function_table is node.control_manager.function_table
+
+    node.invalidate_functions()
+    assert node.function_table is not table
+    assert node.function_table == table
+
+
+def test_branches_share_null_managers(menu_flattener):
+    """Payload-free branches share one read-only data and callback manager."""
+    menu_flattener.flatten()
+    hi_channel = menu_flattener.get_node_by_id("hi_channel")
+    lo_channel = menu_flattener.get_node_by_id("lo_channel")
+    hi_delay = menu_flattener.get_node_by_id("hi_delay")
+
+    assert hi_channel.data_manager is lo_channel.data_manager
+    assert hi_channel.callback_manager is lo_channel.callback_manager
+    assert hi_channel.data_manager is not hi_delay.data_manager
+    assert hi_channel.control_manager is None
+    assert hi_channel.defined_callback_infos == {}
+    assert hi_channel.get_data_summary()["id"] == "hi_channel"
+
+    # Writing through a branch never leaks into the shared manager
+    hi_channel.step = 5
+    assert hi_channel.step == 5
+    assert lo_channel.step == 1
+
+
+def test_sibling_positions_are_stored(menu_flattener):
+    """Sibling index/count come from flatten time, even for wide branches."""
+    channels = [{"id": f"ch_{i}", "title": f"Channel {i}", "type": "ubyte", "role": "simple",
+                 "min": 0, "max": 10, "default": 0} for i in range(600)]
+    menu_flattener.flatten([{"id": "channels", "title": "Channels", "items": channels}])
+
+    for index in (0, 1, 299, 599):
+        node = menu_flattener.get_node_by_id(f"ch_{index}")
+        assert node.sibling_index == index
+        assert node.sibling_count == 600
+        assert node.navigation_manager.sibling_index == index
+    assert menu_flattener.get_node_by_id("ch_599").is_last_child
+    assert repr(menu_flattener.get_node_by_id("ch_42")).endswith("43/600)")
+
+
+def test_children_api_keeps_links_and_positions(menu_flattener):
+    """insert_child/remove_child update links, positions and the cyclic closure."""
+    menu_flattener.flatten()
+    parent = menu_flattener.get_node_by_id("hi_channel")  # cyclic
+    for node in (parent, *parent.children):
+        node.thaw()
+    first, *_, last = parent.children
+    count = len(parent.children)
+
+    moved = parent.children[1]
+    assert parent.remove_child(moved) == 1
+    assert moved.parent is None and moved.prev_sibling is None
+    assert [child.sibling_index for child in parent.children] == list(range(count - 1))
+    assert first.next_sibling is parent.children[1]
+
+    parent.append_child(moved)
+    assert parent.last_child is moved and moved.sibling_index == count - 1
+    assert moved.prev_sibling is last
+    assert moved.next_sibling is first and first.prev_sibling is moved
+
+    parent.remove_child(last)
+    parent.insert_child(0, last)
+    assert parent.first_child is last and last.prev_sibling is moved
+    assert [child.sibling_index for child in parent.children] == list(range(count))
+
+    # Switching off cyclic navigation opens the sibling chain
+    parent.navigate = "limit"
+    assert last.prev_sibling is None and moved.next_sibling is None
+
+
+def test_flatten_freezes_resolved_links(menu_flattener):
+    """After flatten() links are plain fields and can no longer be changed."""
+    from generate_menu.base_flat_node import FrozenNodeError
+
+    flat = menu_flattener.flatten()
+    assert all(node.frozen for node in flat)
+
+    hi_on = menu_flattener.get_node_by_id("hi_on")
+    hi_duty = menu_flattener.get_node_by_id("hi_duty")
+    assert hi_on._prev_sibling is hi_duty and hi_duty._next_sibling is hi_on
+    # Frozen reads never fall back to the navigation manager
+    assert menu_flattener.get_node_by_id("pwm_frequency").prev_sibling is None
+    assert all(node._navigation_manager is None for node in flat)
+
+    with pytest.raises(FrozenNodeError):
+        hi_on.next_sibling = None
+    with pytest.raises(FrozenNodeError):
+        hi_on.parent.navigate = "limit"
+    with pytest.raises(FrozenNodeError):
+        hi_on.parent.remove_child(hi_on)
+
+
+def test_iter_flatten_streams_frozen_nodes(menu_config):
+    """iter_flatten() yields flatten()'s order and links without collecting nodes."""
+    from generate_menu.menu_flattener import MenuFlattener
+
+    expected = [(node.id, node.parent and node.parent.id, node.prev_sibling and node.prev_sibling.id,
+                 node.next_sibling and node.next_sibling.id, [child.id for child in node.children])
+                for node in MenuFlattener(menu_config).flatten()]
+
+    flattener = MenuFlattener(menu_config)
+    streamed = []
+    for node in flattener.iter_flatten():
+        # The links of the node are final (and frozen) at yield time
+        assert node.frozen
+        streamed.append((node.id, node.parent and node.parent.id, node.prev_sibling and node.prev_sibling.id,
+                         node.next_sibling and node.next_sibling.id, [child.id for child in node.children]))
+
+    assert streamed == expected
+    assert flattener.flat_nodes == [] and flattener.node_dict == {}
+
+
+def test_iter_flatten_releases_consumed_nodes(menu_flattener):
+    """Streamed nodes are dropped once consumed, so live nodes stay bounded by the pending groups."""
+    import gc
+
+    from generate_menu.base_flat_node import BaseFlatNode
+
+    leaf = {"title": "Leaf", "type": "ubyte", "role": "simple", "min": 0, "max": 10, "default": 0}
+    menu = [{"id": f"branch_{branch}", "title": "Branch",
+             "items": [{"id": f"leaf_{branch}_{index}", **leaf} for index in range(20)]}
+            for branch in range(20)]
+
+    nodes = menu_flattener.iter_flatten(menu)
+    root = next(nodes)
+    assert len(root.children) == 20
+    assert next(nodes).id == "branch_0"
+    # The root was consumed: its links are gone
+    assert root.children == [] and root.first_child is None
+
+    def live_nodes():
+        return sum(isinstance(obj, BaseFlatNode) for obj in gc.get_objects())
+
+    before = live_nodes()
+    peak = 0
+    for index, _node in enumerate(nodes):
+        if index % 25 == 0:
+            peak = max(peak, live_nodes() - before)
+    # 421 nodes are streamed; at most the branches and one group of leaves are pending
+    assert peak < 60
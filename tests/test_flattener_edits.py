@@ -0,0 +1,147 @@
+"""Unit tests for the incremental edit operations of MenuFlattener."""
+
+import copy
+
+import pytest
+
+from generate_menu.menu_flattener import FlattenerError, MenuFlattener, NodeChange
+
+
+def _graph(flattener):
+    def node_id(node):
+        return node.id if node is not None else None
+
+    return [
+        (
+            node.id,
+            node.navigate,
+            node_id(node.parent),
+            node_id(node.first_child),
+            node_id(node.last_child),
+            node_id(node.prev_sibling),
+            node_id(node.next_sibling),
+            node.sibling_index,
+            node.sibling_count,
+            node.frozen,
+        )
+        for node in flattener.flat_nodes
+    ]
+
+
+@pytest.fixture()
+def edited(menu_config):
+    """A flattener over a private copy of the real menu tree."""
+    flattener = MenuFlattener(menu_config)
+    flattener.flatten(copy.deepcopy(menu_config.menu_tree))
+    return flattener
+
+
+def _assert_matches_full_flatten(flattener, menu_config):
+    """The patched graph equals flattening the edited source tree from scratch."""
+    fresh = MenuFlattener(menu_config)
+    fresh.flatten(copy.deepcopy(flattener.root_node.original_node["items"]))
+    assert _graph(flattener) == _graph(fresh)
+    assert flattener.node_dict.keys() == fresh.node_dict.keys()
+
+
+def test_insert_node_with_subtree(edited, menu_config):
+    new_branch = {
+        "id": "extra",
+        "title": "Extra",
+        "items": [
+            {"id": "extra_a", "title": "A", "type": "ubyte", "role": "simple",
+             "min": 0, "max": 9, "default": 0},
+            {"id": "extra_b", "title": "B", "type": "ubyte", "role": "simple",
+             "min": 0, "max": 9, "default": 0},
+        ],
+    }
+    node = edited.insert_node("hi_channel", 1, new_branch)
+
+    assert node.sibling_index == 1
+    assert edited.get_node_by_id("extra_b").parent is node
+    _assert_matches_full_flatten(edited, menu_config)
+
+    # Inserting the first child of a leaf turns it into a branch
+    edited.insert_node("version", 0, {"id": "build", "title": "Build", "type": "ubyte",
+                                      "role": "simple", "min": 0, "max": 9, "default": 0})
+    _assert_matches_full_flatten(edited, menu_config)
+
+
+def test_delete_node_removes_subtree(edited, menu_config):
+    removed = edited.delete_node("hi_channel")
+
+    assert removed.parent is None
+    assert edited.get_node_by_id("hi_on") is None
+    _assert_matches_full_flatten(edited, menu_config)
+
+
+def test_move_node_between_parents(edited, menu_config):
+    edited.move_node("hi_delay", "lo_channel", 0)
+    _assert_matches_full_flatten(edited, menu_config)
+
+    edited.move_node("lo_channel", "root", len(edited.root_node.children))
+    assert edited.root_node.last_child.id == "lo_channel"
+    _assert_matches_full_flatten(edited, menu_config)
+
+
+def test_update_node_fields(edited, menu_config):
+    node = edited.update_node("hi_channel", {"navigate": "limit"})
+    assert node.first_child.prev_sibling is None
+    _assert_matches_full_flatten(edited, menu_config)
+
+    node = edited.update_node("hi_delay", {"id": "hi_pause", "title": "Pause", "step": 10})
+    assert edited.get_node_by_id("hi_pause") is node
+    assert node.name == "Pause" and node.step == 10
+    _assert_matches_full_flatten(edited, menu_config)
+
+
+def test_edits_change_the_source_tree_in_place(menu_config):
+    """The edits are made on the tree given to flatten(), which is not copied."""
+    tree = copy.deepcopy(menu_config.menu_tree)
+    flattener = MenuFlattener(menu_config)
+    flattener.flatten(tree)
+
+    settings = next(item for item in tree if item["id"] == "settings")
+    hi_channel = next(item for item in settings["items"] if item["id"] == "hi_channel")
+    hi_delay = next(item for item in hi_channel["items"] if item["id"] == "hi_delay")
+
+    flattener.update_node("hi_delay", {"title": "Pause", "step": None})
+    assert hi_delay["title"] == "Pause" and "step" not in hi_delay
+
+    node_data = {"id": "build", "title": "Build", "type": "ubyte", "role": "simple",
+                 "min": 0, "max": 9, "default": 0}
+    flattener.insert_node("hi_channel", 0, node_data)
+    assert hi_channel["items"][0] is node_data
+    flattener.move_node("hi_delay", "root", 0)
+    assert tree[0] is hi_delay and all(item is not hi_delay for item in hi_channel["items"])
+    flattener.delete_node("build")
+    assert all(item is not node_data for item in hi_channel["items"])
+
+
+def test_edit_errors(edited):
+    with pytest.raises(FlattenerError):
+        edited.insert_node("missing", 0, {"id": "x", "title": "X"})
+    with pytest.raises(FlattenerError):
+        edited.insert_node("root", 0, {"id": "hi_on", "title": "Duplicate"})
+    with pytest.raises(FlattenerError):
+        edited.delete_node("root")
+    with pytest.raises(FlattenerError):
+        edited.move_node("hi_channel", "hi_on", 0)
+    with pytest.raises(FlattenerError):
+        edited.update_node("hi_on", {"items": []})
+
+
+def test_edits_notify_listeners(edited):
+    changes = []
+    edited.add_listener(lambda change, node: changes.append((change, node.id)))
+
+    edited.update_node("hi_delay", {"title": "Pause", "step": 10, "click_cb": "pause_cb"})
+    edited.update_node("hi_channel", {"navigate": "limit"})
+    edited.move_node("hi_delay", "lo_channel", 0)
+    assert changes == [
+        (NodeChange.TITLE, "hi_delay"),
+        (NodeChange.FIELD, "hi_delay"),
+        (NodeChange.CALLBACKS, "hi_delay"),
+        (NodeChange.CONTROLS, "hi_channel"),
+        (NodeChange.STRUCTURE, "hi_delay"),
+    ]
@@ -1,7 +1,7 @@
 """Unit tests for ``MenuDataAggregator`` (plan item P2/A1).
 
 The aggregator derives all aggregated menu structures from the flattened
-node list and memoizes them with ``functools.cached_property``. These tests
+node list in a single walk and memoizes the result. These tests
 lock in that behaviour and verify that ``MenuCraft`` delegates to the
 very same aggregator object while keeping its public API intact.
 """
@@ -23,7 +23,7 @@ def test_aggregator_builds_from_flat_nodes(menu_flattener):
 
 
 def test_aggregator_caches_results(menu_flattener):
-    """cached_property returns the same object on repeated access."""
+    """Repeated access returns the same cached object."""
     from generate_menu.menu_data_aggregator import MenuDataAggregator
 
     flat = menu_flattener.flatten()
@@ -79,3 +79,219 @@ def test_aggregator_matches_processor_results(monkeypatch, project_root):
     assert aggregator.functions_by_type == processor.functions_by_type
     assert aggregator.functions_by_role == processor.functions_by_role
     assert aggregator.functions_by_navigation == processor.functions_by_navigation
+
+
+def test_aggregator_visits_each_node_once(menu_flattener, monkeypatch):
+    """All groupings are filled by one walk, on the first access to any of them."""
+    from generate_menu.base_flat_node import BaseFlatNode
+    from generate_menu.menu_data_aggregator import MenuDataAggregator
+
+    flat = menu_flattener.flatten()
+    aggregator = MenuDataAggregator(flat)
+
+    visits = []
+    original = BaseFlatNode.all_function_infos
+    monkeypatch.setattr(BaseFlatNode, "all_function_infos",
+                        property(lambda node: visits.append(node.id) or original.fget(node)))
+
+    aggregator.functions_by_role
+    aggregator.auto_generated_functions
+    aggregator.categories
+    aggregator.callback_summary_by_category
+
+    assert sorted(visits) == sorted(aggregator.menu)
+    # The category copy does not leak into the shared node category dict.
+    assert all("available_controls" not in info["category"]
+               for info in aggregator.functions.values() if info.get("category"))
+
+
+def test_concurrent_readers_build_the_aggregates_once(menu_flattener, monkeypatch):
+    """Threads reading a stale aggregate wait for one rebuild and share its result."""
+    import threading
+    import time
+
+    from generate_menu import menu_data_aggregator
+
+    aggregator = menu_data_aggregator.MenuDataAggregator(menu_flattener.flatten())
+    builds = []
+    collect = menu_data_aggregator.collect_aggregates
+
+    def slow_collect(*args):
+        builds.append(args)
+        time.sleep(0.05)
+        return collect(*args)
+
+    monkeypatch.setattr(menu_data_aggregator, "collect_aggregates", slow_collect)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(aggregator.functions)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert len(results) == 4 and all(result is results[0] for result in results)
+
+
+def test_query_methods_use_prebuilt_indexes(menu_flattener):
+    """The get_* queries are dict lookups matching a scan over the nodes."""
+    from generate_menu.menu_data_aggregator import MenuDataAggregator
+
+    flat = menu_flattener.flatten()
+    aggregator = MenuDataAggregator(flat)
+    nodes = [node for node in flat if node.id != "root"]
+
+    udword = aggregator.get_functions_by_category("udword_factor")
+    assert udword and all(info["category"] == "udword_factor" for info in udword)
+    assert aggregator.get_functions_by_category("udword_factor") is udword
+    assert aggregator.get_functions_by_category("missing") == ()
+    # External callback infos carry the category dict instead of its name
+    external = aggregator.get_functions_by_category("callback_callback")
+    assert {info["node_id"] for info in external if info["source"] == "external"} == \
+        set(aggregator.callback_nodes)
+
+    assert aggregator.get_callbacks_by_type("event_cb") == {
+        node.id: node.callback_manager.event_cb for node in nodes if node.callback_manager.event_cb
+    }
+    assert aggregator.get_callbacks_by_type("missing") == {}
+
+    expected = {}
+    for node in nodes:
+        if node.category_name == "udword_factor":
+            for cb_type, info in node.defined_callback_infos.items():
+                expected.setdefault(cb_type, []).append(info)
+    assert aggregator.get_callbacks_by_category("udword_factor") == {
+        cb_type: tuple(infos) for cb_type, infos in expected.items()
+    }
+    assert aggregator.callback_summary_by_category["udword_factor"] is \
+        aggregator.get_callbacks_by_category("udword_factor")
+
+
+def test_aggregates_are_frozen_and_picklable(menu_flattener):
+    """Aggregated results are read-only snapshots that share infos by reference."""
+    import pickle
+
+    import pytest
+
+    from generate_menu.frozen import FrozenDict
+    from generate_menu.menu_data_aggregator import MenuDataAggregator
+
+    flat = menu_flattener.flatten()
+    aggregator = MenuDataAggregator(flat)
+    functions = aggregator.functions
+    categories = aggregator.categories
+
+    assert isinstance(functions, FrozenDict)
+    with pytest.raises(TypeError):
+        functions["extra"] = {}
+    info = next(iter(functions.values()))
+    with pytest.raises(TypeError):
+        info["name"] = "renamed"
+    assert isinstance(aggregator.functions_by_role["factor"], tuple)
+    assert all(any(grouped is info for info in functions.values())
+               for grouped in aggregator.functions_by_role["factor"])
+
+    # The node category dicts are left untouched
+    for name, category in categories.items():
+        assert "available_controls" in category
+    assert all("available_controls" not in node.category for node in flat if node.category)
+
+    assert pickle.loads(pickle.dumps(functions)) == functions
+    assert pickle.loads(pickle.dumps(categories)) == categories
+
+
+def test_node_changes_invalidate_dependent_aggregates(monkeypatch, project_root):
+    """Edits through the flattener rebuild only the aggregates that depend on them."""
+    monkeypatch.chdir(project_root)
+
+    from generate_menu.menu_data_aggregator import MenuDataAggregator
+    from generate_menu.menucraft import MenuCraft
+
+    processor = MenuCraft("./config/config.yaml")
+    data = processor.data
+    menu = data.menu
+    by_type_role = data.functions_by_type_role
+
+    # A title edit swaps in the node's render record, nothing is rebuilt
+    processor.flattener.update_node("hi_delay", {"title": "Pause"})
+    assert data.stale_groups == set()
+    assert data.functions_by_type_role is by_type_role
+    assert data.records["hi_delay"].title == "Pause"
+
+    # A callback edit leaves the node and category groupings alone
+    processor.flattener.update_node("hi_delay", {"event_cb": "hi_delay_event_cb"})
+    assert data.stale_groups == {"functions", "callbacks"}
+    assert data.menu is menu
+    assert data.callbacks_by_type["event_cb"]["hi_delay"] == "hi_delay_event_cb"
+    assert "hi_delay_event_cb" in data.functions
+
+    # A structural edit rebuilds everything from the new node list
+    processor.flattener.delete_node("hi_channel")
+    assert "hi_on" not in data.menu
+    fresh = MenuDataAggregator(processor.flattener.flat_nodes)
+    assert data.functions == fresh.functions
+    assert data.detailed_callback_infos == fresh.detailed_callback_infos
+    assert data.leafs == fresh.leafs
+
+
+def _all_aggregates(aggregator):
+    from generate_menu.menu_data_aggregator import AGGREGATE_GROUPS
+
+    return {name: getattr(aggregator, name) for names, _changes in AGGREGATE_GROUPS.values() for name in names}
+
+
+def test_node_edits_reread_only_the_edited_nodes(monkeypatch, project_root):
+    """update_node() re-reads the edited node (and its linked nodes), never the whole menu."""
+    monkeypatch.chdir(project_root)
+
+    from generate_menu import menu_data_aggregator
+    from generate_menu.base_flat_node import BaseFlatNode
+    from generate_menu.menucraft import MenuCraft
+    from generate_menu.render_record import RenderRecord
+
+    processor = MenuCraft("./config/config.yaml")
+    data = processor.data
+    _all_aggregates(data)
+
+    records = []
+    monkeypatch.setattr(menu_data_aggregator, "RenderRecord",
+                        lambda node: records.append(node.id) or RenderRecord(node))
+    functions = []
+    all_function_infos = BaseFlatNode.all_function_infos
+    monkeypatch.setattr(BaseFlatNode, "all_function_infos",
+                        property(lambda node: functions.append(node.id) or all_function_infos.fget(node)))
+
+    # A title edit rebuilds one record; the other records are the same objects
+    before = data.records
+    processor.flattener.update_node("hi_delay", {"title": "Pause"})
+    assert data.records["hi_delay"].title == "Pause"
+    assert records == ["hi_delay"] and functions == []
+    assert all(data.records[node_id] is record for node_id, record in before.items() if node_id != "hi_delay")
+
+    # A value limit changes the record only: the function groupings stay as they are
+    records.clear()
+    by_type_role = data.functions_by_type_role
+    processor.flattener.update_node("hi_delay", {"max": 5})
+    assert data.stale_groups == set()
+    assert data.functions_by_type_role is by_type_role
+    assert records == ["hi_delay"] and functions == ["hi_delay"]
+
+    # A callback edit re-reads the node once for every group it touches
+    records.clear()
+    functions.clear()
+    processor.flattener.update_node("hi_delay", {"event_cb": "hi_delay_event_cb"})
+    assert "hi_delay_event_cb" in data.functions
+    assert records == ["hi_delay"] and functions == ["hi_delay"]
+
+    # Navigate closes the cycle of the children; an id is named by the linked nodes
+    records.clear()
+    processor.flattener.update_node("settings", {"navigate": "cyclic"})
+    processor.flattener.update_node("hi_channel", {"id": "high_channel"})
+    data.records
+    assert records == ["settings", "pwm_frequency", "hi_channel", "lo_channel",
+                       "high_channel", "settings", "pwm_frequency", "lo_channel",
+                       "hi_on", "hi_delay", "hi_duration", "hi_pwm_on", "hi_duty"]
+
+    fresh = menu_data_aggregator.MenuDataAggregator(processor.flattener.flat_nodes)
+    assert _all_aggregates(data) == _all_aggregates(fresh)
+    assert list(data.records) == list(fresh.records) and list(data.functions) == list(fresh.functions)
@@ -0,0 +1,58 @@
+"""Unit tests for payload interning (shared per-shape node records)."""
+
+import copy
+
+from generate_menu.menu_data_aggregator import MenuDataAggregator
+from generate_menu.menu_flattener import MenuFlattener
+
+
+def _leaf(node_id):
+    return {"id": node_id, "title": node_id.title(), "type": "udword", "role": "factor",
+            "default": 10, "min": 10, "max": 1000, "factors": [1, 10, 100]}
+
+
+def test_identical_shapes_share_one_payload(menu_config):
+    flattener = MenuFlattener(menu_config)
+    flattener.flatten([{"id": "group", "title": "Group",
+                        "items": [_leaf("a"), _leaf("b"), {**_leaf("c"), "step": 5}]}])
+    a, b, c = (flattener.get_node_by_id(node_id) for node_id in "abc")
+
+    assert a.payload is b.payload and a.payload is not c.payload
+    assert a.data_manager is b.data_manager
+    assert a.control_manager is b.control_manager
+    assert flattener.get_node_by_id("group").payload is None
+    assert flattener.payload_stats == {"nodes": 3, "shapes": 2, "dedup_ratio": 1.5}
+
+    # Shared managers never leak another node's id
+    assert [info["node_id"] for info in b.all_function_infos] == ["b"] * len(a.all_function_infos)
+    assert b.get_click_info()["node_id"] == "b"
+    assert b.get_control_summary()["node_id"] == "b"
+
+    # Per-node writes detach from the shared record
+    a.step = 7
+    assert a.step == 7 and b.step == 1
+
+
+def test_interning_does_not_change_results(menu_config):
+    def aggregate(intern_payloads):
+        flattener = MenuFlattener(menu_config, intern_payloads=intern_payloads)
+        aggregator = MenuDataAggregator(flattener.flatten())
+        return (aggregator.functions, aggregator.detailed_callback_infos,
+                {node_id: node.get_control_summary() for node_id, node in aggregator.menu.items()})
+
+    assert aggregate(True) == aggregate(False)
+
+
+def test_edits_keep_payload_stats(menu_config):
+    flattener = MenuFlattener(menu_config)
+    flattener.flatten(copy.deepcopy(menu_config.menu_tree))
+    before = flattener.payload_stats
+
+    flattener.insert_node("root", 0, _leaf("extra"))
+    assert flattener.payload_stats["nodes"] == before["nodes"] + 1
+
+    node = flattener.update_node("extra", {"max": 2000})
+    assert node.max == 2000 and node.payload.fields["max"] == 2000
+
+    flattener.delete_node("extra")
+    assert flattener.payload_stats == before
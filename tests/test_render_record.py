@@ -0,0 +1,49 @@
+"""Unit tests for the per-node render records."""
+
+from generate_menu.render_record import NO_CALLBACK, NO_LINK, RenderRecord, changed_fields, sibling_groups
+
+
+def test_record_matches_node(menu_flattener):
+    nodes = {node.id: node for node in menu_flattener.flatten()}
+
+    for node_id, node in nodes.items():
+        if node_id == "root":
+            continue
+        record = RenderRecord(node)
+        assert record.enum == f"MENU_ID_{node_id.upper()}"
+        assert record.title == node.name
+        assert record.next == (f"MENU_ID_{node.next_sibling.id.upper()}" if node.next_sibling else NO_LINK)
+        assert record.tree_type == ("LEAF" if node.is_leaf else "BRANCH")
+        assert record.position == node.sibling_index
+        assert record.click_cb == (node.effective_click_cb_name or NO_CALLBACK)
+        assert record.event_cb == (node.effective_event_cb_name or NO_CALLBACK)
+        if node.is_leaf:
+            assert record.category_enum == f"MENU_CATEGORY_{node.category['name'].upper()}"
+            assert record.c_str_values == node.c_str_values
+
+
+def test_changed_fields(menu_flattener):
+    nodes = [node for node in menu_flattener.flatten() if node.id != "root"]
+    old = {node.id: RenderRecord(node) for node in nodes}
+
+    assert changed_fields(old, dict(old)) == set()
+
+    menu_flattener.update_node("hi_delay", {"title": "Pause"})
+    new = {node.id: RenderRecord(node) for node in nodes}
+    assert changed_fields(old, new) == {"title"}
+    assert changed_fields(old, dict(reversed(new.items()))) is None
+
+
+def test_sibling_groups(menu_flattener):
+    records = {node.id: RenderRecord(node) for node in menu_flattener.flatten() if node.id != "root"}
+    groups = sibling_groups(records)
+
+    # Root children are cyclic, the settings children stop at the ends
+    assert list(groups)[:2] == ["MENU_ID_ROOT", "MENU_ID_SETTINGS"]
+    assert groups["MENU_ID_ROOT"].offset == 0 and groups["MENU_ID_ROOT"].cyclic
+    assert groups["MENU_ID_SETTINGS"].offset == len(groups["MENU_ID_ROOT"].ids)
+    assert not groups["MENU_ID_SETTINGS"].cyclic
+    assert sum(len(group.ids) for group in groups.values()) == len(records)
+    for record in records.values():
+        assert groups[record.parent].ids[record.position] == record.enum
+    assert sibling_groups(records) == groups
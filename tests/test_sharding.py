@@ -0,0 +1,26 @@
+"""Unit tests for the sharding helpers."""
+
+from pathlib import Path
+
+from generate_menu.sharding import ShardContext, shard_path, split
+
+
+def test_split_is_contiguous_and_balanced():
+    items = {f"f{index}": index for index in range(7)}
+
+    slices = split(items, 3)
+    assert [list(part) for part in slices] == [["f0", "f1", "f2"], ["f3", "f4"], ["f5", "f6"]]
+    assert [list(part) for part in split(items, 3, lambda value: value % 2 == 0)] == [
+        ["f0", "f2"], ["f4"], ["f6"]]
+    assert len(split(items, 10)) == 7
+    assert split({}, 3) == [{}]
+
+
+def test_shard_path_and_context():
+    assert shard_path("output/menu_edit.c", 0) == Path("output/menu_edit.c")
+    assert shard_path("output/menu_edit.c", 2) == Path("output/menu_edit_2.c")
+
+    context = ShardContext({"functions": {"a": 1}, "menu": {}}, {"shard": 1, "functions": {}})
+    assert context["functions"] == {} and context["menu"] == {}
+    assert sorted(context) == ["functions", "menu", "shard"]
+    assert len(context) == 3 and "menu" in context
@@ -0,0 +1,42 @@
+"""Unit tests for the deduplicated string pool."""
+
+from types import SimpleNamespace
+
+from generate_menu.string_pool import ROOT_TITLE, StringPool, c_literal, menu_strings
+
+
+def _blob(pool):
+    return b"".join(text.encode("utf-8") + b"\0" for _offset, text in pool.entries)
+
+
+def test_pool_deduplicates_and_shares_suffixes():
+    strings = ["Start", "Off", "On", "Turn On", "Off", "n", "Пауза", "уза"]
+    pool = StringPool(strings)
+    blob = _blob(pool)
+
+    assert [text for _offset, text in pool.entries] == ["Start", "Off", "Turn On", "Пауза"]
+    assert pool.size == len(blob)
+    assert len(pool) == 7 and pool.references == len(strings)
+    for text in strings:
+        offset = pool[text]
+        assert blob[offset:blob.index(b"\0", offset)] == text.encode("utf-8")
+
+    unshared = StringPool(strings, share_suffixes=False)
+    assert len(unshared.entries) == 7
+    assert unshared.size > pool.size
+    assert StringPool(strings) == pool and unshared != pool
+
+
+def test_c_literal_escapes():
+    assert c_literal('Say "hi"\\') == 'Say \\"hi\\"\\\\'
+    assert c_literal("a\nb\x01" + "2") == "a\\nb\\0012"
+    assert c_literal("Пауза") == "Пауза"
+
+
+def test_menu_strings():
+    records = {
+        "start": SimpleNamespace(title="Start", enum="MENU_ID_START", type="string", values=("Start", "Started")),
+        "delay": SimpleNamespace(title="Delay", enum="MENU_ID_DELAY", type="udword", values=None),
+    }
+    assert list(menu_strings(records, False)) == [ROOT_TITLE, "Start", "Delay", "Start", "Started"]
+    assert list(menu_strings(records, True))[-3:] == ["MENU_ID_ROOT", "MENU_ID_START", "MENU_ID_DELAY"]
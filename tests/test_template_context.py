@@ -0,0 +1,86 @@
+"""Unit tests for the lazy, access-tracked template context."""
+
+from jinja2 import DictLoader
+
+from generate_menu.template_context import LazyContext, TrackingEnvironment
+
+
+def _environment(**kwargs):
+    return TrackingEnvironment(loader=DictLoader({
+        "page.txt": "{% for item in items %}{% include 'item.txt' %}{% endfor %}",
+        "item.txt": "{{ prefix }}{{ item }};",
+        "plain.txt": "{{ title }}",
+    }), **kwargs)
+
+
+def test_values_are_computed_on_first_use_only():
+    calls = []
+    context = LazyContext({
+        "items": lambda: calls.append("items") or [1, 2],
+        "prefix": lambda: calls.append("prefix") or "#",
+        "title": lambda: calls.append("title") or "T",
+    })
+    env = _environment()
+
+    with env.tracking("page.txt", context) as access:
+        assert env.get_template("page.txt").render() == "#1;#2;"
+
+    # Included templates resolve from the same lazy context
+    assert access.context_keys == {"items", "prefix"}
+    assert calls == ["items", "prefix"]
+    assert context.computed == {"items", "prefix"}
+
+    with env.tracking("plain.txt", context):
+        env.get_template("plain.txt").render()
+        env.get_template("plain.txt").render()
+    assert calls == ["items", "prefix", "title"]
+
+
+def test_node_attributes_are_tracked_on_request(menu_flattener):
+    nodes = menu_flattener.flatten()
+    context = LazyContext({"nodes": lambda: nodes})
+    env = TrackingEnvironment(track_attributes=True)
+    template = env.from_string("{% for node in nodes %}{{ node.id }}{{ node['name'] }}{% endfor %}")
+
+    with env.tracking("inline", context) as access:
+        template.render()
+    assert access.node_attributes == {"id", "name"}
+
+    env.track_attributes = False
+    with env.tracking("inline", context) as access:
+        template.render()
+    assert access.node_attributes == set()
+
+
+def test_concurrent_renders_keep_their_own_context():
+    """One environment rendering in two threads resolves each render from its own context."""
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+    # The included template resolves its names after both renders have started
+    env = TrackingEnvironment(loader=DictLoader({
+        "pair.txt": "{{ wait() }}{% include 'values.txt' %}",
+        "values.txt": "{{ first }}{{ second }}",
+    }))
+    results = {}
+
+    def wait():
+        # Both renders are in progress here
+        barrier.wait()
+        return ""
+
+    def render(name, first, second):
+        context = LazyContext({"first": lambda: first, "second": lambda: second, "wait": lambda: wait})
+        with env.tracking(name, context) as access:
+            results[name] = env.get_template("pair.txt").render(), access.context_keys
+
+    threads = [threading.Thread(target=render, args=("a", "1", "2")),
+               threading.Thread(target=render, args=("b", "3", "4"))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    keys = {"first", "wait", "second"}
+    assert results == {"a": ("12", keys), "b": ("34", keys)}
+    assert env.access is None and env.context_source is None
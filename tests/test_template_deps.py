@@ -0,0 +1,38 @@
+"""Unit tests for the static template dependency graph."""
+
+from jinja2 import DictLoader, Environment
+
+from generate_menu.template_deps import TemplateDependencyGraph
+
+
+def _graph():
+    env = Environment(loader=DictLoader({
+        "tree.c": "{% for id, item in menu.items() %}{{ item.name }}{{ item.parent.id }}{% endfor %}",
+        "funcs.c": "{% for name, info in functions.items() %}{% include 'body.c' %}{% endfor %}",
+        "body.c": "{{ info.name }}{% include 'tail.c' %}",
+        "tail.c": "{{ info['c_type'] }}{{ include_files }}",
+        "static.h": "#pragma once",
+    }))
+    return TemplateDependencyGraph(env, ["tree.c", "funcs.c", "static.h"])
+
+
+def test_includes_are_folded_into_the_rendered_template():
+    graph = _graph()
+
+    funcs = graph["funcs.c"]
+    assert funcs.includes == ("body.c", "tail.c")
+    assert {"functions", "include_files"} <= funcs.context_keys
+    assert {"name", "c_type"} <= funcs.attributes
+    assert graph["tree.c"].attributes == {"name", "parent"}
+    assert graph["static.h"].context_keys == frozenset()
+
+
+def test_affected_templates():
+    graph = _graph()
+    node_keys = {"menu"}
+
+    # A title change reaches templates reading ``name`` on nodes only
+    assert graph.affected([], {"name"}, node_keys) == ["tree.c"]
+    assert graph.affected([], set(), node_keys) == []
+    assert graph.affected([], None, node_keys) == ["tree.c"]
+    assert graph.affected(["include_files"], set(), node_keys) == ["funcs.c"]
@@ -0,0 +1,41 @@
+"""Unit tests for the block-level template render profiler."""
+
+from jinja2 import DictLoader
+
+from generate_menu.template_context import LazyContext, TrackingEnvironment
+from generate_menu.template_profile import RenderProfiler
+
+TEMPLATES = {
+    "page.c": (
+        "{% set ns = namespace(count=0) %}\n"
+        "{% for row in rows %}\n"
+        "{% for cell in row %}{% set ns.count = ns.count + 1 %}{% endfor %}\n"
+        "{% include 'row.c' %}\n"
+        "{% endfor %}\n"
+        "total={{ ns.count }}\n"
+    ),
+    "row.c": "{{ row | join(',') }};\n",
+}
+
+
+def _render(extensions):
+    env = TrackingEnvironment(loader=DictLoader(TEMPLATES), trim_blocks=True, extensions=extensions)
+    with env.tracking("page.c", LazyContext({"rows": lambda: [[1, 2], [3], []]})):
+        text = env.get_template("page.c").render()
+    return env, text
+
+
+def test_profiled_render_matches_plain_render():
+    assert _render([RenderProfiler])[1] == _render([])[1]
+
+
+def test_blocks_are_timed_and_loops_counted():
+    env, _text = _render([RenderProfiler])
+    blocks = {(block.line, block.kind): block for block in env.extensions[RenderProfiler.identifier].hottest()}
+
+    outer, inner, include = blocks[(2, "for")], blocks[(3, "for")], blocks[(4, "include")]
+    assert (outer.timed, outer.calls, outer.iterations) == (True, 1, 3)
+    assert (inner.timed, inner.calls, inner.iterations) == (False, 0, 3)
+    assert (include.timed, include.calls) == (True, 3)
+    assert include.source == "{% include 'row.c' %}"
+    assert outer.time >= include.time > 0
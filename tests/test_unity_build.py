@@ -0,0 +1,33 @@
+"""Unit tests for the unity build amalgamation."""
+
+from generate_menu.unity_build import amalgamate
+
+FILES = [
+    ("out/include/menu.h", '#include "menu_type.h"\nvoid menu_init(void);\n'),
+    ("out/include/menu_type.h", "typedef int menu_id_t;\n"),
+    ("out/include/menu_draw.h",
+     '#include "menu_type.h"\nvoid menu_draw(menu_id_t id);\nvoid user_draw_cb(menu_id_t id);\n'),
+    ("out/menu.c", '#include "menu.h"\n#include "menu_draw.h"\nvoid menu_init(void) {\n    menu_draw(0);\n}\n'),
+    ("out/menu_draw.c",
+     '#include "menu_draw.h"\n#include <string.h>\n#include "pulse_config.h"\n'
+     'static void helper(void) {\n}\nvoid menu_draw(menu_id_t id) {\n    user_draw_cb(id);\n}\n'),
+]
+
+
+def test_amalgamation():
+    source, header = amalgamate(FILES)
+
+    # Headers in include order, public API and user callbacks kept public
+    assert header.index("typedef int menu_id_t;") < header.index("void menu_init(void);")
+    assert "void user_draw_cb(menu_id_t id);" in header
+    assert "menu_draw(menu_id_t id);" not in header
+    assert '#include "' not in header
+
+    lines = source.splitlines()
+    assert lines[0] == '#include "menu_all.h"'
+    assert "static void menu_draw(menu_id_t id);" in lines
+    assert "static void menu_draw(menu_id_t id) {" in lines
+    assert "void menu_init(void) {" in lines
+    assert "static void helper(void) {" in lines
+    assert '#include "pulse_config.h"' in lines and "#include <string.h>" in lines
+    assert '#include "menu_draw.h"' not in lines